@@ -1,9 +1,15 @@
 import streamlit as st
+from streamlit_app.utils.draft_store import DraftStore
 from streamlit_app.utils.questionnaire import QuestionnaireModel
-from streamlit_app.utils.excel_export import ExcelExportService
+from streamlit_app.utils.result_cache import ResultCache
+from streamlit_app.utils.excel_export import ENGINE_WRITE_ONLY, ExcelExportService, workbook_bytes
+from streamlit_app.utils.template_cache import TemplateCache
 from streamlit_app.utils.translations import get_text
 from datetime import datetime
-import io
+import hashlib
+import json
+import sqlite3
+from html import escape
 
 # Page config
 st.set_page_config(
@@ -96,13 +102,169 @@ if 'results' not in st.session_state:
     st.session_state.results = None
 
 # Initialize models
+@st.cache_resource
+def get_result_cache():
+    return ResultCache(max_entries=256)
+
+
+@st.cache_resource
+def get_draft_store():
+    return DraftStore()
+
+
+# Resume the draft named in the URL (?draft=...) after a reload or an app restart
+if 'draft_id' not in st.session_state:
+    st.session_state.draft_id = None
+    draft_id = st.experimental_get_query_params().get('draft', [None])[0]
+    try:
+        draft = get_draft_store().get(draft_id) if draft_id else None
+    except sqlite3.Error:
+        draft = None  # Drafts unavailable (e.g. read-only disk): start afresh
+    if draft is not None:
+        st.session_state.draft_id = draft_id
+        st.session_state.responses = draft['responses']
+        st.session_state.app_info.update(draft['app_info'])
+        st.session_state.lang = draft['lang']
+        st.session_state.page = 'questionnaire'
+
+
 @st.cache_resource
 def get_questionnaire_model():
-    return QuestionnaireModel()
+    return QuestionnaireModel(result_cache=get_result_cache())
+
+
+@st.cache_resource
+def get_template_cache():
+    return TemplateCache()
+
 
 questionnaire = get_questionnaire_model()
 
 
+@st.cache_resource
+def get_excel_service(bank_version):
+    """Export service of the loaded bank, shared by all sessions"""
+    return ExcelExportService(questionnaire.bank)
+
+
+@st.cache_resource
+def get_card_html(bank_version, lang):
+    """
+    Static HTML of the question and recommendation cards in one language
+
+    Built once per bank version and language, so each card goes out as a
+    single markdown element instead of being assembled on every rerun.
+
+    Returns:
+        {"questions": {question_id: html}, "recommendations": {(question_id, severity): html}}
+    """
+    severities = {
+        'high': ('#ef4444', get_text('results_high', lang)),
+        'medium': ('#f59e0b', get_text('results_medium', lang))
+    }
+    standards_label = get_text('quest_standards', lang)
+
+    questions = {}
+    recommendations = {}
+    for category in questionnaire.bank.categories:
+        category_name = escape(category.name[lang])
+        for idx, question in enumerate(category.questions):
+            text = escape(question.text[lang])
+            tags = "".join(f'<span class="standard-tag">{escape(standard)}</span>' for standard in question.standards)
+
+            questions[question.id] = (
+                f'<div class="question-card"><strong>Q{idx + 1}.</strong> {text}<br>'
+                f'<div style="margin-top: 0.5rem;">{tags}</div></div>'
+            )
+
+            for severity, (color, severity_text) in severities.items():
+                recommendations[(question.id, severity)] = (
+                    f'<div class="question-card">'
+                    f'<span class="risk-badge" style="background: {color}; color: white; font-size: 0.75rem;">'
+                    f'{severity_text}</span>'
+                    f'<strong style="margin-left: 0.5rem;">{category_name}</strong>'
+                    f'<p style="margin: 0.5rem 0;">{text}</p>'
+                    f'<div><span style="font-size: 0.875rem; color: #6b7280;">{standards_label}:</span>{tags}</div>'
+                    f'</div>'
+                )
+
+    return {"questions": questions, "recommendations": recommendations}
+
+
+def results_export_key(results, lang):
+    """Hash of everything the results workbook depends on"""
+    payload = json.dumps(
+        [questionnaire.bank_version, lang, sorted(results['responses'].items()), results['app_info']],
+        separators=(",", ":"),
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_results_workbook(key, lang, _results):
+    """Results workbook bytes, memoized on key (_results is not hashed, key describes it)"""
+    # Scored again in the export language, so the workbook only depends on the key
+    evaluation = questionnaire.evaluate(_results['responses'], lang)
+    wb = get_excel_service(questionnaire.bank_version).create_results_report(
+        _results['responses'],
+        evaluation['score'],
+        evaluation['recommendations'],
+        lang,
+        _results['app_info'],
+        engine=ENGINE_WRITE_ONLY
+    )
+    return workbook_bytes(wb)
+
+
+# Running score of the questionnaire being filled in
+if 'scorer' not in st.session_state:
+    st.session_state.scorer = questionnaire.create_scorer(st.session_state.responses)
+
+
+def reset_responses():
+    """Start a new assessment"""
+    st.session_state.responses = {}
+    st.session_state.scorer = questionnaire.create_scorer()
+    st.session_state.results = None
+    discard_draft()
+
+
+def save_draft(responses=None, app_info=None):
+    """
+    Autosave changed answers and app_info fields
+
+    The first change creates the draft and puts its token in the URL, so a
+    reload resumes it. Later changes are queued by the draft store and
+    written in the background. Autosave is best effort: the answers stay
+    in the session when the draft database cannot be written.
+    """
+    store = get_draft_store()
+    if st.session_state.draft_id is None:
+        try:
+            st.session_state.draft_id = store.create(
+                st.session_state.responses, st.session_state.app_info, st.session_state.lang
+            )
+        except sqlite3.Error:
+            return
+        st.experimental_set_query_params(draft=st.session_state.draft_id)
+    elif responses or app_info:
+        store.update(st.session_state.draft_id, responses=responses, app_info=app_info,
+                     lang=st.session_state.lang)
+
+
+def discard_draft():
+    """Forget the current draft once it is submitted or abandoned"""
+    if st.session_state.draft_id is not None:
+        try:
+            get_draft_store().delete(st.session_state.draft_id)
+        except sqlite3.Error:
+            pass  # Purged later with the other stale drafts
+        st.session_state.draft_id = None
+        st.experimental_set_query_params()
+
+
 def render_header():
     """Render the application header"""
     col1, col2 = st.columns([4, 1])
@@ -133,8 +295,7 @@ def render_home():
     with col1:
         if st.button(f"▶️ {get_text('home_start', st.session_state.lang)}", use_container_width=True):
             st.session_state.page = 'questionnaire'
-            st.session_state.responses = {}
-            st.session_state.results = None
+            reset_responses()
             st.rerun()
 
     with col2:
@@ -195,22 +356,24 @@ def render_home():
 
 def download_template():
     """Generate and download Excel template"""
-    excel_service = ExcelExportService(questionnaire.questions_data)
-    wb = excel_service.create_questionnaire_template(
-        lang=st.session_state.lang,
-        app_name=st.session_state.app_info.get('name', None)
-    )
+    lang = st.session_state.lang
 
-    # Save to BytesIO
-    output = io.BytesIO()
-    wb.save(output)
-    output.seek(0)
+    def render(app_name):
+        excel_service = get_excel_service(questionnaire.bank_version)
+        return workbook_bytes(
+            excel_service.create_questionnaire_template(lang, app_name, engine=ENGINE_WRITE_ONLY)
+        )
+
+    # Rendered once per bank version, language and day; the app name is patched in
+    data = get_template_cache().get(
+        questionnaire.bank_version, lang, st.session_state.app_info.get('name', None), render
+    )
 
     filename = f"security_questionnaire_{st.session_state.lang}_{datetime.now().strftime('%Y%m%d')}.xlsx"
 
     st.download_button(
         label=f"💾 {get_text('home_template', st.session_state.lang)}",
-        data=output.getvalue(),
+        data=data,
         file_name=filename,
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     )
@@ -226,18 +389,14 @@ def render_questionnaire():
 
     st.markdown(f"## {get_text('quest_title', st.session_state.lang)}")
 
-    # Calculate progress
+    # Answers are recorded by the category forms' callbacks, before this run starts
+    progress = render_progress()
     questions_data = questionnaire.get_all_questions(st.session_state.lang)
-    total_questions = sum(len(cat['questions']) for cat in questions_data['categories'])
-    answered_questions = len(st.session_state.responses)
-    progress = (answered_questions / total_questions * 100) if total_questions > 0 else 0
-
-    st.markdown(f"**{get_text('quest_progress', st.session_state.lang)}:** {answered_questions}/{total_questions} ({progress:.0f}%)")
-    st.progress(progress / 100)
 
     st.markdown("<br>", unsafe_allow_html=True)
 
     # Application info
+    saved_app_info = st.session_state.app_info.copy()
     with st.expander(f"📋 {get_text('quest_app_info', st.session_state.lang)}", expanded=True):
         col1, col2 = st.columns(2)
         with col1:
@@ -271,6 +430,13 @@ def render_questionnaire():
             placeholder=get_text('quest_description_placeholder', st.session_state.lang)
         )
 
+    changed_app_info = {
+        field: value for field, value in st.session_state.app_info.items()
+        if saved_app_info.get(field) != value
+    }
+    if changed_app_info:
+        save_draft(app_info=changed_app_info)
+
     st.markdown("<br>", unsafe_allow_html=True)
 
     # Categories tabs
@@ -287,18 +453,19 @@ def render_questionnaire():
     if progress == 100:
         if st.button(f"✅ {get_text('quest_submit', st.session_state.lang)}", use_container_width=True):
             # Calculate results
-            score_data = questionnaire.calculate_score(st.session_state.responses)
-            recommendations = questionnaire.get_recommendations(
+            evaluation = questionnaire.evaluate(
                 st.session_state.responses,
                 st.session_state.lang
             )
 
             st.session_state.results = {
-                'score': score_data,
-                'recommendations': recommendations,
+                'score': evaluation['score'],
+                'recommendations': evaluation['recommendations'],
+                'contributions': evaluation['contributions'],
                 'app_info': st.session_state.app_info.copy(),
                 'responses': st.session_state.responses.copy()
             }
+            discard_draft()
 
             st.session_state.page = 'results'
             st.rerun()
@@ -306,48 +473,91 @@ def render_questionnaire():
         st.warning(get_text('quest_required', st.session_state.lang))
 
 
-def render_category_questions(category):
-    """Render questions for a category"""
+def render_progress():
+    """Render the progress bar and running score, returns the progress percentage"""
     lang = st.session_state.lang
+    scorer = st.session_state.scorer
+
+    answered_questions = scorer.answered_count
+    total_questions = scorer.total_questions
+    progress = (answered_questions / total_questions * 100) if total_questions > 0 else 0
+
+    st.markdown(f"**{get_text('quest_progress', lang)}:** {answered_questions}/{total_questions} ({progress:.0f}%)")
+    st.progress(progress / 100)
 
-    for idx, question in enumerate(category['questions']):
+    if answered_questions:
+        risk_level = scorer.risk_level
         st.markdown(f"""
-        <div class="question-card">
-            <strong>Q{idx + 1}.</strong> {question['text'][lang]}
-            <br>
-            <div style="margin-top: 0.5rem;">
+        <div>
+            <strong>{get_text('quest_live_score', lang)}:</strong> {scorer.percentage:.0f}%
+            <span class="risk-badge" style="background: {risk_level['color']}; color: white; font-size: 0.75rem; margin-left: 0.5rem;">
+                {risk_level[lang]}
+            </span>
+        </div>
         """, unsafe_allow_html=True)
 
-        # Standards tags
-        for standard in question['standard']:
-            st.markdown(f'<span class="standard-tag">{standard}</span>', unsafe_allow_html=True)
+    return progress
+
+
+def save_category_answers(category, lang):
+    """Record the answers of a category form; runs as a callback, before the rerun"""
+    responses = st.session_state.responses
+    scorer = st.session_state.scorer
+    changed = {}
 
-        st.markdown("</div></div>", unsafe_allow_html=True)
+    for question in category['questions']:
+        selected = st.session_state.get(f"question_{question['id']}")
+        if selected is None:
+            continue
+        value = next(opt['value'] for opt in question['options'] if opt['label'][lang] == selected)
+        if responses.get(question['id']) != value:
+            responses[question['id']] = value
+            scorer.set_answer(question['id'], value)
+            changed[question['id']] = value
 
-        # Options
-        options = {opt['label'][lang]: opt['value'] for opt in question['options']}
+    if changed:
+        save_draft(responses=changed)
 
-        # Find current selection
-        current_value = st.session_state.responses.get(question['id'])
-        current_label = None
-        if current_value is not None:
-            for opt in question['options']:
+
+def render_category_questions(category):
+    """
+    Render questions for a category
+
+    The questions of a category form one st.form: choosing an answer does not
+    rerun the script, saving the form records all of its answers at once.
+    """
+    lang = st.session_state.lang
+    cards = get_card_html(questionnaire.bank_version, lang)["questions"]
+
+    with st.form(key=f"category_{category['id']}"):
+        for question in category['questions']:
+            st.markdown(cards[question['id']], unsafe_allow_html=True)
+
+            # Options
+            labels = [opt['label'][lang] for opt in question['options']]
+
+            # Find current selection
+            current_value = st.session_state.responses.get(question['id'])
+            current_index = None
+            for opt_idx, opt in enumerate(question['options']):
                 if opt['value'] == current_value:
-                    current_label = opt['label'][lang]
+                    current_index = opt_idx
                     break
 
-        selected = st.radio(
-            get_text('quest_select', st.session_state.lang),
-            options=list(options.keys()),
-            index=list(options.keys()).index(current_label) if current_label else None,
-            key=f"question_{question['id']}",
-            label_visibility="collapsed"
-        )
-
-        if selected:
-            st.session_state.responses[question['id']] = options[selected]
+            st.radio(
+                get_text('quest_select', st.session_state.lang),
+                options=labels,
+                index=current_index,
+                key=f"question_{question['id']}",
+                label_visibility="collapsed"
+            )
 
-        st.markdown("<br>", unsafe_allow_html=True)
+        st.form_submit_button(
+            f"💾 {get_text('quest_save_category', lang)}",
+            on_click=save_category_answers,
+            args=(category, lang),
+            use_container_width=True
+        )
 
 
 def render_results():
@@ -374,8 +584,7 @@ def render_results():
     with col2:
         if st.button(f"🔄 {get_text('results_new_assessment', lang)}"):
             st.session_state.page = 'questionnaire'
-            st.session_state.responses = {}
-            st.session_state.results = None
+            reset_responses()
             st.rerun()
     with col3:
         download_results_excel()
@@ -455,53 +664,35 @@ def render_results():
     if results['recommendations']:
         st.markdown(f"### {get_text('results_recommendations', lang)}")
 
+        cards = get_card_html(questionnaire.bank_version, lang)["recommendations"]
         for rec in results['recommendations']:
-            severity_color = '#ef4444' if rec['severity'] == 'high' else '#f59e0b'
-            severity_text = get_text('results_high', lang) if rec['severity'] == 'high' else get_text('results_medium', lang)
-
-            st.markdown(f"""
-            <div class="question-card">
-                <span class="risk-badge" style="background: {severity_color}; color: white; font-size: 0.75rem;">
-                    {severity_text}
-                </span>
-                <strong style="margin-left: 0.5rem;">{rec['category']}</strong>
-                <p style="margin: 0.5rem 0;">{rec['question']}</p>
-                <div>
-                    <span style="font-size: 0.875rem; color: #6b7280;">{get_text('quest_standards', lang)}:</span>
-            """, unsafe_allow_html=True)
-
-            for std in rec['standard']:
-                st.markdown(f'<span class="standard-tag">{std}</span>', unsafe_allow_html=True)
-
-            st.markdown("</div></div>", unsafe_allow_html=True)
+            st.markdown(cards[(rec['question_id'], rec['severity'])], unsafe_allow_html=True)
     else:
         st.success(get_text('results_no_recommendations', lang))
 
 
 def download_results_excel():
     """Generate and download results Excel"""
-    if st.session_state.results is None:
+    results = st.session_state.results
+    if results is None:
         return
 
-    excel_service = ExcelExportService(questionnaire.questions_data)
-    wb = excel_service.create_results_report(
-        st.session_state.results['responses'],
-        st.session_state.results['score'],
-        st.session_state.results['recommendations'],
-        st.session_state.lang,
-        st.session_state.results['app_info']
-    )
+    lang = st.session_state.lang
+    key = results_export_key(results, lang)
 
-    output = io.BytesIO()
-    wb.save(output)
-    output.seek(0)
+    # Built on the first click only, then served from the cache on every rerun
+    slot = st.empty()
+    if st.session_state.get('results_export') != key:
+        if not slot.button(f"📥 {get_text('results_export', lang)}", key="results_export_prepare"):
+            return
+        st.session_state.results_export = key
 
-    app_name = st.session_state.results['app_info'].get('name', 'application')
+    app_name = results['app_info'].get('name', 'application')
     filename = f"security_assessment_{app_name}_{datetime.now().strftime('%Y%m%d')}.xlsx"
 
-    st.download_button(
-        label=f"📥 {get_text('results_export', st.session_state.lang)}",
-        data=output.getvalue(),
+    slot.download_button(
+        label=f"💾 {get_text('results_export', lang)}",
+        data=build_results_workbook(key, lang, results),
         file_name=filename,
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     )
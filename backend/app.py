@@ -1,6 +1,6 @@
 from flask import Flask
 from flask_cors import CORS
-from routes.api import api
+from routes.api import api, bank
 import os
 
 app = Flask(__name__)
@@ -9,7 +9,7 @@ app = Flask(__name__)
 CORS(app, resources={
     r"/api/*": {
         "origins": ["http://localhost:3000", "http://localhost:5000"],
-        "methods": ["GET", "POST", "OPTIONS"],
+        "methods": ["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
         "allow_headers": ["Content-Type"]
     }
 })
@@ -17,6 +17,9 @@ CORS(app, resources={
 # Register blueprints
 app.register_blueprint(api, url_prefix='/api')
 
+# Pick up questions.json edits without a restart
+bank.start()
+
 
 @app.route('/')
 def index():
@@ -27,9 +30,17 @@ def index():
             "health": "/api/health",
             "questions": "/api/questions",
             "submit": "/api/submit",
+            "submit_batch": "/api/submit/batch",
             "export_template": "/api/export/template",
             "export_results": "/api/export/results",
-            "stats": "/api/stats"
+            "export_portfolio": "/api/export/portfolio",
+            "export_jobs": "/api/export/jobs",
+            "import": "/api/import",
+            "import_bulk": "/api/import/bulk",
+            "drafts": "/api/drafts",
+            "assessments": "/api/assessments",
+            "stats": "/api/stats",
+            "cache_stats": "/api/stats/cache"
         }
     }
 
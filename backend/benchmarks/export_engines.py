@@ -0,0 +1,72 @@
+"""
+Rendering time of the Excel exports per engine
+
+Times building and saving a workbook with each rendering engine, the median
+of a few runs. The default scale gives a detailed results sheet of about
+10,000 question rows.
+
+Usage (from backend/):
+    python -m benchmarks.export_engines --scale 257 --repeat 3
+"""
+import argparse
+import os
+import statistics
+import time
+
+from benchmarks.export_memory import scaled_bank_path
+from models.questionnaire import QuestionnaireModel
+from services.excel_export import ENGINE_OPENPYXL, ENGINES, ExcelExportService, workbook_bytes
+
+
+def _time_export(service: ExcelExportService, model: QuestionnaireModel, kind: str, engine: str,
+                 repeat: int):
+    responses = {
+        question.id: question.options[-1].value
+        for _, question in model.bank.iter_questions()
+    }
+    evaluation = model.evaluate(responses, 'en')
+
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        if kind == 'template':
+            wb = service.create_questionnaire_template('en', 'Benchmark', engine=engine)
+        else:
+            wb = service.create_results_report(
+                responses, evaluation['score'], evaluation['recommendations'], 'en', {'name': 'Benchmark'},
+                engine=engine
+            )
+        size = len(workbook_bytes(wb))
+        timings.append(time.perf_counter() - started)
+
+    return size, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scale', type=int, default=257, help="Repeat the bank categories this many times")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per engine")
+    args = parser.parse_args()
+
+    data_path = scaled_bank_path(args.scale)
+    try:
+        model = QuestionnaireModel(data_path=data_path, use_artifact=False)
+        service = ExcelExportService(model.bank)
+        rows = sum(1 for _ in model.bank.iter_questions())
+
+        print(f"scale={args.scale} questions={rows} repeat={args.repeat}")
+        print(f"{'export':<10}{'engine':<12}{'size KiB':>10}{'seconds':>9}{'speedup':>9}")
+        for kind in ('template', 'results'):
+            baseline = None
+            for engine in ENGINES:
+                size, elapsed = _time_export(service, model, kind, engine, args.repeat)
+                if engine == ENGINE_OPENPYXL:
+                    baseline = elapsed
+                print(f"{kind:<10}{engine:<12}{size / 1024:>10.0f}{elapsed:>9.2f}{baseline / elapsed:>8.1f}x")
+    finally:
+        os.unlink(data_path)
+
+
+if __name__ == '__main__':
+    main()
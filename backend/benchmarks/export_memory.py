@@ -0,0 +1,128 @@
+"""
+Peak RSS of a single Excel export per rendering backend and output strategy
+
+Every export runs in a fresh process. Besides the process peak RSS, the
+Python heap peak of the export itself (build, save and send, after the bank
+is loaded) is traced with tracemalloc, since loading a large bank can set the
+RSS high-water mark on its own. The bank can be scaled up by repeating its
+categories to get realistic sizes.
+
+Usage (from backend/):
+    python -m benchmarks.export_memory --scale 100
+"""
+import argparse
+import io
+import json
+import os
+import resource
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from models.questionnaire import QuestionnaireModel
+from services.excel_export import (ENGINE_NATIVE, ENGINE_OPENPYXL, ENGINE_WRITE_ONLY, SPOOL_MAX_MEMORY,
+                                   ExcelExportService, spool_workbook)
+
+CHUNK_SIZE = 64 * 1024
+
+
+def scaled_bank_path(scale: int) -> str:
+    """Write questions.json with its categories repeated scale times"""
+    with open(QuestionnaireModel.DEFAULT_DATA_PATH, encoding='utf-8') as f:
+        data = json.load(f)
+
+    categories = []
+    for copy in range(scale):
+        for category in data['categories']:
+            category_id = f"{category['id']}_{copy}"
+            categories.append({
+                **category,
+                'id': category_id,
+                'questions': [
+                    {**question, 'id': f"{question['id']}_{copy}", 'category': category_id}
+                    for question in category['questions']
+                ]
+            })
+
+    fd, path = tempfile.mkstemp(suffix='.json')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump({'categories': categories}, f)
+    return path
+
+
+def _max_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _run_export(data_path: str, kind: str, engine: str, strategy: str):
+    model = QuestionnaireModel(data_path=data_path, use_artifact=False)
+    service = ExcelExportService(model.bank)
+    responses = {
+        question.id: question.options[-1].value
+        for _, question in model.bank.iter_questions()
+    }
+
+    tracemalloc.start()
+    started = time.perf_counter()
+
+    if kind == 'template':
+        wb = service.create_questionnaire_template('en', 'Benchmark', engine=engine)
+    else:
+        evaluation = model.evaluate(responses, 'en')
+        wb = service.create_results_report(
+            responses, evaluation['score'], evaluation['recommendations'], 'en', {'name': 'Benchmark'},
+            engine=engine
+        )
+
+    size = 0
+
+    if strategy == 'buffered':
+        # Previous behaviour: BytesIO, then a getvalue() copy handed to the client
+        output = io.BytesIO()
+        wb.save(output)
+        output.seek(0)
+        data = output.getvalue()
+        for offset in range(0, len(data), CHUNK_SIZE):
+            size += len(data[offset:offset + CHUNK_SIZE])
+    else:
+        with spool_workbook(wb) as spool:
+            for chunk in iter(lambda: spool.read(CHUNK_SIZE), b''):
+                size += len(chunk)
+
+    elapsed = time.perf_counter() - started
+    del wb
+    heap_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return size, elapsed, heap_peak, _max_rss_kb()
+
+
+def measure(data_path: str, kind: str, engine: str, strategy: str):
+    """(output bytes, seconds, export heap peak bytes, process peak RSS KiB) of one export"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_run_export, data_path, kind, engine, strategy).result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scale', type=int, default=1, help="Repeat the bank categories this many times")
+    args = parser.parse_args()
+
+    data_path = scaled_bank_path(args.scale)
+    try:
+        print(f"scale={args.scale} spool threshold={SPOOL_MAX_MEMORY // 1024} KiB")
+        print(f"{'export':<10}{'backend':<12}{'strategy':<10}{'size KiB':>10}{'seconds':>9}"
+              f"{'export heap MiB':>17}{'peak RSS MiB':>14}")
+        for kind in ('template', 'results'):
+            for engine, strategy in ((ENGINE_OPENPYXL, 'buffered'), (ENGINE_OPENPYXL, 'spooled'),
+                                     (ENGINE_WRITE_ONLY, 'spooled'), (ENGINE_NATIVE, 'spooled')):
+                size, elapsed, heap_peak, peak_rss = measure(data_path, kind, engine, strategy)
+                print(f"{kind:<10}{engine:<12}{strategy:<10}{size / 1024:>10.0f}{elapsed:>9.2f}"
+                      f"{heap_peak / 2 ** 20:>17.1f}{peak_rss / 1024:>14.1f}")
+    finally:
+        os.unlink(data_path)
+
+
+if __name__ == '__main__':
+    main()
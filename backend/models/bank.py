@@ -0,0 +1,210 @@
+"""
+Compact, immutable domain objects for the question bank
+
+The bank is built once from questions.json into __slots__ objects: attribute
+access in the scoring and export loops instead of string-keyed dict lookups,
+no per-instance __dict__, option values packed in arrays and repeated
+strings (option labels, standards) shared. The JSON-shaped dict served by the
+API is rebuilt from these objects on demand with QuestionBank.to_dict().
+"""
+from array import array
+from typing import Dict, Iterator, Optional, Tuple
+
+LANGUAGES = ("fr", "en")
+
+
+class _Frozen:
+    """Base for immutable __slots__ objects; attributes are set once in __init__"""
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _init(self, **attributes):
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+
+class LocalizedText(_Frozen):
+    """A string in every supported language; text[lang] works like the JSON dict"""
+    __slots__ = LANGUAGES
+
+    def __init__(self, fr: str, en: str):
+        self._init(fr=fr, en=en)
+
+    def __getitem__(self, lang: str) -> str:
+        if lang not in LANGUAGES:
+            raise KeyError(lang)
+        return getattr(self, lang)
+
+    def get(self, lang: str, default: Optional[str] = None) -> Optional[str]:
+        return getattr(self, lang, default) if lang in LANGUAGES else default
+
+    def to_dict(self, lang: Optional[str] = None) -> Dict[str, str]:
+        """Both languages, or only lang when given"""
+        if lang is not None:
+            return {lang: self[lang]}
+        return {"fr": self.fr, "en": self.en}
+
+    def __eq__(self, other):
+        return isinstance(other, LocalizedText) and self.fr == other.fr and self.en == other.en
+
+    def __hash__(self):
+        return hash((self.fr, self.en))
+
+    def __reduce__(self):
+        return LocalizedText, (self.fr, self.en)
+
+    def __repr__(self):
+        return f"LocalizedText(fr={self.fr!r}, en={self.en!r})"
+
+
+class Option(_Frozen):
+    """One possible answer to a question"""
+    __slots__ = ("value", "label")
+
+    def __init__(self, value, label: LocalizedText):
+        self._init(value=value, label=label)
+
+    def to_dict(self, lang: Optional[str] = None) -> Dict:
+        return {"value": self.value, "label": self.label.to_dict(lang)}
+
+    def __reduce__(self):
+        return Option, (self.value, self.label)
+
+    def __repr__(self):
+        return f"Option({self.value!r}, {self.label!r})"
+
+
+class Question(_Frozen):
+    """A question; option values are also kept in a compact array for scoring"""
+    __slots__ = ("id", "text", "category_id", "weight", "standards", "options", "option_values", "max_value")
+
+    def __init__(self, id: str, text: LocalizedText, category_id: str, weight,
+                 standards: Tuple[str, ...], options: Tuple[Option, ...]):
+        values = [option.value for option in options]
+        typecode = "q" if all(isinstance(value, int) for value in values) else "d"
+        self._init(
+            id=id,
+            text=text,
+            category_id=category_id,
+            weight=weight,
+            standards=standards,
+            options=options,
+            option_values=array(typecode, values),
+            max_value=max(values)
+        )
+
+    def option_for_value(self, value) -> Optional[Option]:
+        """Option matching a submitted value, if any"""
+        for option in self.options:
+            if option.value == value:
+                return option
+        return None
+
+    def to_dict(self, lang: Optional[str] = None) -> Dict:
+        return {
+            "id": self.id,
+            "text": self.text.to_dict(lang),
+            "category": self.category_id,
+            "weight": self.weight,
+            "standard": list(self.standards),
+            "options": [option.to_dict(lang) for option in self.options]
+        }
+
+    def __reduce__(self):
+        return Question, (self.id, self.text, self.category_id, self.weight, self.standards, self.options)
+
+    def __repr__(self):
+        return f"Question({self.id!r})"
+
+
+class Category(_Frozen):
+    """A group of questions"""
+    __slots__ = ("id", "name", "weight", "questions")
+
+    def __init__(self, id: str, name: LocalizedText, weight, questions: Tuple[Question, ...]):
+        self._init(id=id, name=name, weight=weight, questions=questions)
+
+    def to_dict(self, lang: Optional[str] = None) -> Dict:
+        return {
+            "id": self.id,
+            "name": self.name.to_dict(lang),
+            "weight": self.weight,
+            "questions": [question.to_dict(lang) for question in self.questions]
+        }
+
+    def __reduce__(self):
+        return Category, (self.id, self.name, self.weight, self.questions)
+
+    def __repr__(self):
+        return f"Category({self.id!r})"
+
+
+class QuestionBank(_Frozen):
+    """The whole question bank, in questions.json order, with id indexes"""
+    __slots__ = ("categories", "category_index", "question_index")
+
+    def __init__(self, categories: Tuple[Category, ...]):
+        self._init(
+            categories=categories,
+            category_index={category.id: category for category in categories},
+            question_index={question.id: question for category in categories for question in category.questions}
+        )
+
+    @classmethod
+    def from_dict(cls, questions_data: Dict) -> "QuestionBank":
+        """Build the bank from the parsed questions.json"""
+        # Identical strings and texts are shared across the bank
+        strings = {}
+        texts = {}
+
+        def intern(value: str) -> str:
+            return strings.setdefault(value, value)
+
+        def localized(text: Dict[str, str]) -> LocalizedText:
+            key = (text["fr"], text["en"])
+            if key not in texts:
+                texts[key] = LocalizedText(intern(text["fr"]), intern(text["en"]))
+            return texts[key]
+
+        categories = []
+        for category in questions_data["categories"]:
+            questions = tuple(
+                Question(
+                    id=question["id"],
+                    text=localized(question["text"]),
+                    category_id=intern(question.get("category", category["id"])),
+                    weight=question["weight"],
+                    standards=tuple(intern(standard) for standard in question["standard"]),
+                    options=tuple(
+                        Option(option["value"], localized(option["label"]))
+                        for option in question["options"]
+                    )
+                )
+                for question in category["questions"]
+            )
+            categories.append(Category(category["id"], localized(category["name"]), category["weight"], questions))
+
+        return cls(tuple(categories))
+
+    def iter_questions(self) -> Iterator[Tuple[Category, Question]]:
+        """Every (category, question) pair in bank order"""
+        for category in self.categories:
+            for question in category.questions:
+                yield category, question
+
+    def to_dict(self, lang: Optional[str] = None) -> Dict:
+        """
+        JSON-shaped view in the questions.json layout
+
+        With lang, every localized text only carries that language, e.g.
+        {"name": {"en": "..."}}, so clients reading text[lang] keep working.
+        """
+        return {"categories": [category.to_dict(lang) for category in self.categories]}
+
+    def __reduce__(self):
+        return QuestionBank, (self.categories,)
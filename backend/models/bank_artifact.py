@@ -0,0 +1,131 @@
+"""
+Precompiled question bank artifacts
+
+A bank artifact holds the QuestionBank built from questions.json together
+with everything QuestionnaireModel derives from it (compiled scoring plan,
+indexes), so a worker can start without parsing JSON or rebuilding indexes.
+The artifact records the SHA-256 of the questions.json it was built from
+and is ignored when that file changed, or when its own payload checksum does
+not match.
+
+Compile with:
+    python -m models.bank_artifact [path/to/questions.json ...]
+"""
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+ARTIFACT_SUFFIX = ".qbank"
+ARTIFACT_MAGIC = b"QBANK"
+# Bump whenever the pickled payload layout or the classes in it change
+ARTIFACT_FORMAT_VERSION = 2
+
+_DIGEST_SIZE = 32
+
+
+def artifact_path_for(data_path: Path) -> Path:
+    """Default artifact location, next to the JSON source"""
+    return Path(data_path).with_suffix(ARTIFACT_SUFFIX)
+
+
+def read_artifact(artifact_path: Path, source_digest: bytes) -> Optional[Dict]:
+    """
+    Load an artifact payload if it is current
+
+    Args:
+        artifact_path: Artifact file to read
+        source_digest: SHA-256 digest of the questions.json being loaded
+
+    Returns:
+        The payload dict, or None when the artifact is missing, stale,
+        corrupted or from another format version
+    """
+    try:
+        with open(artifact_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    header_size = len(ARTIFACT_MAGIC) + 1 + 2 * _DIGEST_SIZE
+    if len(data) < header_size or not data.startswith(ARTIFACT_MAGIC):
+        return None
+
+    offset = len(ARTIFACT_MAGIC)
+    if data[offset] != ARTIFACT_FORMAT_VERSION:
+        return None
+    offset += 1
+
+    if data[offset:offset + _DIGEST_SIZE] != source_digest:
+        return None
+    offset += _DIGEST_SIZE
+
+    payload_digest = data[offset:offset + _DIGEST_SIZE]
+    payload = memoryview(data)[header_size:]
+    if hashlib.sha256(payload).digest() != payload_digest:
+        return None
+
+    try:
+        return pickle.loads(payload)
+    except Exception:
+        return None
+
+
+def write_artifact(artifact_path: Path, source_digest: bytes, payload: Dict) -> bool:
+    """
+    Atomically write an artifact; failures (e.g. read-only deploys) are not fatal
+
+    Returns:
+        True if the artifact was written
+    """
+    artifact_path = Path(artifact_path)
+    body = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    header = (
+        ARTIFACT_MAGIC
+        + bytes([ARTIFACT_FORMAT_VERSION])
+        + source_digest
+        + hashlib.sha256(body).digest()
+    )
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=artifact_path.parent, prefix=artifact_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header)
+                f.write(body)
+            os.replace(tmp_path, artifact_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        return False
+
+    return True
+
+
+def compile_artifact(data_path: Path, artifact_path: Optional[Path] = None) -> Path:
+    """Build the artifact for a questions.json, overwriting any existing one"""
+    from .questionnaire import QuestionnaireModel
+
+    artifact_path = Path(artifact_path) if artifact_path else artifact_path_for(data_path)
+    model = QuestionnaireModel(data_path=data_path, use_artifact=False)
+    if not write_artifact(artifact_path, model.bank_digest, model.artifact_payload()):
+        raise OSError(f"Could not write {artifact_path}")
+    return artifact_path
+
+
+def main(argv=None) -> int:
+    from .questionnaire import QuestionnaireModel
+
+    paths = (argv if argv is not None else sys.argv[1:]) or [QuestionnaireModel.DEFAULT_DATA_PATH]
+    for path in paths:
+        artifact_path = compile_artifact(Path(path))
+        print(f"{path} -> {artifact_path} ({artifact_path.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,27 +1,217 @@
+import hashlib
 import json
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .bank import Question, QuestionBank
+from .bank_artifact import artifact_path_for, read_artifact, write_artifact
+from .result_cache import ResultCache
+
+# Ordered from best to worst, see _risk_level_index
+RISK_LEVELS = (
+    {
+        "level": "LOW",
+        "fr": "Risque Faible",
+        "en": "Low Risk",
+        "color": "#10b981"  # Green
+    },
+    {
+        "level": "MEDIUM",
+        "fr": "Risque Modéré",
+        "en": "Medium Risk",
+        "color": "#f59e0b"  # Orange
+    },
+    {
+        "level": "HIGH",
+        "fr": "Risque Élevé",
+        "en": "High Risk",
+        "color": "#ef4444"  # Red
+    },
+    {
+        "level": "CRITICAL",
+        "fr": "Risque Critique",
+        "en": "Critical Risk",
+        "color": "#dc2626"  # Dark red
+    },
+)
+
+# Ordered from most to least demanding, see _audit_recommendation_index
+AUDIT_RECOMMENDATIONS = (
+    {
+        "recommendation": "FULL_AUDIT_REQUIRED",
+        "fr": "Audit Complet Requis",
+        "en": "Full Audit Required",
+        "priority": "HIGH"
+    },
+    {
+        "recommendation": "TARGETED_AUDIT_RECOMMENDED",
+        "fr": "Audit Ciblé Recommandé",
+        "en": "Targeted Audit Recommended",
+        "priority": "MEDIUM"
+    },
+    {
+        "recommendation": "LIGHT_REVIEW",
+        "fr": "Revue Légère Suffisante",
+        "en": "Light Review Sufficient",
+        "priority": "LOW"
+    },
+)
+
+
+def _risk_level_index(percentage: float) -> int:
+    """Index into RISK_LEVELS for an overall score percentage"""
+    if percentage >= 80:
+        return 0
+    elif percentage >= 60:
+        return 1
+    elif percentage >= 40:
+        return 2
+    return 3
+
+
+def _audit_recommendation_index(percentage: float, critical_count: int) -> int:
+    """Index into AUDIT_RECOMMENDATIONS given the number of categories below 50%"""
+    if percentage < 50 or critical_count >= 3:
+        return 0
+    elif percentage < 70 or critical_count >= 1:
+        return 1
+    return 2
+
+
+class ScoringPlan:
+    """
+    Flat, precomputed view of a question bank used by the scoring paths
+
+    Built once when the bank is loaded so that scoring only has to walk the
+    submitted responses instead of every category and question of the bank.
+    Every per-question array is indexed by the question's slot, which follows
+    the bank order (categories first, then questions).
+    """
+
+    def __init__(self, bank: QuestionBank):
+        categories = bank.categories
+
+        question_ids = []
+        questions = []
+        weights = []
+        max_values = []
+        category_indices = []
+        category_max_scores = [0] * len(categories)
+
+        for category_idx, category in enumerate(categories):
+            for question in category.questions:
+                question_ids.append(question.id)
+                questions.append(question)
+                weights.append(question.weight)
+                max_values.append(question.max_value)
+                category_indices.append(category_idx)
+                category_max_scores[category_idx] += question.max_value * question.weight
+
+        self.categories = tuple(categories)
+        self.category_ids = tuple(category.id for category in categories)
+        self.category_weights = tuple(category.weight for category in categories)
+        self.category_max_scores = tuple(category_max_scores)
+        self.total_max_score = sum(category_max_scores)
+
+        self.question_ids = tuple(question_ids)
+        self.questions = tuple(questions)
+        self.weights = tuple(weights)
+        self.max_values = tuple(max_values)
+        self.category_indices = tuple(category_indices)
+        # A question is flagged for recommendation below half its max value
+        self.recommendation_thresholds = tuple(value * 0.5 for value in max_values)
+
+        # question_id -> slot in the arrays above
+        self.question_slots = {question_id: slot for slot, question_id in enumerate(question_ids)}
+
+    def answered_slots(self, responses: Dict[str, int]) -> List[int]:
+        """Return the slots of the known questions in responses, in bank order"""
+        question_slots = self.question_slots
+        return sorted(
+            question_slots[question_id]
+            for question_id in responses
+            if question_id in question_slots
+        )
 
 
 class QuestionnaireModel:
-    def __init__(self):
-        self.data_path = Path(__file__).parent.parent / "data" / "questions.json"
-        self.questions_data = self._load_questions()
+    DEFAULT_DATA_PATH = Path(__file__).parent.parent / "data" / "questions.json"
+
+    def __init__(self, result_cache: Optional[ResultCache] = None, data_path: Optional[Path] = None,
+                 use_artifact: bool = True):
+        self.data_path = Path(data_path) if data_path else self.DEFAULT_DATA_PATH
+        self.artifact_path = artifact_path_for(self.data_path)
+        self.result_cache = result_cache
+        self._questions_data = None
+        self._projections = {}
+        self._load_questions(use_artifact)
+
+    def _load_questions(self, use_artifact: bool = True):
+        """
+        Load the bank and its compiled structures
+
+        Uses the precompiled artifact when it matches questions.json, and
+        otherwise parses the JSON and refreshes the artifact for the next start.
+        """
+        with open(self.data_path, 'rb') as f:
+            raw = f.read()
+
+        # Content hash of the bank, used to key anything derived from it
+        self.bank_digest = hashlib.sha256(raw).digest()
+        self.bank_version = self.bank_digest.hex()[:16]
+
+        payload = read_artifact(self.artifact_path, self.bank_digest) if use_artifact else None
+        if payload is not None:
+            self.bank = payload["bank"]
+            self.scoring_plan = payload["scoring_plan"]
+            return
 
-    def _load_questions(self) -> Dict:
-        with open(self.data_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        self.bank = QuestionBank.from_dict(json.loads(raw.decode('utf-8')))
+        self.scoring_plan = ScoringPlan(self.bank)
+
+        if use_artifact:
+            write_artifact(self.artifact_path, self.bank_digest, self.artifact_payload())
+
+    def artifact_payload(self) -> Dict:
+        """Compiled state stored in the bank artifact"""
+        return {
+            "bank": self.bank,
+            "scoring_plan": self.scoring_plan
+        }
+
+    @property
+    def questions_data(self) -> Dict:
+        """JSON-shaped view of the bank, built on first use"""
+        if self._questions_data is None:
+            self._questions_data = self.bank.to_dict()
+        return self._questions_data
 
     def get_all_questions(self, lang: str = "fr") -> Dict:
-        """Return all questions in the specified language"""
-        return self.questions_data
+        """Return all questions in the specified language (built once per language)"""
+        return self._projection(lang)[0]
 
     def get_category(self, category_id: str, lang: str = "fr") -> Optional[Dict]:
-        """Get a specific category by ID"""
-        for category in self.questions_data["categories"]:
-            if category["id"] == category_id:
-                return category
-        return None
+        """Get a specific category by ID, in the specified language"""
+        if category_id not in self.bank.category_index:
+            return None
+        return self._projection(lang)[1][category_id]
+
+    def get_question(self, question_id: str) -> Optional[Question]:
+        """Get a specific question by ID"""
+        return self.bank.question_index.get(question_id)
+
+    def _projection(self, lang: str) -> Tuple[Dict, Dict[str, Dict]]:
+        """Language-projected bank dict and its categories by id, cached per language"""
+        projection = self._projections.get(lang)
+        if projection is None:
+            questions_data = self.bank.to_dict(lang)
+            categories = {category["id"]: category for category in questions_data["categories"]}
+            # Concurrent first calls may both build it; either result is fine
+            projection = self._projections[lang] = (questions_data, categories)
+        return projection
 
     def calculate_score(self, responses: Dict[str, int]) -> Dict:
         """
@@ -33,27 +223,28 @@ class QuestionnaireModel:
         Returns:
             Dict containing total score, category scores, and risk level
         """
-        category_scores = {}
-        total_score = 0
-        total_max_score = 0
+        plan = self.scoring_plan
+        question_slots = plan.question_slots
+        weights = plan.weights
+        category_indices = plan.category_indices
 
-        for category in self.questions_data["categories"]:
-            category_id = category["id"]
-            category_score = 0
-            category_max_score = 0
+        # Single pass over the submitted responses
+        category_totals = [0] * len(plan.category_ids)
+        for question_id, user_value in responses.items():
+            slot = question_slots.get(question_id)
+            if slot is not None:
+                category_totals[category_indices[slot]] += user_value * weights[slot]
 
-            for question in category["questions"]:
-                question_id = question["id"]
-                question_weight = question["weight"]
+        return self._build_score(category_totals)
 
-                # Get max possible score for this question
-                max_option_value = max(opt["value"] for opt in question["options"])
-                category_max_score += max_option_value * question_weight
+    def _build_score(self, category_totals: List[int]) -> Dict:
+        """Build the score dict from the per-category totals of a scoring pass"""
+        plan = self.scoring_plan
 
-                # Get user's response
-                if question_id in responses:
-                    user_value = responses[question_id]
-                    category_score += user_value * question_weight
+        category_scores = {}
+        for category_idx, category_id in enumerate(plan.category_ids):
+            category_score = category_totals[category_idx]
+            category_max_score = plan.category_max_scores[category_idx]
 
             # Calculate category percentage
             category_percentage = (category_score / category_max_score * 100) if category_max_score > 0 else 0
@@ -62,11 +253,11 @@ class QuestionnaireModel:
                 "score": category_score,
                 "max_score": category_max_score,
                 "percentage": round(category_percentage, 2),
-                "weight": category["weight"]
+                "weight": plan.category_weights[category_idx]
             }
 
-            total_score += category_score
-            total_max_score += category_max_score
+        total_score = sum(category_totals)
+        total_max_score = plan.total_max_score
 
         # Calculate overall percentage
         overall_percentage = (total_score / total_max_score * 100) if total_max_score > 0 else 0
@@ -86,90 +277,415 @@ class QuestionnaireModel:
             "category_scores": category_scores
         }
 
+    def evaluate(self, responses: Dict[str, int], lang: str = "fr") -> Dict:
+        """
+        Score responses and build recommendations in a single traversal
+
+        Args:
+            responses: Dict mapping question_id to selected value
+            lang: Language code used for recommendation texts
+
+        Returns:
+            Dict with "score" (as calculate_score), "recommendations" (as
+            get_recommendations) and "contributions", the per-question
+            breakdown in bank order. Unanswered questions have a None value
+            and lose all their points. With a result cache, the returned dict
+            may be shared with other callers and must not be mutated.
+        """
+        if self.result_cache is not None:
+            return self.result_cache.get_or_compute(
+                self.bank_version, responses, lang,
+                lambda: self._evaluate(responses, lang)
+            )
+        return self._evaluate(responses, lang)
+
+    def _evaluate(self, responses: Dict[str, int], lang: str) -> Dict:
+        """Uncached single traversal behind evaluate()"""
+        plan = self.scoring_plan
+        total_max_score = plan.total_max_score
+        category_totals = [0] * len(plan.category_ids)
+        recommendations = []
+        contributions = []
+
+        for slot, question in enumerate(plan.questions):
+            category_idx = plan.category_indices[slot]
+            weight = plan.weights[slot]
+            max_score = plan.max_values[slot] * weight
+            user_value = responses.get(question.id)
+
+            if user_value is None:
+                score = 0
+            else:
+                score = user_value * weight
+                category_totals[category_idx] += score
+
+                # If user scored less than 50% on this question
+                if user_value < plan.recommendation_thresholds[slot]:
+                    recommendations.append({
+                        "question_id": question.id,
+                        "category": plan.categories[category_idx].name[lang],
+                        "question": question.text[lang],
+                        "standard": list(question.standards),
+                        "severity": "high" if user_value == 0 else "medium"
+                    })
+
+            contributions.append({
+                "question_id": question.id,
+                "category_id": plan.category_ids[category_idx],
+                "value": user_value,
+                "score": score,
+                "max_score": max_score,
+                "lost_points": max_score - score,
+                # Share of the overall percentage brought by this question
+                "contribution": round(score / total_max_score * 100, 2) if total_max_score > 0 else 0
+            })
+
+        return {
+            "score": self._build_score(category_totals),
+            "recommendations": recommendations,
+            "contributions": contributions
+        }
+
     def _determine_risk_level(self, percentage: float) -> Dict[str, str]:
         """Determine risk level based on overall score percentage"""
-        if percentage >= 80:
-            return {
-                "level": "LOW",
-                "fr": "Risque Faible",
-                "en": "Low Risk",
-                "color": "#10b981"  # Green
-            }
-        elif percentage >= 60:
-            return {
-                "level": "MEDIUM",
-                "fr": "Risque Modéré",
-                "en": "Medium Risk",
-                "color": "#f59e0b"  # Orange
-            }
-        elif percentage >= 40:
-            return {
-                "level": "HIGH",
-                "fr": "Risque Élevé",
-                "en": "High Risk",
-                "color": "#ef4444"  # Red
-            }
-        else:
-            return {
-                "level": "CRITICAL",
-                "fr": "Risque Critique",
-                "en": "Critical Risk",
-                "color": "#dc2626"  # Dark red
-            }
+        return dict(RISK_LEVELS[_risk_level_index(percentage)])
 
     def _determine_audit_recommendation(self, percentage: float, category_scores: Dict) -> Dict[str, str]:
         """Determine if a full audit is recommended"""
-        critical_categories = []
-
         # Check for critical categories (< 50%)
-        for cat_id, scores in category_scores.items():
-            if scores["percentage"] < 50:
-                critical_categories.append(cat_id)
-
-        if percentage < 50 or len(critical_categories) >= 3:
-            return {
-                "recommendation": "FULL_AUDIT_REQUIRED",
-                "fr": "Audit Complet Requis",
-                "en": "Full Audit Required",
-                "priority": "HIGH"
-            }
-        elif percentage < 70 or len(critical_categories) >= 1:
-            return {
-                "recommendation": "TARGETED_AUDIT_RECOMMENDED",
-                "fr": "Audit Ciblé Recommandé",
-                "en": "Targeted Audit Recommended",
-                "priority": "MEDIUM"
-            }
-        else:
-            return {
-                "recommendation": "LIGHT_REVIEW",
-                "fr": "Revue Légère Suffisante",
-                "en": "Light Review Sufficient",
-                "priority": "LOW"
-            }
+        critical_count = sum(1 for scores in category_scores.values() if scores["percentage"] < 50)
+
+        return dict(AUDIT_RECOMMENDATIONS[_audit_recommendation_index(percentage, critical_count)])
+
+    def create_scorer(self, responses: Optional[Dict[str, int]] = None) -> "IncrementalScorer":
+        """Create an incremental scorer over this bank, optionally seeded with responses"""
+        return IncrementalScorer(self.scoring_plan, responses)
+
+    def calculate_scores_batch(self, responses_list: List[Dict[str, int]]) -> List[Dict]:
+        """
+        Calculate security scores for many assessments at once
+
+        Args:
+            responses_list: One responses dict (question_id -> value) per assessment
+
+        Returns:
+            List of score dicts, in input order, identical to calculate_score output
+        """
+        return calculate_scores_batch(self.scoring_plan, responses_list)
 
     def get_recommendations(self, responses: Dict[str, int], lang: str = "fr") -> List[Dict]:
         """
         Generate specific recommendations based on low-scoring areas
         """
+        plan = self.scoring_plan
         recommendations = []
 
-        for category in self.questions_data["categories"]:
-            for question in category["questions"]:
-                question_id = question["id"]
-
-                if question_id in responses:
-                    user_value = responses[question_id]
-                    max_value = max(opt["value"] for opt in question["options"])
+        for slot in plan.answered_slots(responses):
+            question = plan.questions[slot]
+            user_value = responses[question.id]
 
-                    # If user scored less than 50% on this question
-                    if user_value < (max_value * 0.5):
-                        recommendations.append({
-                            "question_id": question_id,
-                            "category": category["name"][lang],
-                            "question": question["text"][lang],
-                            "standard": question["standard"],
-                            "severity": "high" if user_value == 0 else "medium"
-                        })
+            # If user scored less than 50% on this question
+            if user_value < plan.recommendation_thresholds[slot]:
+                recommendations.append({
+                    "question_id": question.id,
+                    "category": plan.categories[plan.category_indices[slot]].name[lang],
+                    "question": question.text[lang],
+                    "standard": list(question.standards),
+                    "severity": "high" if user_value == 0 else "medium"
+                })
 
         return recommendations
+
+
+class IncrementalScorer:
+    """
+    Running score of a questionnaire being filled in
+
+    Keeps per-category and overall totals up to date as answers change, so
+    that set_answer/clear_answer cost O(1) and the current percentage, risk
+    level and audit recommendation can be read at any time. The values read
+    always match calculate_score on the same responses.
+    """
+
+    def __init__(self, plan: ScoringPlan, responses: Optional[Dict[str, int]] = None):
+        self.plan = plan
+        self._values = [None] * len(plan.question_ids)
+        self._category_totals = [0] * len(plan.category_ids)
+        self._category_percentages = [
+            self._category_percentage(category_idx, 0) for category_idx in range(len(plan.category_ids))
+        ]
+        self._critical_count = sum(1 for percentage in self._category_percentages if percentage < 50)
+        self._total_score = 0
+        self._answered_count = 0
+
+        for question_id, user_value in (responses or {}).items():
+            self.set_answer(question_id, user_value)
+
+    def set_answer(self, question_id: str, value: int):
+        """Record or replace the answer to a question; unknown ids are ignored"""
+        slot = self.plan.question_slots.get(question_id)
+        if slot is None:
+            return
+
+        previous = self._values[slot]
+        if previous is None:
+            self._answered_count += 1
+            previous = 0
+        self._values[slot] = value
+        self._apply_delta(slot, (value - previous) * self.plan.weights[slot])
+
+    def clear_answer(self, question_id: str):
+        """Forget the answer to a question"""
+        slot = self.plan.question_slots.get(question_id)
+        if slot is None or self._values[slot] is None:
+            return
+
+        previous = self._values[slot]
+        self._values[slot] = None
+        self._answered_count -= 1
+        self._apply_delta(slot, -previous * self.plan.weights[slot])
+
+    def _apply_delta(self, slot: int, delta: int):
+        """Shift the category and overall totals, keeping the critical category count current"""
+        category_idx = self.plan.category_indices[slot]
+        category_total = self._category_totals[category_idx] + delta
+        percentage = self._category_percentage(category_idx, category_total)
+
+        was_critical = self._category_percentages[category_idx] < 50
+        is_critical = percentage < 50
+        self._critical_count += is_critical - was_critical
+
+        self._category_totals[category_idx] = category_total
+        self._category_percentages[category_idx] = percentage
+        self._total_score += delta
+
+    def _category_percentage(self, category_idx: int, category_total: int) -> float:
+        """Rounded percentage of a category, as reported by calculate_score"""
+        category_max_score = self.plan.category_max_scores[category_idx]
+        return round(category_total / category_max_score * 100, 2) if category_max_score > 0 else 0
+
+    @property
+    def answered_count(self) -> int:
+        return self._answered_count
+
+    @property
+    def total_questions(self) -> int:
+        return len(self.plan.question_ids)
+
+    @property
+    def total_score(self) -> int:
+        return self._total_score
+
+    @property
+    def percentage(self) -> float:
+        """Overall percentage, unrounded"""
+        total_max_score = self.plan.total_max_score
+        return (self._total_score / total_max_score * 100) if total_max_score > 0 else 0
+
+    @property
+    def risk_level(self) -> Dict[str, str]:
+        return dict(RISK_LEVELS[_risk_level_index(self.percentage)])
+
+    @property
+    def audit_recommendation(self) -> Dict[str, str]:
+        return dict(AUDIT_RECOMMENDATIONS[_audit_recommendation_index(self.percentage, self._critical_count)])
+
+    @property
+    def responses(self) -> Dict[str, int]:
+        """Current answers as a responses dict, in bank order"""
+        return {
+            question_id: value
+            for question_id, value in zip(self.plan.question_ids, self._values)
+            if value is not None
+        }
+
+    def score(self) -> Dict:
+        """Current score dict, identical to calculate_score on the current responses"""
+        plan = self.plan
+        percentage = self.percentage
+
+        return {
+            "total_score": self._total_score,
+            "max_score": plan.total_max_score,
+            "percentage": round(percentage, 2),
+            "risk_level": dict(RISK_LEVELS[_risk_level_index(percentage)]),
+            "audit_recommendation": dict(
+                AUDIT_RECOMMENDATIONS[_audit_recommendation_index(percentage, self._critical_count)]
+            ),
+            "category_scores": {
+                category_id: {
+                    "score": self._category_totals[category_idx],
+                    "max_score": plan.category_max_scores[category_idx],
+                    "percentage": self._category_percentages[category_idx],
+                    "weight": plan.category_weights[category_idx]
+                }
+                for category_idx, category_id in enumerate(plan.category_ids)
+            }
+        }
+
+
+def pack_responses(plan: ScoringPlan, responses_list: List[Dict[str, int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack a list of responses dicts into an (assessments x questions) matrix
+
+    Args:
+        plan: Compiled scoring plan of the question bank
+        responses_list: One responses dict per assessment
+
+    Returns:
+        Tuple of (values, answered) where values holds the selected option
+        values (0 where unanswered) and answered is the missing-answer mask
+    """
+    app_count = len(responses_list)
+    shape = (app_count, len(plan.question_ids))
+
+    # Flatten every (question_id, value) pair, then resolve slots in one go;
+    # unknown question ids get slot -1 and are ignored like in calculate_score
+    question_ids = list(chain.from_iterable(responses_list))
+    slots = np.fromiter(map(plan.question_slots.get, question_ids, repeat(-1)),
+                        dtype=np.int64, count=len(question_ids))
+    flat_values = np.asarray(list(chain.from_iterable(map(dict.values, responses_list))))
+    rows = np.repeat(np.arange(app_count),
+                     np.fromiter(map(len, responses_list), dtype=np.int64, count=app_count))
+
+    known = slots >= 0
+    rows, slots, flat_values = rows[known], slots[known], flat_values[known]
+
+    values = np.zeros(shape, dtype=flat_values.dtype if flat_values.size else np.int64)
+    answered = np.zeros(shape, dtype=bool)
+    values[rows, slots] = flat_values
+    answered[rows, slots] = True
+
+    return values, answered
+
+
+def _round_percentages(percentages: np.ndarray) -> np.ndarray:
+    """Apply Python's round(x, 2) elementwise, once per distinct value"""
+    unique_values, inverse = np.unique(percentages, return_inverse=True)
+    rounded = np.array([round(value, 2) for value in unique_values.tolist()], dtype=np.float64)
+    return rounded[inverse].reshape(percentages.shape)
+
+
+def _category_total_rows(plan: ScoringPlan, category_totals: np.ndarray, answered: np.ndarray,
+                         membership: np.ndarray, responses_list: List[Dict[str, int]]) -> List[List]:
+    """
+    Category totals as Python numbers typed like calculate_score's
+
+    A total is a float there only when one of its answers or weights is a
+    float, so float matrices are cast back to int everywhere else.
+    """
+    if category_totals.dtype.kind != "f":
+        return category_totals.tolist()
+
+    float_answers = np.zeros(answered.shape, dtype=bool)
+    for row, responses in enumerate(responses_list):
+        for question_id, value in responses.items():
+            slot = plan.question_slots.get(question_id)
+            if slot is not None and isinstance(value, float):
+                float_answers[row, slot] = True
+    float_weights = np.array([isinstance(weight, float) for weight in plan.weights], dtype=bool)
+
+    float_terms = answered & (float_answers | float_weights)
+    float_categories = float_terms.astype(np.int64) @ membership.astype(np.int64) > 0
+
+    return [
+        [total if is_float else int(total) for total, is_float in zip(row, flags)]
+        for row, flags in zip(category_totals.tolist(), float_categories.tolist())
+    ]
+
+
+def calculate_scores_batch(plan: ScoringPlan, responses_list: List[Dict[str, int]]) -> List[Dict]:
+    """
+    Vectorized equivalent of QuestionnaireModel.calculate_score
+
+    Scores every assessment with matrix operations over the packed responses.
+    Percentages are rounded with Python's round() so the output is identical
+    to the per-assessment path.
+
+    Args:
+        plan: Compiled scoring plan of the question bank
+        responses_list: One responses dict per assessment
+
+    Returns:
+        List of score dicts, in input order
+    """
+    if not responses_list:
+        return []
+
+    values, answered = pack_responses(plan, responses_list)
+    app_count = len(responses_list)
+    category_count = len(plan.category_ids)
+
+    # questions x categories membership matrix, scaled by question weight in
+    # the weights' own dtype so fractional weights are not truncated
+    weights = np.asarray(plan.weights)
+    membership = np.zeros((len(plan.question_ids), category_count), dtype=bool)
+    membership[np.arange(len(plan.question_ids)), plan.category_indices] = True
+    weighted_membership = membership * weights[:, np.newaxis]
+
+    category_totals = np.where(answered, values, 0) @ weighted_membership
+    totals = category_totals.sum(axis=1)
+
+    category_max_scores = np.asarray(plan.category_max_scores, dtype=np.float64)
+    has_max_score = category_max_scores > 0
+    category_percentages = np.zeros((app_count, category_count), dtype=np.float64)
+    category_percentages[:, has_max_score] = (
+        category_totals[:, has_max_score] / category_max_scores[has_max_score] * 100
+    )
+    category_percentages = _round_percentages(category_percentages)
+
+    if plan.total_max_score > 0:
+        overall_percentages = totals / plan.total_max_score * 100
+    else:
+        overall_percentages = np.zeros(app_count, dtype=np.float64)
+
+    # Critical categories are counted on the rounded percentages, as in calculate_score
+    critical_counts = (category_percentages < 50).sum(axis=1)
+
+    risk_indices = np.select(
+        [overall_percentages >= 80, overall_percentages >= 60, overall_percentages >= 40],
+        [0, 1, 2],
+        default=3
+    )
+    audit_indices = np.select(
+        [(overall_percentages < 50) | (critical_counts >= 3),
+         (overall_percentages < 70) | (critical_counts >= 1)],
+        [0, 1],
+        default=2
+    )
+
+    # Categories without a max score report an integer 0 percentage
+    percentage_rows = category_percentages.astype(object)
+    percentage_rows[:, ~has_max_score] = 0
+
+    category_columns = tuple(zip(plan.category_ids, plan.category_max_scores, plan.category_weights))
+
+    results = []
+    for category_row, percentage_row, overall, risk_idx, audit_idx in zip(
+        _category_total_rows(plan, category_totals, answered, membership, responses_list),
+        percentage_rows.tolist(),
+        _round_percentages(overall_percentages).tolist(),
+        risk_indices.tolist(),
+        audit_indices.tolist()
+    ):
+        category_scores = {
+            category_id: {
+                "score": score,
+                "max_score": max_score,
+                "percentage": percentage,
+                "weight": weight
+            }
+            for (category_id, max_score, weight), score, percentage
+            in zip(category_columns, category_row, percentage_row)
+        }
+
+        results.append({
+            "total_score": sum(category_row),
+            "max_score": plan.total_max_score,
+            "percentage": overall,
+            "risk_level": dict(RISK_LEVELS[risk_idx]),
+            "audit_recommendation": dict(AUDIT_RECOMMENDATIONS[audit_idx]),
+            "category_scores": category_scores
+        })
+
+    return results
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+class ResultCache:
+    """
+    Bounded LRU cache for evaluation results
+
+    Entries are keyed by a canonical hash of (question bank version, responses,
+    lang), so identical submissions are only scored once. Entries expire after
+    ttl seconds. When a bank version never seen before is stored, i.e. after
+    questions.json changed, the entries of the older versions are dropped;
+    requests still finishing on an older snapshot afterwards just share the
+    LRU with the new ones. Safe to share between threads. Cached values are
+    shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._bank_version = None
+        self._seen_versions = set()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(bank_version: str, responses: Dict[str, int], lang: str) -> str:
+        """Canonical hash of a scoring request, independent of the responses order"""
+        payload = json.dumps(
+            [bank_version, lang, sorted(responses.items())],
+            separators=(",", ":"),
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_or_compute(self, bank_version: str, responses: Dict[str, int], lang: str,
+                       compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for this request, computing and storing it on a miss
+
+        Args:
+            bank_version: Version of the question bank the result depends on
+            responses: Submitted responses
+            lang: Language code
+            compute: Zero-argument callable producing the result on a miss
+        """
+        key = self.make_key(bank_version, responses, lang)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at, _ = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+
+        # Computed outside the lock so concurrent misses do not serialize
+        value = compute()
+
+        with self._lock:
+            self._check_bank_version(bank_version)
+            expires_at = time.monotonic() + self.ttl if self.ttl else None
+            self._entries[key] = (value, expires_at, bank_version)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return value
+
+    def _check_bank_version(self, bank_version: str):
+        """Drop the older versions' entries when a new bank version shows up; caller holds the lock"""
+        if bank_version in self._seen_versions:
+            return
+
+        stale = [key for key, entry in self._entries.items() if entry[2] != bank_version]
+        if stale:
+            self.invalidations += 1
+        for key in stale:
+            del self._entries[key]
+        self._seen_versions.add(bank_version)
+        self._bank_version = bank_version
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Counters for monitoring"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "bank_version": self._bank_version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations
+            }
@@ -1,14 +1,117 @@
-from flask import Blueprint, jsonify, request, send_file
+from flask import Blueprint, Response, jsonify, request, send_file, stream_with_context
 from models.questionnaire import QuestionnaireModel
-from services.excel_export import ExcelExportService
+from models.result_cache import ResultCache
+from services.assessment_store import DEFAULT_DB_PATH as DEFAULT_ASSESSMENTS_DB_PATH, SQLiteAssessmentStore
+from services.bank_reloader import BankReloader, BankSnapshot
+from services.draft_store import DEFAULT_DB_PATH as DEFAULT_DRAFTS_DB_PATH, DraftStore
+from services.excel_export import (ENGINE_WRITE_ONLY, ENGINES, SPOOL_MAX_MEMORY, ExcelExportService,
+                                   spool_workbook, workbook_bytes)
+from services.bulk_import import FORMAT_CSV, FORMATS, BulkImportManager, BulkQueueFull
+from services.excel_import import ExcelImportService, QuestionnaireImportError, import_questionnaire
+from services.export_jobs import (ExportJobManager, ExportQueueFull, render_results_report,
+                                  render_template)
+from services.portfolio import render_portfolio_report
+from services.precompressed import PrecompressedPayload
+from services.template_cache import DEFAULT_CACHE_DIR, TemplateCache
+import codecs
 import io
+import json
+import logging
+import os
+import re
+import sqlite3
 from datetime import datetime
+from itertools import islice
 
 api = Blueprint('api', __name__)
+logger = logging.getLogger(__name__)
 
 # Initialize models
-questionnaire_model = QuestionnaireModel()
-excel_service = ExcelExportService(questionnaire_model.questions_data)
+result_cache = ResultCache(
+    max_entries=int(os.environ.get('RESULT_CACHE_MAX_ENTRIES', 1024)),
+    ttl=float(os.environ.get('RESULT_CACHE_TTL', 3600))
+)
+
+
+def _build_bank_snapshot():
+    """Load the question bank and everything derived from it"""
+    model = QuestionnaireModel(result_cache=result_cache)
+    return BankSnapshot(model, ExcelExportService(model.bank))
+
+
+# Swapped atomically when questions.json changes; see BankReloader.start()
+bank = BankReloader(
+    _build_bank_snapshot,
+    QuestionnaireModel.DEFAULT_DATA_PATH,
+    interval=float(os.environ.get('QUESTIONS_RELOAD_INTERVAL', 2))
+)
+
+# Cache lifetime of the precompressed bank payloads, revalidated with ETags
+PAYLOAD_MAX_AGE = int(os.environ.get('PAYLOAD_MAX_AGE', 60))
+
+# Asynchronous exports run in a separate process pool
+export_jobs = ExportJobManager(
+    max_workers=int(os.environ.get('EXPORT_JOB_WORKERS', 2)),
+    max_pending=int(os.environ.get('EXPORT_JOB_MAX_PENDING', 16)),
+    result_ttl=float(os.environ.get('EXPORT_JOB_TTL', 600))
+)
+EXPORT_RETRY_AFTER = 5
+
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Workbook rendering engine: 'openpyxl', 'write_only' (streams rows to disk) or
+# 'native' (writes the sheet XML directly, fastest on large reports)
+EXPORT_ENGINE = os.environ.get('EXPORT_ENGINE', ENGINE_WRITE_ONLY)
+if EXPORT_ENGINE not in ENGINES:
+    raise ValueError(f"Invalid EXPORT_ENGINE {EXPORT_ENGINE!r}, use one of {', '.join(ENGINES)}")
+
+# Rendered blank templates, in memory and on disk (TEMPLATE_CACHE_DIR='' disables the disk tier)
+template_cache = TemplateCache(
+    max_entries=int(os.environ.get('TEMPLATE_CACHE_MAX_ENTRIES', 8)),
+    cache_dir=os.environ.get('TEMPLATE_CACHE_DIR', str(DEFAULT_CACHE_DIR)) or None
+)
+
+# Exports above this many bytes are spooled to disk while they are sent
+EXPORT_SPOOL_MAX_MEMORY = int(os.environ.get('EXPORT_SPOOL_MAX_MEMORY', SPOOL_MAX_MEMORY))
+
+# Largest completed questionnaire accepted by /import
+IMPORT_MAX_SIZE = int(os.environ.get('IMPORT_MAX_SIZE', 20 * 1024 * 1024))
+
+# Archives of completed questionnaires are ingested one at a time in the background
+BULK_IMPORT_MAX_SIZE = int(os.environ.get('BULK_IMPORT_MAX_SIZE', 512 * 1024 * 1024))
+bulk_imports = BulkImportManager(
+    workers=int(os.environ.get('BULK_IMPORT_WORKERS', 0)) or None,
+    max_pending=int(os.environ.get('BULK_IMPORT_MAX_PENDING', 4)),
+    result_ttl=float(os.environ.get('BULK_IMPORT_TTL', 3600)),
+    engine=EXPORT_ENGINE
+)
+
+# Autosaved in-progress assessments; changes are coalesced and written in the background
+# (opened on first use; drafts untouched for DRAFTS_MAX_AGE seconds are purged)
+drafts = DraftStore(
+    path=os.environ.get('DRAFTS_DB_PATH', str(DEFAULT_DRAFTS_DB_PATH)),
+    debounce=float(os.environ.get('DRAFTS_DEBOUNCE', 0.5)),
+    max_age=float(os.environ.get('DRAFTS_MAX_AGE', 30 * 86400))
+)
+
+# History of submitted assessments (opened on first use)
+assessment_store = SQLiteAssessmentStore(os.environ.get('ASSESSMENTS_DB_PATH', str(DEFAULT_ASSESSMENTS_DB_PATH)))
+ASSESSMENTS_PAGE_SIZE = 50
+ASSESSMENTS_MAX_PAGE_SIZE = 500
+
+# Batch submission tuning
+BATCH_READ_SIZE = 64 * 1024
+BATCH_SCORING_CHUNK = 256
+# Longest tail of the read buffer where a cut value can fail to decode (e.g. "\uXXX")
+BATCH_CUT_WINDOW = 16
+JSON_WHITESPACE = re.compile(r'[ \t\r\n]*')
+
+
+@api.errorhandler(sqlite3.Error)
+def storage_unavailable(error):
+    """The local databases may be unwritable, e.g. on read-only deploys"""
+    logger.error("Storage error: %s", error)
+    return jsonify({"error": "Storage unavailable"}), 503
 
 
 @api.route('/health', methods=['GET'])
@@ -25,8 +128,12 @@ def get_questions():
     if lang not in ['fr', 'en']:
         return jsonify({"error": "Invalid language. Use 'fr' or 'en'"}), 400
 
-    questions = questionnaire_model.get_all_questions(lang)
-    return jsonify(questions)
+    snapshot = bank.current()
+    payload = snapshot.cached(
+        ('questions', lang),
+        lambda: PrecompressedPayload(snapshot.model.get_all_questions(lang))
+    )
+    return payload.make_response(request, PAYLOAD_MAX_AGE)
 
 
 @api.route('/questions/<category_id>', methods=['GET'])
@@ -34,12 +141,17 @@ def get_category(category_id):
     """Get questions for a specific category"""
     lang = request.args.get('lang', 'fr')
 
-    category = questionnaire_model.get_category(category_id, lang)
+    if lang not in ['fr', 'en']:
+        return jsonify({"error": "Invalid language. Use 'fr' or 'en'"}), 400
+
+    snapshot = bank.current()
+    category = snapshot.model.get_category(category_id, lang)
 
     if not category:
         return jsonify({"error": "Category not found"}), 404
 
-    return jsonify(category)
+    payload = snapshot.cached(('category', category_id, lang), lambda: PrecompressedPayload(category))
+    return payload.make_response(request, PAYLOAD_MAX_AGE)
 
 
 @api.route('/submit', methods=['POST'])
@@ -57,22 +169,228 @@ def submit_questionnaire():
     if not responses:
         return jsonify({"error": "No responses provided"}), 400
 
-    # Calculate score
-    score_data = questionnaire_model.calculate_score(responses)
-
-    # Get recommendations
-    recommendations = questionnaire_model.get_recommendations(responses, lang)
+    # Score, recommendations and per-question breakdown in one pass
+    snapshot = bank.current()
+    evaluation = snapshot.model.evaluate(responses, lang)
+
+    now = datetime.now()
+    # The history is best effort: the score is returned even if it can't be saved
+    try:
+        assessment_id = assessment_store.add(
+            app_info, responses, evaluation["score"], lang,
+            bank_version=snapshot.version, created_at=now.timestamp()
+        )
+    except Exception:
+        logger.exception("Could not save the assessment to the history")
+        assessment_id = None
 
     result = {
-        "score": score_data,
-        "recommendations": recommendations,
+        "assessment_id": assessment_id,
+        "score": evaluation["score"],
+        "recommendations": evaluation["recommendations"],
+        "contributions": evaluation["contributions"],
         "app_info": app_info,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now.isoformat()
     }
 
     return jsonify(result)
 
 
+@api.route('/submit/batch', methods=['POST'])
+def submit_batch():
+    """
+    Score many questionnaires in one request
+
+    The body is either a JSON array or NDJSON (one object per line) of
+    {responses, app_info, lang} records. Results are streamed back as NDJSON,
+    one line per record in input order, while the body is still being read.
+    Invalid records produce an inline {"index", "error"} line instead of
+    aborting the batch.
+    """
+    stream = request.stream
+    # The whole batch is scored against the same bank version
+    model = bank.current().model
+
+    def generate():
+        records = _iter_batch_records(stream)
+        while True:
+            chunk = list(islice(records, BATCH_SCORING_CHUNK))
+            if not chunk:
+                break
+            for line in _score_batch_chunk(model, chunk):
+                yield json.dumps(line, ensure_ascii=False) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+def _iter_batch_records(stream):
+    """
+    Incrementally parse a JSON array or NDJSON body
+
+    Yields (index, record, error) tuples; error is None when the record was
+    parsed. Only one read buffer is kept in memory at a time.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    json_decoder = json.JSONDecoder()
+    buffer = ""
+    eof = False
+
+    def read_more():
+        nonlocal buffer, eof
+        data = stream.read(BATCH_READ_SIZE)
+        if not data:
+            eof = True
+            buffer += decoder.decode(b"", final=True)
+        else:
+            buffer += decoder.decode(data)
+
+    # Sniff the body format from its first significant character
+    while not eof and not buffer.strip():
+        read_more()
+    buffer = buffer.lstrip()
+    if not buffer:
+        return
+
+    index = 0
+    if buffer[0] != "[":
+        # NDJSON: one record per line, a bad line does not affect the others.
+        # Lines are read at an offset; the buffer is only compacted before a read
+        start = 0
+        searched = 0
+        while True:
+            newline = buffer.find("\n", searched)
+            if newline == -1 and not eof:
+                buffer, searched = buffer[start:], len(buffer) - start
+                start = 0
+                read_more()
+                continue
+            end = len(buffer) if newline == -1 else newline
+            line = buffer[start:end]
+            start = searched = end + 1
+
+            if line.strip():
+                try:
+                    yield index, json.loads(line), None
+                except ValueError as e:
+                    yield index, None, f"Invalid JSON: {e}"
+                index += 1
+
+            if eof and start >= len(buffer):
+                return
+
+    # JSON array: elements must be separated by exactly one comma. A syntax
+    # error leaves no reliable way to find the next element, so it ends the batch
+    pos = 1
+    after_element = False
+    after_comma = False
+    while True:
+        pos = JSON_WHITESPACE.match(buffer, pos).end()
+        if pos >= len(buffer):
+            if eof:
+                yield index, None, "Invalid JSON: unterminated array"
+                return
+            buffer, pos = buffer[pos:], 0
+            read_more()
+            continue
+
+        char = buffer[pos]
+        if char == "]" and not after_comma:
+            return
+        if after_element:
+            if char != ",":
+                yield index, None, "Invalid JSON: Expecting ',' delimiter"
+                return
+            pos += 1
+            after_element, after_comma = False, True
+            continue
+        if char in ",]":
+            yield index, None, "Invalid JSON: Expecting value"
+            return
+
+        try:
+            record, end = json_decoder.raw_decode(buffer, pos)
+            # Only trust a value once something follows it: a number may go on
+            cut = end >= len(buffer) and not eof
+        except json.JSONDecodeError as e:
+            if eof or not _may_be_cut(e, buffer):
+                yield index, None, f"Invalid JSON: {e}"
+                return
+            cut = True
+
+        if cut:
+            # Retry once the element's data has at least doubled, so a long
+            # record is decoded a logarithmic number of times, not once per read
+            buffer, pos = buffer[pos:], 0
+            target = 2 * len(buffer)
+            while not eof and len(buffer) < target:
+                read_more()
+            continue
+
+        yield index, record, None
+        index += 1
+        pos = end
+        after_element, after_comma = True, False
+
+
+def _may_be_cut(error, buffer):
+    """
+    Whether a decode error may come from a value cut at the end of the buffer
+
+    Such errors are reported within a few characters of the end (a partial
+    literal, number or escape), or as an unterminated string; anything
+    earlier is a genuine syntax error.
+    """
+    return (error.msg.startswith("Unterminated string")
+            or error.pos >= len(buffer.rstrip()) - BATCH_CUT_WINDOW)
+
+
+def _score_batch_chunk(model, chunk):
+    """Score a chunk of parsed batch records, returning one output line per record"""
+    lines = [None] * len(chunk)
+    valid = []
+
+    for position, (index, record, error) in enumerate(chunk):
+        if error is None:
+            error = _validate_batch_record(record)
+        if error is not None:
+            lines[position] = {"index": index, "error": error}
+        else:
+            valid.append((position, index, record))
+
+    scores = model.calculate_scores_batch([record['responses'] for _, _, record in valid])
+
+    for (position, index, record), score_data in zip(valid, scores):
+        lang = record.get('lang', 'fr')
+        lines[position] = {
+            "index": index,
+            "score": score_data,
+            "recommendations": model.get_recommendations(record['responses'], lang),
+            "app_info": record.get('app_info', {}),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    return lines
+
+
+def _validate_batch_record(record):
+    """Return an error message for an unusable batch record, or None"""
+    if not isinstance(record, dict):
+        return "Record must be a JSON object"
+
+    responses = record.get('responses')
+    if not responses:
+        return "No responses provided"
+    if not isinstance(responses, dict):
+        return "Responses must be an object mapping question ids to values"
+    if not all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in responses.values()):
+        return "Response values must be numbers"
+
+    if record.get('lang', 'fr') not in ['fr', 'en']:
+        return "Invalid language. Use 'fr' or 'en'"
+
+    return None
+
+
 @api.route('/export/template', methods=['GET'])
 def export_template():
     """Export blank questionnaire template as Excel"""
@@ -82,19 +400,21 @@ def export_template():
     if lang not in ['fr', 'en']:
         return jsonify({"error": "Invalid language. Use 'fr' or 'en'"}), 400
 
-    # Create Excel workbook
-    wb = excel_service.create_questionnaire_template(lang, app_name)
+    snapshot = bank.current()
+
+    def render(name):
+        return workbook_bytes(snapshot.excel_service.create_questionnaire_template(
+            lang, name, engine=EXPORT_ENGINE
+        ))
 
-    # Save to BytesIO
-    output = io.BytesIO()
-    wb.save(output)
-    output.seek(0)
+    # Rendered once per bank version, language and day
+    data = template_cache.get(snapshot.version, lang, app_name, render)
 
     filename = f"security_questionnaire_template_{lang}_{datetime.now().strftime('%Y%m%d')}.xlsx"
 
     return send_file(
-        output,
-        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        io.BytesIO(data),
+        mimetype=XLSX_MIMETYPE,
         as_attachment=True,
         download_name=filename
     )
@@ -115,54 +435,478 @@ def export_results():
     if not responses:
         return jsonify({"error": "No responses provided"}), 400
 
+    snapshot = bank.current()
+
     # Calculate score and recommendations
-    score_data = questionnaire_model.calculate_score(responses)
-    recommendations = questionnaire_model.get_recommendations(responses, lang)
+    evaluation = snapshot.model.evaluate(responses, lang)
 
     # Create Excel report
-    wb = excel_service.create_results_report(
+    wb = snapshot.excel_service.create_results_report(
         responses,
-        score_data,
-        recommendations,
+        evaluation["score"],
+        evaluation["recommendations"],
         lang,
-        app_info
+        app_info,
+        engine=EXPORT_ENGINE
     )
 
-    # Save to BytesIO
-    output = io.BytesIO()
-    wb.save(output)
-    output.seek(0)
-
     app_name = app_info.get('name', 'application')
     filename = f"security_assessment_{app_name}_{datetime.now().strftime('%Y%m%d')}.xlsx"
 
-    return send_file(
-        output,
-        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    return _send_workbook(wb, filename)
+
+
+def _send_workbook(wb, filename):
+    """Stream a workbook from a spooled file in chunks instead of one buffer"""
+    spool = spool_workbook(wb, EXPORT_SPOOL_MAX_MEMORY)
+    size = spool.seek(0, io.SEEK_END)
+    spool.seek(0)
+
+    # The response closes the spool once sent, which removes any temporary file
+    response = send_file(
+        spool,
+        mimetype=XLSX_MIMETYPE,
         as_attachment=True,
         download_name=filename
     )
+    response.content_length = size
+    return response
+
+
+@api.route('/export/portfolio', methods=['POST'])
+def export_portfolio():
+    """
+    Export one workbook covering many applications
+
+    The body is a JSON array or NDJSON of {responses, app_info} records, as
+    for /submit/batch. Records are scored in batches and written to the
+    workbook as the body is read; invalid ones are skipped and counted in
+    the X-Skipped-Records header.
+    """
+    lang = request.args.get('lang', 'fr')
+
+    if lang not in ['fr', 'en']:
+        return jsonify({"error": "Invalid language. Use 'fr' or 'en'"}), 400
+
+    snapshot = bank.current()
+    skipped = 0
+
+    def assessments():
+        nonlocal skipped
+        for _, record, error in _iter_batch_records(request.stream):
+            if error is None:
+                error = _validate_batch_record(record)
+            if error is not None:
+                skipped += 1
+                continue
+            yield {"responses": record['responses'], "app_info": record.get('app_info') or {}}
+
+    wb = render_portfolio_report(snapshot.model, assessments(), lang, EXPORT_ENGINE, snapshot.excel_service)
+
+    filename = f"security_portfolio_{datetime.now().strftime('%Y%m%d')}.xlsx"
+    response = _send_workbook(wb, filename)
+    response.headers['X-Skipped-Records'] = str(skipped)
+    return response
+
+
+@api.route('/export/jobs', methods=['POST'])
+def create_export_job():
+    """Queue a template or results export and return its job id immediately"""
+    data = request.get_json(silent=True)
+
+    if not data:
+        return jsonify({"error": "No data provided"}), 400
+
+    kind = data.get('type', 'results')
+    lang = data.get('lang', 'fr')
+
+    if kind not in ['template', 'results']:
+        return jsonify({"error": "Invalid export type. Use 'template' or 'results'"}), 400
+
+    if lang not in ['fr', 'en']:
+        return jsonify({"error": "Invalid language. Use 'fr' or 'en'"}), 400
+
+    snapshot = bank.current()
+    date = datetime.now().strftime('%Y%m%d')
+
+    if kind == 'template':
+        filename = f"security_questionnaire_template_{lang}_{date}.xlsx"
+        args = (render_template, snapshot.model.bank, lang, data.get('app_name'), EXPORT_ENGINE)
+    else:
+        responses = data.get('responses', {})
+        app_info = data.get('app_info', {})
+
+        if not responses:
+            return jsonify({"error": "No responses provided"}), 400
+
+        # Scoring is cheap and cached; only the workbook rendering is offloaded
+        evaluation = snapshot.model.evaluate(responses, lang)
+        filename = f"security_assessment_{app_info.get('name', 'application')}_{date}.xlsx"
+        args = (render_results_report, snapshot.model.bank, responses,
+                evaluation["score"], evaluation["recommendations"], lang, app_info, EXPORT_ENGINE)
+
+    try:
+        job = export_jobs.submit(kind, filename, *args)
+    except ExportQueueFull as e:
+        response = jsonify({"error": str(e)})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(EXPORT_RETRY_AFTER)
+        return response
+
+    response = jsonify({
+        **job.to_dict(),
+        "status_url": f"/api/export/jobs/{job.id}",
+        "file_url": f"/api/export/jobs/{job.id}/file"
+    })
+    response.status_code = 202
+    response.headers['Location'] = f"/api/export/jobs/{job.id}"
+    return response
+
+
+@api.route('/export/jobs/<job_id>', methods=['GET'])
+def get_export_job(job_id):
+    """Get the status of an export job"""
+    job = export_jobs.get(job_id)
+
+    if not job:
+        return jsonify({"error": "Export job not found or expired"}), 404
+
+    return jsonify(job.to_dict())
+
+
+@api.route('/export/jobs/<job_id>/file', methods=['GET'])
+def get_export_job_file(job_id):
+    """Download the workbook of a finished export job"""
+    job = export_jobs.get(job_id)
+
+    if not job:
+        return jsonify({"error": "Export job not found or expired"}), 404
+
+    status = job.status
+    if status == 'failed':
+        return jsonify(job.to_dict()), 500
+    if status == 'cancelled':
+        return jsonify(job.to_dict()), 410
+    if status != 'done':
+        response = jsonify(job.to_dict())
+        response.status_code = 409
+        response.headers['Retry-After'] = '1'
+        return response
+
+    return send_file(
+        io.BytesIO(job.future.result()),
+        mimetype=XLSX_MIMETYPE,
+        as_attachment=True,
+        download_name=job.filename
+    )
+
+
+@api.route('/import', methods=['POST'])
+def import_completed_questionnaire():
+    """Score a completed questionnaire template uploaded as the 'file' form field"""
+    if request.content_length is not None and request.content_length > IMPORT_MAX_SIZE:
+        return jsonify({"error": f"File too large, the limit is {IMPORT_MAX_SIZE} bytes"}), 413
+
+    upload = request.files.get('file')
+    if upload is None:
+        return jsonify({"error": "No file provided"}), 400
+
+    lang = request.args.get('lang')
+    if lang is not None and lang not in ['fr', 'en']:
+        return jsonify({"error": "Invalid language. Use 'fr' or 'en'"}), 400
+
+    snapshot = bank.current()
+    importer = snapshot.cached('importer', lambda: ExcelImportService(snapshot.model.bank))
+
+    try:
+        result = import_questionnaire(snapshot.model, upload.stream, lang, importer)
+    except QuestionnaireImportError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result["timestamp"] = datetime.now().isoformat()
+    return jsonify(result)
+
+
+@api.route('/import/bulk', methods=['POST'])
+def create_bulk_import():
+    """Queue the import of a ZIP archive of completed questionnaires (the 'file' form field)"""
+    if request.content_length is not None and request.content_length > BULK_IMPORT_MAX_SIZE:
+        return jsonify({"error": f"Archive too large, the limit is {BULK_IMPORT_MAX_SIZE} bytes"}), 413
+
+    upload = request.files.get('file')
+    if upload is None:
+        return jsonify({"error": "No file provided"}), 400
+
+    fmt = request.values.get('format', 'ndjson')
+    if fmt not in FORMATS:
+        return jsonify({"error": f"Invalid format. Use one of {', '.join(FORMATS)}"}), 400
+
+    lang = request.values.get('lang')
+    if lang is not None and lang not in ['fr', 'en']:
+        return jsonify({"error": "Invalid language. Use 'fr' or 'en'"}), 400
+
+    snapshot = bank.current()
+
+    try:
+        job = bulk_imports.submit(snapshot.model, snapshot.excel_service, upload.save, fmt, lang)
+    except BulkQueueFull as e:
+        response = jsonify({"error": str(e)})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(EXPORT_RETRY_AFTER)
+        return response
+
+    response = jsonify({
+        **job.to_dict(),
+        "status_url": f"/api/import/bulk/{job.id}",
+        "results_url": f"/api/import/bulk/{job.id}/results",
+        "portfolio_url": f"/api/import/bulk/{job.id}/portfolio"
+    })
+    response.status_code = 202
+    response.headers['Location'] = f"/api/import/bulk/{job.id}"
+    return response
+
+
+@api.route('/import/bulk/<job_id>', methods=['GET'])
+def get_bulk_import(job_id):
+    """Get the status and progress of a bulk import"""
+    job = bulk_imports.get(job_id)
+
+    if not job:
+        return jsonify({"error": "Bulk import not found or expired"}), 404
+
+    return jsonify(job.to_dict())
+
+
+@api.route('/import/bulk/<job_id>/results', methods=['GET'])
+def get_bulk_import_results(job_id):
+    """Download the NDJSON or CSV results of a finished bulk import"""
+    return _send_bulk_import_file(
+        job_id,
+        lambda job: job.results_path,
+        lambda job: 'text/csv' if job.fmt == FORMAT_CSV else 'application/x-ndjson'
+    )
+
+
+@api.route('/import/bulk/<job_id>/portfolio', methods=['GET'])
+def get_bulk_import_portfolio(job_id):
+    """Download the portfolio workbook of a finished bulk import"""
+    return _send_bulk_import_file(job_id, lambda job: job.workbook_path, lambda job: XLSX_MIMETYPE)
+
+
+def _send_bulk_import_file(job_id, path, mimetype):
+    job = bulk_imports.get(job_id)
+
+    if not job:
+        return jsonify({"error": "Bulk import not found or expired"}), 404
+
+    status = job.status
+    if status == 'failed':
+        return jsonify(job.to_dict()), 500
+    if status == 'cancelled':
+        return jsonify(job.to_dict()), 410
+    if status != 'done':
+        response = jsonify(job.to_dict())
+        response.status_code = 409
+        response.headers['Retry-After'] = '1'
+        return response
+
+    file_path = path(job)
+    return send_file(
+        file_path,
+        mimetype=mimetype(job),
+        as_attachment=True,
+        download_name=f"bulk_import_{datetime.fromtimestamp(job.created_at).strftime('%Y%m%d')}_{file_path.name}"
+    )
+
+
+@api.route('/assessments', methods=['GET'])
+def list_assessments():
+    """
+    Submitted assessments, newest first
+
+    Filters: app_name, environment, risk_level (e.g. HIGH), since and until
+    (ISO date or Unix timestamp). Pages hold limit summaries; pass the
+    returned next_cursor as cursor to get the following page.
+    """
+    try:
+        limit = int(request.args.get('limit', ASSESSMENTS_PAGE_SIZE))
+        since = _parse_timestamp(request.args.get('since'))
+        until = _parse_timestamp(request.args.get('until'))
+    except ValueError as e:
+        return jsonify({"error": f"Invalid filter: {e}"}), 400
+
+    if not 1 <= limit <= ASSESSMENTS_MAX_PAGE_SIZE:
+        return jsonify({"error": f"limit must be between 1 and {ASSESSMENTS_MAX_PAGE_SIZE}"}), 400
+
+    risk_level = request.args.get('risk_level')
+
+    try:
+        items, next_cursor = assessment_store.query(
+            app_name=request.args.get('app_name') or None,
+            environment=request.args.get('environment') or None,
+            risk_level=risk_level.upper() if risk_level else None,
+            since=since,
+            until=until,
+            limit=limit,
+            cursor=request.args.get('cursor') or None
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({"assessments": items, "next_cursor": next_cursor})
+
+
+@api.route('/assessments/<int:assessment_id>', methods=['GET'])
+def get_assessment(assessment_id):
+    """Get a submitted assessment with its responses and score breakdown"""
+    assessment = assessment_store.get(assessment_id)
+
+    if assessment is None:
+        return jsonify({"error": "Assessment not found"}), 404
+
+    return jsonify(assessment)
+
+
+def _parse_timestamp(value):
+    """Unix timestamp of an ISO date or number query parameter, None if absent"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+@api.route('/drafts', methods=['POST'])
+def create_draft():
+    """Start an autosaved draft, optionally with initial responses and app_info"""
+    data = request.get_json(silent=True) or {}
+
+    error = _validate_draft_change(data)
+    if error:
+        return jsonify({"error": error}), 400
+
+    responses = {key: value for key, value in (data.get('responses') or {}).items() if value is not None}
+    draft_id = drafts.create(responses, data.get('app_info'), data.get('lang') or 'fr')
+
+    response = jsonify({"draft_id": draft_id, "url": f"/api/drafts/{draft_id}"})
+    response.status_code = 201
+    response.headers['Location'] = f"/api/drafts/{draft_id}"
+    return response
+
+
+@api.route('/drafts/<draft_id>', methods=['GET'])
+def get_draft(draft_id):
+    """Resume a draft"""
+    draft = drafts.get(draft_id)
+
+    if draft is None:
+        return jsonify({"error": "Draft not found"}), 404
+
+    return jsonify({"draft_id": draft_id, **draft})
+
+
+@api.route('/drafts/<draft_id>', methods=['PATCH'])
+def update_draft(draft_id):
+    """
+    Save the answers changed since the last call
+
+    The body holds only what changed: {"responses": {question_id: value or
+    null to clear}, "app_info": {field: value}, "lang": ...}. The change is
+    queued and written shortly after, together with any other changes.
+    """
+    data = request.get_json(silent=True)
+
+    if not data:
+        return jsonify({"error": "No data provided"}), 400
+
+    error = _validate_draft_change(data)
+    if error:
+        return jsonify({"error": error}), 400
+
+    if not drafts.exists(draft_id):
+        return jsonify({"error": "Draft not found"}), 404
+
+    responses = data.get('responses') or {}
+    drafts.update(
+        draft_id,
+        responses={key: value for key, value in responses.items() if value is not None},
+        removed=[key for key, value in responses.items() if value is None],
+        app_info=data.get('app_info'),
+        lang=data.get('lang')
+    )
+
+    response = jsonify({"draft_id": draft_id, "queued": True})
+    response.status_code = 202
+    return response
+
+
+@api.route('/drafts/<draft_id>', methods=['DELETE'])
+def delete_draft(draft_id):
+    """Discard a draft, e.g. once the assessment is submitted"""
+    if not drafts.delete(draft_id):
+        return jsonify({"error": "Draft not found"}), 404
+    return '', 204
+
+
+def _validate_draft_change(data):
+    """Return an error message for an unusable draft body, or None"""
+    if not isinstance(data, dict):
+        return "Body must be a JSON object"
+
+    responses = data.get('responses')
+    if responses is not None:
+        if not isinstance(responses, dict):
+            return "Responses must be an object mapping question ids to values"
+        if not all(value is None or (isinstance(value, (int, float)) and not isinstance(value, bool))
+                   for value in responses.values()):
+            return "Response values must be numbers, or null to clear an answer"
+
+    app_info = data.get('app_info')
+    if app_info is not None and not isinstance(app_info, dict):
+        return "app_info must be an object"
+
+    if data.get('lang') not in (None, 'fr', 'en'):
+        return "Invalid language. Use 'fr' or 'en'"
+
+    return None
 
 
 @api.route('/stats', methods=['GET'])
 def get_stats():
     """Get questionnaire statistics"""
+    snapshot = bank.current()
+    payload = snapshot.cached('stats', lambda: PrecompressedPayload(_build_stats(snapshot)))
+    return payload.make_response(request, PAYLOAD_MAX_AGE)
+
+
+def _build_stats(snapshot):
+    """Questionnaire statistics for one bank snapshot"""
+    categories = snapshot.model.bank.categories
     total_questions = 0
-    categories_count = len(questionnaire_model.questions_data['categories'])
+    categories_count = len(categories)
 
-    for category in questionnaire_model.questions_data['categories']:
-        total_questions += len(category['questions'])
+    for category in categories:
+        total_questions += len(category.questions)
 
-    return jsonify({
+    return {
         "total_questions": total_questions,
         "categories_count": categories_count,
         "categories": [
             {
-                "id": cat['id'],
-                "name": cat['name'],
-                "questions_count": len(cat['questions']),
-                "weight": cat['weight']
+                "id": cat.id,
+                "name": cat.name.to_dict(),
+                "questions_count": len(cat.questions),
+                "weight": cat.weight
             }
-            for cat in questionnaire_model.questions_data['categories']
-        ]
-    })
+            for cat in categories
+        ],
+        "bank_version": snapshot.version,
+        "loaded_at": snapshot.loaded_at
+    }
+
+
+@api.route('/stats/cache', methods=['GET'])
+def get_cache_stats():
+    """Get result cache counters"""
+    return jsonify(result_cache.stats())
@@ -0,0 +1,249 @@
+import base64
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / "data" / "assessments.sqlite3"
+
+# Small columns first: listing pages never read the JSON documents at the end
+# of the row, so long responses stay in overflow pages that are never loaded
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    app_name TEXT NOT NULL,
+    app_key TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    risk_level TEXT NOT NULL,
+    percentage REAL NOT NULL,
+    lang TEXT NOT NULL,
+    bank_version TEXT,
+    app_info TEXT NOT NULL,
+    score TEXT NOT NULL,
+    responses TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assessments_created_at ON assessments (created_at);
+CREATE INDEX IF NOT EXISTS assessments_app ON assessments (app_key, created_at);
+CREATE INDEX IF NOT EXISTS assessments_environment ON assessments (environment, created_at);
+CREATE INDEX IF NOT EXISTS assessments_risk_level ON assessments (risk_level, created_at);
+"""
+
+SUMMARY_COLUMNS = "id, created_at, app_name, environment, owner, risk_level, percentage, lang, bank_version"
+
+
+def app_key(name: str) -> str:
+    """Matching key of an application name: whitespace collapsed, case folded"""
+    return " ".join(str(name or "").split()).casefold()
+
+
+def encode_cursor(created_at: float, assessment_id: int) -> str:
+    """Opaque pagination cursor pointing after the given assessment"""
+    return base64.urlsafe_b64encode(json.dumps([created_at, assessment_id]).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Raises:
+        ValueError: Malformed cursor
+    """
+    try:
+        created_at, assessment_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return float(created_at), int(assessment_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+class AssessmentStore(ABC):
+    """
+    History of submitted assessments
+
+    Listing is keyset-paginated, newest first: a page ends with a cursor
+    naming its last assessment and the next page starts right after it, so
+    every page costs the same however deep it is.
+    """
+
+    @abstractmethod
+    def add(self, app_info: Dict, responses: Dict[str, int], score: Dict, lang: str = "fr",
+            bank_version: Optional[str] = None, created_at: Optional[float] = None) -> int:
+        """
+        Store a scored assessment
+
+        Args:
+            app_info: Application details
+            responses: Question id to answer value
+            score: Score breakdown as returned by calculate_score
+            lang: Language the assessment was filled in
+            bank_version: Version of the question bank it was scored with
+            created_at: Unix timestamp, defaults to now
+
+        Returns:
+            Assessment id
+        """
+
+    @abstractmethod
+    def get(self, assessment_id: int) -> Optional[Dict]:
+        """Assessment with its responses and score breakdown, or None"""
+
+    @abstractmethod
+    def query(self, app_name: Optional[str] = None, environment: Optional[str] = None,
+              risk_level: Optional[str] = None, since: Optional[float] = None,
+              until: Optional[float] = None, limit: int = 50,
+              cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Page of assessment summaries, newest first
+
+        Args:
+            app_name: Only this application (matched on app_key)
+            environment: Only this environment
+            risk_level: Only this risk level code, e.g. HIGH
+            since: Only assessments created at or after this Unix timestamp
+            until: Only assessments created before this Unix timestamp
+            limit: Page size
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            The summaries and the cursor of the next page (None on the last one)
+
+        Raises:
+            ValueError: Malformed cursor
+        """
+
+
+class SQLiteAssessmentStore(AssessmentStore):
+    """
+    Assessment history in a SQLite database
+
+    Each filter has an index ending with created_at, so a filtered page is a
+    range walk of one index in listing order. The database runs in WAL mode
+    with one connection per thread: listing never waits for submissions. It
+    is opened on first use, so an unwritable path only fails the store calls.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        """
+        Args:
+            path: SQLite database file, created if needed
+        """
+        self.path = Path(path)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connection(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                pass  # Reported by connect below
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    db.executescript(SCHEMA)
+                    self._schema_ready = True
+        return db
+
+    def add(self, app_info: Dict, responses: Dict[str, int], score: Dict, lang: str = "fr",
+            bank_version: Optional[str] = None, created_at: Optional[float] = None) -> int:
+        app_info = app_info or {}
+        return self._connection().execute(
+            "INSERT INTO assessments (created_at, app_name, app_key, environment, owner, risk_level, "
+            "percentage, lang, bank_version, app_info, score, responses) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                time.time() if created_at is None else created_at,
+                str(app_info.get("name") or ""),
+                app_key(app_info.get("name")),
+                str(app_info.get("environment") or ""),
+                str(app_info.get("owner") or ""),
+                score["risk_level"]["level"],
+                score["percentage"],
+                lang,
+                bank_version,
+                json.dumps(app_info, ensure_ascii=False),
+                json.dumps(score, ensure_ascii=False),
+                json.dumps(responses)
+            )
+        ).lastrowid
+
+    def get(self, assessment_id: int) -> Optional[Dict]:
+        row = self._connection().execute(
+            f"SELECT {SUMMARY_COLUMNS}, app_info, score, responses FROM assessments WHERE id = ?",
+            (assessment_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        assessment = self._summary(row[:-3])
+        assessment["app_info"] = json.loads(row[-3])
+        assessment["score"] = json.loads(row[-2])
+        assessment["responses"] = json.loads(row[-1])
+        return assessment
+
+    def query(self, app_name: Optional[str] = None, environment: Optional[str] = None,
+              risk_level: Optional[str] = None, since: Optional[float] = None,
+              until: Optional[float] = None, limit: int = 50,
+              cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        conditions = []
+        params = []
+        for column, value in (("app_key", app_key(app_name) if app_name else None),
+                              ("environment", environment),
+                              ("risk_level", risk_level)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            conditions.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("created_at < ?")
+            params.append(until)
+        if cursor:
+            conditions.append("(created_at, id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        # One extra row tells whether there is a next page
+        rows = self._connection().execute(
+            f"SELECT {SUMMARY_COLUMNS} FROM assessments {where}ORDER BY created_at DESC, id DESC LIMIT ?",
+            (*params, limit + 1)
+        ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][1], rows[-1][0])
+        return [self._summary(row) for row in rows], next_cursor
+
+    @staticmethod
+    def _summary(row) -> Dict:
+        assessment_id, created_at, app_name, environment, owner, risk_level, percentage, lang, bank_version = row
+        return {
+            "id": assessment_id,
+            "timestamp": datetime.fromtimestamp(created_at).isoformat(),
+            "created_at": created_at,
+            "app_name": app_name,
+            "environment": environment,
+            "owner": owner,
+            "risk_level": risk_level,
+            "percentage": percentage,
+            "lang": lang,
+            "bank_version": bank_version
+        }
+
+    def close(self):
+        """Close the calling thread's connection"""
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
@@ -0,0 +1,116 @@
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BankSnapshot:
+    """
+    Everything derived from one version of the question bank
+
+    A snapshot is never modified once built: a reload builds a new one and
+    swaps it in, so a request that grabbed a snapshot keeps a consistent view
+    of the bank until it finishes. Values derived from the bank can be
+    memoized on the snapshot with cached(), and go away with it.
+    """
+
+    def __init__(self, model, excel_service):
+        self.model = model
+        self.excel_service = excel_service
+        self.version = model.bank_version
+        self.loaded_at = datetime.now().isoformat()
+        self._derived = {}
+
+    def cached(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Value built once per snapshot; concurrent first calls may both build it"""
+        value = self._derived.get(key)
+        if value is None:
+            value = self._derived[key] = build()
+        return value
+
+
+class BankReloader:
+    """
+    Watch questions.json and swap in a rebuilt BankSnapshot when it changes
+
+    The file is polled for mtime/size changes from a daemon thread. The new
+    snapshot is built off to the side and published with a single reference
+    assignment (read-copy-update), so readers never block and never see a
+    half-built bank. A bank that fails to load is logged and the previous
+    snapshot stays in service until the file changes again.
+    """
+
+    def __init__(self, build: Callable[[], BankSnapshot], data_path: Path, interval: float = 2.0):
+        self._build = build
+        self.data_path = Path(data_path)
+        self.interval = interval
+        self._signature = self._stat_signature()
+        self._failed_signature = None
+        self._snapshot = build()
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def current(self) -> BankSnapshot:
+        """Snapshot to use for the whole of a request"""
+        return self._snapshot
+
+    def _stat_signature(self) -> Optional[tuple]:
+        try:
+            stat = os.stat(self.data_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self) -> bool:
+        """
+        Reload the bank if the file changed since the last load
+
+        Returns:
+            True if a new snapshot was swapped in
+        """
+        with self._reload_lock:
+            signature = self._stat_signature()
+            if signature is None or signature in (self._signature, self._failed_signature):
+                return False
+
+            try:
+                snapshot = self._build()
+            except Exception:
+                # Typically a file caught mid-write; retried once it changes again
+                logger.exception("Failed to reload question bank from %s", self.data_path)
+                self._failed_signature = signature
+                return False
+
+            self._signature = signature
+            if snapshot.version == self._snapshot.version:
+                # Touched but not changed: keep the warm snapshot
+                return False
+
+            self._snapshot = snapshot
+            logger.info("Question bank reloaded, version %s", snapshot.version)
+            return True
+
+    def start(self):
+        """Start polling in a background daemon thread"""
+        if self._thread is not None or self.interval <= 0:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="bank-reloader", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background polling"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
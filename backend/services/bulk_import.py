@@ -0,0 +1,493 @@
+"""
+Bulk ingestion of completed questionnaires
+
+Takes a ZIP archive or a directory of returned templates, parses them in a
+process pool (each file streamed in read-only mode by ExcelImportService),
+scores them in batches and writes one NDJSON or CSV line per file plus a
+portfolio workbook. Only a bounded window of files is in flight at any time
+and results are written out as they arrive, so memory does not grow with the
+size of the archive. A file that cannot be parsed produces an error line and
+does not affect the others.
+
+Usage (from backend/):
+    python -m services.bulk_import returned.zip -o results.ndjson --workbook portfolio.xlsx
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from services.excel_export import ENGINE_NATIVE, ENGINES, ExcelExportService
+from services.excel_import import ExcelImportService, QuestionnaireImportError
+from services.portfolio import render_portfolio_report
+
+FORMAT_NDJSON = "ndjson"
+FORMAT_CSV = "csv"
+FORMATS = (FORMAT_NDJSON, FORMAT_CSV)
+
+# Files larger than this are rejected without being read
+MAX_FILE_SIZE = 20 * 1024 * 1024
+
+# Parsed files waiting to be scored, and files queued per worker
+SCORING_CHUNK = 256
+PENDING_PER_WORKER = 4
+
+CSV_COLUMNS = ["file", "name", "environment", "owner", "lang", "percentage", "risk_level",
+               "audit_recommendation", "answered", "recommendations", "issues", "error"]
+
+# (display name, archive path or None, member name or file path)
+Source = Tuple[str, Optional[str], str]
+
+
+def list_sources(path) -> List[Source]:
+    """Questionnaire files of a ZIP archive or a directory, in name order"""
+    path = Path(path)
+
+    def wanted(name: str) -> bool:
+        base = name.rsplit("/", 1)[-1]
+        # Skip Office lock files and macOS resource forks
+        return (base.lower().endswith(".xlsx") and not base.startswith(("~$", "._"))
+                and not name.startswith("__MACOSX/"))
+
+    if path.is_dir():
+        return [
+            (str(file.relative_to(path)), None, str(file))
+            for file in sorted(path.rglob("*.xlsx"))
+            if wanted(file.relative_to(path).as_posix())
+        ]
+
+    if not zipfile.is_zipfile(path):
+        raise ValueError(f"{path.name} is neither a directory nor a ZIP archive")
+    with zipfile.ZipFile(path) as archive:
+        return [
+            (info.filename, str(path), info.filename)
+            for info in sorted(archive.infolist(), key=lambda info: info.filename)
+            if not info.is_dir() and wanted(info.filename)
+        ]
+
+
+class BulkProgress:
+    """Counters of a running ingestion, safe to read from other threads"""
+
+    def __init__(self, total: int = 0, on_update: Optional[Callable[["BulkProgress"], None]] = None):
+        """
+        Args:
+            total: Number of files
+            on_update: Called after each processed file
+        """
+        self.total = total
+        self.processed = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self.finished = None
+        self._on_update = on_update
+
+    def advance(self, failed: bool = False):
+        self.processed += 1
+        if failed:
+            self.failed += 1
+        if self._on_update is not None:
+            self._on_update(self)
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def files_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "total": self.total,
+            "processed": self.processed,
+            "failed": self.failed,
+            "seconds": round(self.elapsed, 3),
+            "files_per_second": round(self.files_per_second, 2)
+        }
+
+
+# Import service of each worker process, built once from the bank by _init_worker
+_importer = None
+
+
+def _init_worker(bank):
+    global _importer
+    _importer = ExcelImportService(bank)
+
+
+def _parse_source(source: Source) -> Tuple[Optional[Dict], Optional[str]]:
+    """Parse one file in a worker; returns (parsed, None) or (None, error)"""
+    _, archive_path, name = source
+    try:
+        if archive_path is None:
+            if os.path.getsize(name) > MAX_FILE_SIZE:
+                return None, f"File larger than {MAX_FILE_SIZE} bytes"
+            return _importer.parse(name), None
+
+        with zipfile.ZipFile(archive_path) as archive:
+            if archive.getinfo(name).file_size > MAX_FILE_SIZE:
+                return None, f"File larger than {MAX_FILE_SIZE} bytes"
+            data = io.BytesIO(archive.read(name))
+        return _importer.parse(data), None
+    except QuestionnaireImportError as e:
+        return None, str(e)
+    except Exception as e:
+        # A malformed file must not take the rest of the batch down
+        return None, f"{type(e).__name__}: {e}"
+
+
+def ingest(model, sources: List[Source], workers: Optional[int] = None, lang: Optional[str] = None,
+           progress: Optional[BulkProgress] = None) -> Iterator[Dict]:
+    """
+    Parse and score questionnaire files
+
+    Args:
+        model: QuestionnaireModel to score with
+        sources: Files, as returned by list_sources()
+        workers: Parser processes (defaults to the CPU count)
+        lang: Language of the results, defaults to each file's
+        progress: Updated as files are processed
+
+    Yields:
+        One record per file in source order: file, lang, app_info, responses,
+        score, recommendations and issues, or file and error
+    """
+    workers = workers or os.cpu_count() or 1
+    progress = progress if progress is not None else BulkProgress()
+    progress.total = len(sources)
+
+    def score(chunk):
+        scores = model.calculate_scores_batch([parsed["responses"] for _, parsed in chunk])
+        for (name, parsed), score_data in zip(chunk, scores):
+            record_lang = lang or parsed["lang"]
+            yield {
+                "file": name,
+                "lang": record_lang,
+                "app_info": parsed["app_info"],
+                "responses": parsed["responses"],
+                "score": score_data,
+                "recommendations": model.get_recommendations(parsed["responses"], record_lang),
+                "issues": parsed["issues"]
+            }
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(model.bank,)) as executor:
+        remaining = iter(sources)
+        pending = deque()
+        chunk = []
+
+        def fill():
+            while len(pending) < workers * PENDING_PER_WORKER:
+                source = next(remaining, None)
+                if source is None:
+                    return
+                pending.append((source[0], executor.submit(_parse_source, source)))
+
+        fill()
+        while pending:
+            name, future = pending.popleft()
+            parsed, error = future.result()
+            fill()
+
+            if error is None and not parsed["responses"]:
+                error = "No answered questions found"
+            progress.advance(failed=error is not None)
+
+            if error is not None:
+                # Keep source order: records parsed before this one go out first
+                yield from score(chunk)
+                chunk = []
+                yield {"file": name, "error": error}
+                continue
+
+            chunk.append((name, parsed))
+            if len(chunk) >= SCORING_CHUNK:
+                yield from score(chunk)
+                chunk = []
+
+        yield from score(chunk)
+
+    progress.finished = time.monotonic()
+
+
+def _csv_row(record: Dict) -> Dict:
+    if "error" in record:
+        return {"file": record["file"], "error": record["error"]}
+
+    lang = record["lang"]
+    score_data = record["score"]
+    app_info = record["app_info"]
+    return {
+        "file": record["file"],
+        "name": app_info.get("name", ""),
+        "environment": app_info.get("environment", ""),
+        "owner": app_info.get("owner", ""),
+        "lang": lang,
+        "percentage": score_data["percentage"],
+        "risk_level": score_data["risk_level"][lang],
+        "audit_recommendation": score_data["audit_recommendation"][lang],
+        "answered": len(record["responses"]),
+        "recommendations": len(record["recommendations"]),
+        "issues": len(record["issues"])
+    }
+
+
+def write_results(records: Iterator[Dict], output: TextIO, fmt: str = FORMAT_NDJSON) -> Iterator[Dict]:
+    """Write each record to output as it passes, yielding the successfully scored ones"""
+    if fmt == FORMAT_CSV:
+        writer = csv.DictWriter(output, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        write = lambda record: writer.writerow(_csv_row(record))  # noqa: E731
+    elif fmt == FORMAT_NDJSON:
+        write = lambda record: output.write(json.dumps(record, ensure_ascii=False) + "\n")  # noqa: E731
+    else:
+        raise ValueError(f"Unknown output format '{fmt}'. Use one of {', '.join(FORMATS)}")
+
+    for record in records:
+        write(record)
+        if "error" not in record:
+            yield record
+
+
+def run_bulk_import(model, source, results_path, workbook_path=None, fmt: str = FORMAT_NDJSON,
+                    lang: Optional[str] = None, workers: Optional[int] = None,
+                    engine: str = ENGINE_NATIVE, progress: Optional[BulkProgress] = None,
+                    excel_service: Optional[ExcelExportService] = None) -> BulkProgress:
+    """
+    Ingest a ZIP archive or directory into a results file and a portfolio workbook
+
+    Args:
+        model: QuestionnaireModel to score with
+        source: ZIP archive or directory of completed questionnaires
+        results_path: NDJSON or CSV output
+        workbook_path: Portfolio workbook output, None to skip it
+        fmt: One of FORMATS
+        lang: Language of the results, defaults to each file's (and French
+            for the portfolio)
+        workers: Parser processes (defaults to the CPU count)
+        engine: Rendering engine of the portfolio workbook
+        progress: Updated as files are processed
+        excel_service: Export service of model's bank
+
+    Returns:
+        Final progress counters
+    """
+    progress = progress if progress is not None else BulkProgress()
+
+    try:
+        sources = list_sources(source)
+        progress.total = len(sources)
+
+        with open(results_path, "w", encoding="utf-8", newline="") as output:
+            scored = write_results(ingest(model, sources, workers, lang, progress), output, fmt)
+
+            if workbook_path is None:
+                for _ in scored:
+                    pass
+            else:
+                wb = render_portfolio_report(model, scored, lang or "fr", engine, excel_service)
+                wb.save(workbook_path)
+    finally:
+        if progress.finished is None:
+            progress.finished = time.monotonic()
+
+    return progress
+
+
+class BulkQueueFull(Exception):
+    """Raised when too many bulk imports are already waiting"""
+
+
+class BulkImportJob:
+    """One uploaded archive, its progress and, once finished, its output files"""
+
+    def __init__(self, fmt: str, lang: Optional[str]):
+        self.id = uuid.uuid4().hex
+        self.fmt = fmt
+        self.lang = lang
+        self.workdir = Path(tempfile.mkdtemp(prefix="bulk_import_"))
+        self.source_path = self.workdir / "source.zip"
+        self.results_path = self.workdir / f"results.{fmt}"
+        self.workbook_path = self.workdir / "portfolio.xlsx"
+        self.progress = BulkProgress()
+        self.future = None
+        self.created_at = time.time()
+        self.finished_at = None
+
+    @property
+    def status(self) -> str:
+        if not self.future.done():
+            return "running" if self.future.running() else "queued"
+        # exception() raises CancelledError on a cancelled future
+        if self.future.cancelled():
+            return "cancelled"
+        return "failed" if self.future.exception() is not None else "done"
+
+    def to_dict(self) -> Dict:
+        data = {
+            "job_id": self.id,
+            "status": self.status,
+            "format": self.fmt,
+            "progress": self.progress.to_dict(),
+            "created_at": self.created_at,
+            "finished_at": self.finished_at
+        }
+        if data["status"] == "failed":
+            data["error"] = str(self.future.exception())
+        return data
+
+
+class BulkImportManager:
+    """
+    Runs bulk imports one after the other, off the request workers
+
+    Each import parses its archive with its own process pool of workers
+    processes. At most max_pending imports may be queued or running; submit()
+    raises BulkQueueFull beyond that. Finished jobs and their files are kept
+    for result_ttl seconds.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: int = 4, result_ttl: float = 3600,
+                 engine: str = ENGINE_NATIVE):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.engine = engine
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bulk-import")
+        return self._executor
+
+    def submit(self, model, excel_service: ExcelExportService, save_source: Callable[[Path], None],
+               fmt: str = FORMAT_NDJSON, lang: Optional[str] = None) -> BulkImportJob:
+        """
+        Store an archive with save_source(path) and queue its import
+
+        Raises:
+            BulkQueueFull: if max_pending imports are already queued or running
+        """
+        # Don't store an upload that would be rejected anyway
+        with self._lock:
+            self._check_pending()
+
+        # Large uploads are written outside the lock, so status polls never wait on them
+        job = BulkImportJob(fmt, lang)
+        try:
+            save_source(job.source_path)
+            with self._lock:
+                self._check_pending()
+                job.future = self._get_executor().submit(
+                    run_bulk_import, model, job.source_path, job.results_path, job.workbook_path, fmt, lang,
+                    self.workers, self.engine, job.progress, excel_service
+                )
+                self._jobs[job.id] = job
+        except BaseException:
+            shutil.rmtree(job.workdir, ignore_errors=True)
+            raise
+
+        job.future.add_done_callback(lambda _: self._mark_finished(job))
+        return job
+
+    def _check_pending(self):
+        """Raise BulkQueueFull if max_pending imports are pending; caller holds the lock"""
+        self._expire()
+        pending = sum(1 for job in self._jobs.values() if not job.future.done())
+        if pending >= self.max_pending:
+            raise BulkQueueFull(f"{pending} bulk imports already pending")
+
+    def _mark_finished(self, job: BulkImportJob):
+        job.finished_at = time.time()
+        # The archive is not needed once ingested
+        try:
+            job.source_path.unlink()
+        except OSError:
+            pass
+
+    def get(self, job_id: str) -> Optional[BulkImportJob]:
+        """Job by id, or None if unknown or expired"""
+        with self._lock:
+            self._expire()
+            return self._jobs.get(job_id)
+
+    def _expire(self):
+        """Drop finished jobs older than result_ttl with their files; caller holds the lock"""
+        cutoff = time.time() - self.result_ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            shutil.rmtree(self._jobs.pop(job_id).workdir, ignore_errors=True)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+def _print_progress(stream: TextIO, interval: float = 1.0) -> Callable[[BulkProgress], None]:
+    """Progress callback printing the counters at most once per interval"""
+    last = [0.0]
+
+    def report(progress: BulkProgress):
+        now = time.monotonic()
+        if now - last[0] >= interval or progress.processed == progress.total:
+            last[0] = now
+            stream.write(f"\r{progress.processed}/{progress.total} files, {progress.failed} failed, "
+                         f"{progress.files_per_second:.1f} files/s")
+            stream.flush()
+
+    return report
+
+
+def main(argv=None) -> int:
+    from models.questionnaire import QuestionnaireModel
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('source', help="ZIP archive or directory of completed questionnaires")
+    parser.add_argument('-o', '--output', required=True, help="Results file")
+    parser.add_argument('--format', choices=FORMATS, default=FORMAT_NDJSON)
+    parser.add_argument('--workbook', help="Portfolio workbook to write")
+    parser.add_argument('--lang', choices=['fr', 'en'], help="Language of the results")
+    parser.add_argument('--workers', type=int, help="Parser processes (default: CPU count)")
+    parser.add_argument('--engine', choices=ENGINES, default=ENGINE_NATIVE,
+                        help="Portfolio workbook rendering engine")
+    args = parser.parse_args(argv)
+
+    model = QuestionnaireModel()
+    progress = BulkProgress(on_update=_print_progress(sys.stderr))
+
+    try:
+        run_bulk_import(model, args.source, args.output, args.workbook, args.format, args.lang,
+                        args.workers, args.engine, progress)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(file=sys.stderr)
+    print(f"{progress.processed} files ({progress.failed} failed) in {progress.elapsed:.1f}s, "
+          f"{progress.files_per_second:.1f} files/s -> {args.output}"
+          + (f", {args.workbook}" if args.workbook else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,314 @@
+import json
+import logging
+import secrets
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / "data" / "drafts.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS drafts (
+    token TEXT PRIMARY KEY,
+    lang TEXT NOT NULL,
+    app_info TEXT NOT NULL,
+    responses TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS drafts_updated_at ON drafts (updated_at);
+"""
+
+
+class DraftStore:
+    """
+    Autosaved in-progress assessments, in SQLite
+
+    A draft is identified by an unguessable token handed to the client. Its
+    responses and app_info are updated through update(), which only queues
+    the change: a background writer coalesces the queued changes of all
+    drafts and writes them in one transaction once no new change came in for
+    debounce seconds (or max_delay seconds after the oldest one), so a burst
+    of answer clicks costs a single write. Responses are merged in SQL with
+    json_patch. get() reads a draft by primary key and applies the changes
+    not written yet, so reads always see the latest answers.
+
+    The database runs in WAL mode: readers, one connection per thread, never
+    wait for the writer. It is opened on first use, so an unwritable path
+    only fails the draft calls. The writer also deletes drafts left
+    untouched for max_age seconds, every purge_interval seconds.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, debounce: float = 0.5, max_delay: float = 5.0,
+                 max_age: Optional[float] = 30 * 86400, purge_interval: float = 3600):
+        """
+        Args:
+            path: SQLite database file, created if needed
+            debounce: Quiet period before queued changes are written
+            max_delay: Longest time a change may stay queued
+            max_age: Age after which an untouched draft is purged (None keeps drafts)
+            purge_interval: Time between purges
+        """
+        self.path = Path(path)
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.max_age = max_age
+        self.purge_interval = purge_interval
+
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+        self._pending = {}
+        self._writing = {}
+        self._first_change = None
+        self._last_change = None
+        self._next_purge = time.monotonic() + purge_interval if max_age is not None else float("inf")
+        self._flush_requested = False
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self.writes = 0
+        self.coalesced = 0
+
+        self._writer = threading.Thread(target=self._run_writer, name="draft-writer", daemon=True)
+        self._writer.start()
+
+    def _connection(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                pass  # Reported by connect below
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    db.executescript(SCHEMA)
+                    self._schema_ready = True
+        return db
+
+    def create(self, responses: Optional[Dict[str, int]] = None, app_info: Optional[Dict] = None,
+               lang: str = "fr") -> str:
+        """Store a new draft right away and return its token"""
+        token = secrets.token_urlsafe(16)
+        now = time.time()
+        self._connection().execute(
+            "INSERT INTO drafts (token, lang, app_info, responses, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (token, lang, json.dumps(app_info or {}, ensure_ascii=False),
+             json.dumps(responses or {}), now, now)
+        )
+        return token
+
+    def get(self, token: str) -> Optional[Dict]:
+        """
+        Draft by token, including the changes not written yet
+
+        Returns:
+            Dictionary with responses, app_info, lang, created_at and
+            updated_at, or None for an unknown token
+        """
+        # Changes are merge patches, so one committed while this read runs
+        # is harmlessly applied twice
+        with self._condition:
+            changes = [
+                self._copy(change)
+                for change in (self._writing.get(token), self._pending.get(token))
+                if change is not None
+            ]
+
+        row = self._connection().execute(
+            "SELECT lang, app_info, responses, created_at, updated_at FROM drafts WHERE token = ?",
+            (token,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        lang, app_info, responses, created_at, updated_at = row
+        draft = {
+            "responses": json.loads(responses),
+            "app_info": json.loads(app_info),
+            "lang": lang,
+            "created_at": created_at,
+            "updated_at": updated_at
+        }
+        for change in changes:
+            self._apply(draft, change)
+        return draft
+
+    def exists(self, token: str) -> bool:
+        return self._connection().execute(
+            "SELECT 1 FROM drafts WHERE token = ?", (token,)
+        ).fetchone() is not None
+
+    def update(self, token: str, responses: Optional[Dict[str, int]] = None, removed: Iterable[str] = (),
+               app_info: Optional[Dict] = None, lang: Optional[str] = None):
+        """
+        Queue a change to a draft
+
+        Args:
+            token: Draft token
+            responses: Answers set or changed since the last update
+            removed: Question ids whose answer was cleared
+            app_info: app_info fields set or changed
+            lang: New language
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Draft store is closed")
+
+            change = self._pending.get(token)
+            if change is None:
+                change = self._pending[token] = {"responses": {}, "app_info": {}, "lang": None}
+            else:
+                self.coalesced += 1
+
+            # A merge patch: None removes the answer
+            change["responses"].update(responses or {})
+            change["responses"].update(dict.fromkeys(removed))
+            change["app_info"].update(app_info or {})
+            if lang is not None:
+                change["lang"] = lang
+
+            now = time.monotonic()
+            if self._first_change is None:
+                self._first_change = now
+            self._last_change = now
+            self._condition.notify_all()
+
+    @staticmethod
+    def _copy(change: Dict) -> Dict:
+        return {"responses": dict(change["responses"]), "app_info": dict(change["app_info"]),
+                "lang": change["lang"]}
+
+    @staticmethod
+    def _apply(draft: Dict, change: Dict):
+        for question_id, value in change["responses"].items():
+            if value is None:
+                draft["responses"].pop(question_id, None)
+            else:
+                draft["responses"][question_id] = value
+        draft["app_info"].update(change["app_info"])
+        if change["lang"] is not None:
+            draft["lang"] = change["lang"]
+
+    def delete(self, token: str) -> bool:
+        """Drop a draft, e.g. once the assessment is submitted"""
+        with self._condition:
+            self._pending.pop(token, None)
+            self._writing.pop(token, None)
+        return self._connection().execute("DELETE FROM drafts WHERE token = ?", (token,)).rowcount > 0
+
+    def purge(self, max_age: float) -> int:
+        """Delete drafts not updated for max_age seconds; returns how many"""
+        return self._connection().execute(
+            "DELETE FROM drafts WHERE updated_at < ?", (time.time() - max_age,)
+        ).rowcount
+
+    def _next_due(self) -> float:
+        """Monotonic time of the next write or purge; caller holds the lock"""
+        due = self._next_purge
+        if self._flush_requested:
+            return float("-inf")
+        if self._pending:
+            # Wait for the burst of changes to settle, but not forever
+            due = min(due, self._last_change + self.debounce, self._first_change + self.max_delay)
+        return due
+
+    def _run_writer(self):
+        while True:
+            with self._condition:
+                # Recomputed on every wake up: changes, flush() or a write may have come in meanwhile
+                while not self._closed:
+                    wait = self._next_due() - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._condition.wait(wait)
+
+                purge = not self._closed and time.monotonic() >= self._next_purge
+                if purge:
+                    self._next_purge = time.monotonic() + self.purge_interval
+                pending = self._take_pending() if self._pending else {}
+                self._flush_requested = False
+                closed = self._closed
+
+            if pending:
+                try:
+                    self._write(pending)
+                except Exception:
+                    # Keep autosaving later changes; these are still in the client's state
+                    logger.exception("Could not write %d draft(s)", len(pending))
+            if purge:
+                try:
+                    self.purge(self.max_age)
+                except Exception:
+                    logger.exception("Could not purge drafts older than %ss", self.max_age)
+            if closed:
+                return
+
+    def _take_pending(self) -> Dict[str, Dict]:
+        """Hand the queued changes over to a write; caller holds the lock"""
+        pending, self._pending = self._pending, {}
+        self._first_change = self._last_change = None
+        self._writing.update(pending)
+        return pending
+
+    def _write(self, pending: Dict[str, Dict]):
+        db = self._connection()
+        now = time.time()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.executemany(
+                "UPDATE drafts SET responses = json_patch(responses, ?), "
+                "app_info = json_patch(app_info, ?), lang = coalesce(?, lang), updated_at = ? "
+                "WHERE token = ?",
+                [
+                    (json.dumps(change["responses"]), json.dumps(change["app_info"], ensure_ascii=False),
+                     change["lang"], now, token)
+                    for token, change in pending.items()
+                ]
+            )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        finally:
+            with self._condition:
+                for token in pending:
+                    if self._writing.get(token) is pending[token]:
+                        del self._writing[token]
+                self._condition.notify_all()
+        self.writes += 1
+
+    def flush(self):
+        """
+        Have the writer write the queued changes now, and wait for it
+
+        Writes stay on the writer thread so they are committed in queue order.
+        """
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            while (self._pending or self._writing) and self._writer.is_alive():
+                self._condition.wait(1.0)
+
+    def close(self):
+        """Write the queued changes and stop the writer"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._writer.join()
+
+    def stats(self) -> Dict:
+        with self._condition:
+            pending = len(self._pending)
+        return {"pending": pending, "writes": self.writes, "coalesced": self.coalesced}
@@ -1,31 +1,248 @@
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, NamedStyle, Side
+from openpyxl.styles.borders import DEFAULT_BORDER
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
 from datetime import datetime
-from typing import Dict, Optional
+from tempfile import SpooledTemporaryFile
+from typing import Dict, Iterable, Optional, Union
+import io
 import json
 
+from .xlsx_writer import SharedStrings, XlsxWorkbook
+
+# Workbooks larger than this are spooled to a temporary file instead of memory
+SPOOL_MAX_MEMORY = 1024 * 1024
+
+# Rendering engines: openpyxl's regular workbook (editable after creation),
+# its write-only workbook (rows streamed to disk), or the native XLSX writer
+ENGINE_OPENPYXL = "openpyxl"
+ENGINE_WRITE_ONLY = "write_only"
+ENGINE_NATIVE = "native"
+ENGINES = (ENGINE_OPENPYXL, ENGINE_WRITE_ONLY, ENGINE_NATIVE)
+
+# Layout of the questionnaire template, also read back by the importer
+INFO_SHEET_TITLES = {"fr": "Informations", "en": "Information"}
+INFO_LABELS = {
+    "fr": {
+        "app_name": "Nom de l'application:",
+        "date": "Date:",
+        "owner": "Propriétaire:",
+        "contact": "Contact:",
+        "environment": "Environnement:",
+        "description": "Description:"
+    },
+    "en": {
+        "app_name": "Application Name:",
+        "date": "Date:",
+        "owner": "Owner:",
+        "contact": "Contact:",
+        "environment": "Environment:",
+        "description": "Description:"
+    }
+}
+QUESTIONNAIRE_SHEET_TITLE = "Questionnaire"
+QUESTIONNAIRE_HEADERS = {
+    "fr": ["Catégorie", "Question", "Réponse", "Standards"],
+    "en": ["Category", "Question", "Answer", "Standards"]
+}
+
+
+class ExcelStyleRegistry:
+    """
+    Named cell styles shared by every sheet of the exported workbooks
+
+    The styles are built once per service and registered on each new workbook,
+    after which cells reference them by name. Row loops then only copy a style
+    index instead of assigning fonts, fills and borders cell by cell, and
+    styles.xml holds one entry per style rather than one per combination.
+    """
+
+    TITLE = "Assessment Title"
+    SUBTITLE = "Assessment Subtitle"
+    SECTION = "Assessment Section"
+    LABEL = "Assessment Label"
+    BODY = "Assessment Body"
+    WRAPPED_BODY = "Assessment Wrapped Body"
+    HEADER = "Assessment Header"
+    CATEGORY = "Assessment Category"
+    CELL = "Assessment Cell"
+    WRAPPED_CELL = "Assessment Wrapped Cell"
+    SEVERITY_HIGH = "Assessment Severity High"
+    SEVERITY_MEDIUM = "Assessment Severity Medium"
+
+    # Label colors of the risk levels (RISK_LEVELS in the questionnaire model), by level code
+    RISK_LEVEL_COLORS = {"LOW": "10b981", "MEDIUM": "f59e0b", "HIGH": "ef4444", "CRITICAL": "dc2626"}
+
+    def __init__(self):
+        border = Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin')
+        )
+        wrapped = Alignment(wrap_text=True, vertical="top")
+        body_font = DEFAULT_FONT
+        bold_font = Font(name="Calibri", size=11, bold=True)
+
+        self.styles = (
+            self._style(self.TITLE, font=Font(name="Calibri", size=16, bold=True, color="1F4E78")),
+            self._style(self.SUBTITLE, font=Font(name="Calibri", size=14, bold=True, color="1F4E78")),
+            self._style(self.SECTION, font=Font(name="Calibri", size=12, bold=True)),
+            self._style(self.LABEL, font=bold_font),
+            self._style(self.BODY, font=body_font),
+            self._style(self.WRAPPED_BODY, font=body_font, alignment=wrapped),
+            self._style(
+                self.HEADER,
+                font=Font(name="Calibri", size=11, bold=True, color="FFFFFF"),
+                fill=PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid"),
+                alignment=Alignment(horizontal="center", vertical="center"),
+                border=border
+            ),
+            self._style(
+                self.CATEGORY,
+                font=bold_font,
+                fill=PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+            ),
+            self._style(self.CELL, font=body_font, border=border),
+            self._style(self.WRAPPED_CELL, font=body_font, alignment=wrapped, border=border),
+            self._style(self.SEVERITY_HIGH, font=Font(name="Calibri", size=11, color="ef4444", bold=True)),
+            self._style(self.SEVERITY_MEDIUM, font=Font(name="Calibri", size=11, color="f59e0b", bold=True)),
+            *(
+                self._style(self._risk_style_name(level), font=Font(name="Calibri", size=11, color=color, bold=True))
+                for level, color in self.RISK_LEVEL_COLORS.items()
+            ),
+        )
+
+    @staticmethod
+    def _style(name: str, font: Font, fill: PatternFill = None, alignment: Alignment = None,
+               border: Border = DEFAULT_BORDER) -> NamedStyle:
+        # Unbordered styles reuse the workbook's default border entry
+        return NamedStyle(name, font=font, fill=fill, alignment=alignment, border=border)
+
+    def register(self, wb: Workbook):
+        """Add every style to a new workbook"""
+        # A NamedStyle binds to the workbook it is added to, so each workbook
+        # gets its own instance; the font, fill and border objects are shared
+        for style in self.styles:
+            wb.add_named_style(NamedStyle(
+                style.name,
+                font=style.font,
+                fill=style.fill,
+                border=style.border,
+                alignment=style.alignment
+            ))
+
+    def severity(self, severity: str) -> str:
+        """Style name for a recommendation severity"""
+        return self.SEVERITY_HIGH if severity == "high" else self.SEVERITY_MEDIUM
+
+    @staticmethod
+    def _risk_style_name(level: str) -> str:
+        return f"Assessment Risk {level.title()}"
+
+    def risk_level(self, risk_level: Dict) -> Union[str, Dict]:
+        """Style for a risk level label; levels without a registered style get a one-off font"""
+        if risk_level["level"] in self.RISK_LEVEL_COLORS:
+            return self._risk_style_name(risk_level["level"])
+        return {"font": Font(bold=True, color=risk_level["color"].replace("#", ""))}
+
+
+class _SheetWriter:
+    """
+    Emits a worksheet row by row, into a regular or a write-only workbook
+
+    Write-only worksheets stream rows to disk as they are appended, so column
+    widths and freeze panes are set up front and each row height is given
+    with its row. Cells are plain values or (value, style) pairs where style
+    is a registered named style, or for one-off cells a mapping of cell
+    attributes (font, fill, ...) to style objects.
+    """
+
+    def __init__(self, wb: Workbook, title: str, widths: Dict[str, float],
+                 freeze: Optional[str] = None, index: Optional[int] = None):
+        self.ws = wb.create_sheet(title, index)
+        self.write_only = wb.write_only
+        self.row = 0
+
+        for column, width in widths.items():
+            self.ws.column_dimensions[column].width = width
+        if freeze:
+            self.ws.freeze_panes = freeze
+
+    def append(self, *cells, height: Optional[float] = None) -> int:
+        """Write the next row and return its index"""
+        self.row += 1
+        if height is not None:
+            self.ws.row_dimensions[self.row].height = height
+
+        if self.write_only:
+            self.ws.append([self._write_only_cell(cell) for cell in cells])
+        else:
+            for column, cell in enumerate(cells, start=1):
+                value, style = cell if isinstance(cell, tuple) else (cell, None)
+                target = self.ws.cell(row=self.row, column=column, value=value)
+                if style:
+                    self._apply_style(target, style)
+
+        return self.row
+
+    def skip(self, count: int = 1):
+        """Leave blank rows"""
+        if self.write_only:
+            for _ in range(count):
+                self.ws.append([])
+        self.row += count
+
+    def merge(self, cell_range: str):
+        """Merge a range whose top-left cell has already been written"""
+        if self.write_only:
+            self.ws.merged_cells.add(cell_range)
+        else:
+            self.ws.merge_cells(cell_range)
+
+    def _write_only_cell(self, cell):
+        value, style = cell if isinstance(cell, tuple) else (cell, None)
+        target = WriteOnlyCell(self.ws, value=value)
+        if style:
+            self._apply_style(target, style)
+        return target
+
+    @staticmethod
+    def _apply_style(cell, style):
+        if isinstance(style, str):
+            cell.style = style
+            return
+        for attribute, value in style.items():
+            setattr(cell, attribute, value)
+
 
 class ExcelExportService:
-    def __init__(self, questions_data: Dict):
-        self.questions_data = questions_data
+    def __init__(self, bank):
+        """
+        Args:
+            bank: QuestionBank the exported questionnaires are built from
+        """
+        self.bank = bank
+        self.styles = ExcelStyleRegistry()
+        self._shared_strings = {}
 
-    def create_questionnaire_template(self, lang: str = "fr", app_name: str = None) -> Workbook:
+    def create_questionnaire_template(self, lang: str = "fr", app_name: str = None,
+                                      engine: str = ENGINE_OPENPYXL) -> Union[Workbook, XlsxWorkbook]:
         """
         Create an Excel template for the questionnaire
 
         Args:
             lang: Language code (fr or en)
             app_name: Optional application name
+            engine: One of ENGINES; write_only and native keep memory flat
+                on large banks but their workbooks can only be saved once
 
         Returns:
             Workbook object
         """
-        wb = Workbook()
-
-        # Remove default sheet
-        if "Sheet" in wb.sheetnames:
-            wb.remove(wb["Sheet"])
+        wb = self._new_workbook(engine, lang)
 
         # Create sheets
         self._create_info_sheet(wb, lang, app_name)
@@ -36,7 +253,8 @@ class ExcelExportService:
 
     def create_results_report(self, responses: Dict, score_data: Dict,
                              recommendations: list, lang: str = "fr",
-                             app_info: Dict = None) -> Workbook:
+                             app_info: Dict = None,
+                             engine: str = ENGINE_OPENPYXL) -> Union[Workbook, XlsxWorkbook]:
         """
         Create an Excel report with results and analysis
 
@@ -46,14 +264,13 @@ class ExcelExportService:
             recommendations: List of recommendations
             lang: Language code
             app_info: Application information
+            engine: One of ENGINES; write_only and native keep memory flat
+                on large banks but their workbooks can only be saved once
 
         Returns:
             Workbook object
         """
-        wb = Workbook()
-
-        if "Sheet" in wb.sheetnames:
-            wb.remove(wb["Sheet"])
+        wb = self._new_workbook(engine, lang)
 
         # Create sheets
         self._create_summary_sheet(wb, score_data, lang, app_info)
@@ -62,143 +279,137 @@ class ExcelExportService:
 
         return wb
 
+    def create_portfolio_report(self, assessments: Iterable[Dict], lang: str = "fr",
+                                engine: str = ENGINE_OPENPYXL) -> Union[Workbook, XlsxWorkbook]:
+        """
+        Create one Excel report covering many applications
+
+        A summary sheet gets one row per application (overall and per
+        category percentages, risk level) and a recommendations sheet the
+        recommendations of all of them. Both are filled in a single pass:
+        recommendation rows are set aside in a spooled file while the summary
+        is written, then replayed.
+
+        Args:
+            assessments: Dicts with the app_info, score (as calculate_score)
+                and recommendations (as get_recommendations, in lang) of each
+                application, consumed once as rows are written
+            lang: Language code
+            engine: One of ENGINES; with write_only or native, memory stays
+                flat however many applications are reported
+
+        Returns:
+            Workbook object
+        """
+        wb = self._new_workbook(engine, lang)
+
+        with SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY, mode="w+", encoding="utf-8") as pending:
+            self._create_portfolio_summary_sheet(wb, assessments, lang, pending)
+            pending.seek(0)
+            self._create_portfolio_recommendations_sheet(wb, (json.loads(line) for line in pending), lang)
+
+        return wb
+
+    def _new_workbook(self, engine: str, lang: str) -> Union[Workbook, XlsxWorkbook]:
+        """Empty workbook for an engine, with the named styles registered"""
+        if engine == ENGINE_NATIVE:
+            return XlsxWorkbook(self._language_strings(lang), self.styles.register)
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown export engine '{engine}'. Use one of {', '.join(ENGINES)}")
+
+        wb = Workbook(write_only=engine == ENGINE_WRITE_ONLY)
+        self.styles.register(wb)
+
+        # Remove default sheet
+        if "Sheet" in wb.sheetnames:
+            wb.remove(wb["Sheet"])
+
+        return wb
+
+    def _language_strings(self, lang: str) -> SharedStrings:
+        """Shared strings of the bank in one language, for the native engine"""
+        strings = self._shared_strings.get(lang)
+        if strings is None:
+            texts = []
+            for category in self.bank.categories:
+                texts.append(category.name[lang])
+                for question in category.questions:
+                    texts.append(question.text[lang])
+                    texts.append(", ".join(question.standards))
+                    texts.extend(option.label[lang] for option in question.options)
+            strings = self._shared_strings[lang] = SharedStrings(texts)
+        return strings
+
+    @staticmethod
+    def _new_sheet(wb, title: str, widths: Dict[str, float], freeze: Optional[str] = None,
+                   index: Optional[int] = None):
+        """Row writer for a new sheet of any engine's workbook"""
+        if isinstance(wb, XlsxWorkbook):
+            return wb.create_sheet(title, widths, freeze=freeze, index=index)
+        return _SheetWriter(wb, title, widths, freeze=freeze, index=index)
+
     def _create_info_sheet(self, wb: Workbook, lang: str, app_name: Optional[str]):
         """Create information sheet"""
-        ws = wb.create_sheet("Information" if lang == "en" else "Informations")
-
-        # Title styling
-        title_font = Font(name="Calibri", size=16, bold=True, color="1F4E78")
-        header_font = Font(name="Calibri", size=11, bold=True)
-        normal_font = Font(name="Calibri", size=11)
+        sheet = self._new_sheet(wb, INFO_SHEET_TITLES[lang], {"A": 25, "B": 50})
+        styles = self.styles
 
         # Title
-        ws["A1"] = "Application Security Assessment Questionnaire" if lang == "en" else "Questionnaire d'Évaluation de la Sécurité Applicative"
-        ws["A1"].font = title_font
-        ws.merge_cells("A1:B1")
+        title = "Application Security Assessment Questionnaire" if lang == "en" else "Questionnaire d'Évaluation de la Sécurité Applicative"
+        sheet.append((title, styles.TITLE))
+        sheet.merge("A1:B1")
+        sheet.skip()
 
         # Application info section
-        row = 3
-        labels = {
-            "fr": {
-                "app_name": "Nom de l'application:",
-                "date": "Date:",
-                "owner": "Propriétaire:",
-                "contact": "Contact:",
-                "environment": "Environnement:",
-                "description": "Description:"
-            },
-            "en": {
-                "app_name": "Application Name:",
-                "date": "Date:",
-                "owner": "Owner:",
-                "contact": "Contact:",
-                "environment": "Environment:",
-                "description": "Description:"
-            }
-        }
-
-        for key, label in labels[lang].items():
-            ws[f"A{row}"] = label
-            ws[f"A{row}"].font = header_font
+        for key, label in INFO_LABELS[lang].items():
+            value = None
             if key == "app_name" and app_name:
-                ws[f"B{row}"] = app_name
+                value = app_name
             elif key == "date":
-                ws[f"B{row}"] = datetime.now().strftime("%Y-%m-%d")
-            ws[f"B{row}"].font = normal_font
-            row += 1
+                value = datetime.now().strftime("%Y-%m-%d")
+            sheet.append((label, styles.LABEL), (value, styles.BODY))
 
         # Instructions
-        row += 2
+        sheet.skip(2)
         instructions = {
             "fr": "Instructions:\n1. Remplissez les informations de l'application ci-dessus\n2. Accédez à l'onglet 'Questionnaire' pour répondre aux questions\n3. Sélectionnez la réponse la plus appropriée pour chaque question\n4. Retournez ce fichier complété pour analyse",
             "en": "Instructions:\n1. Fill in the application information above\n2. Go to the 'Questionnaire' tab to answer questions\n3. Select the most appropriate answer for each question\n4. Return this completed file for analysis"
         }
 
-        ws[f"A{row}"] = instructions[lang]
-        ws[f"A{row}"].font = normal_font
-        ws[f"A{row}"].alignment = Alignment(wrap_text=True, vertical="top")
-        ws.merge_cells(f"A{row}:B{row + 5}")
-        ws.row_dimensions[row].height = 100
-
-        # Adjust column widths
-        ws.column_dimensions["A"].width = 25
-        ws.column_dimensions["B"].width = 50
+        row = sheet.append((instructions[lang], styles.WRAPPED_BODY), height=100)
+        sheet.merge(f"A{row}:B{row + 5}")
 
     def _create_questionnaire_sheet(self, wb: Workbook, lang: str):
         """Create main questionnaire sheet"""
-        ws = wb.create_sheet("Questionnaire")
+        sheet = self._new_sheet(wb, QUESTIONNAIRE_SHEET_TITLE, {"A": 30, "B": 60, "C": 30, "D": 25}, freeze="A2")
 
-        # Headers
-        headers = {
-            "fr": ["Catégorie", "Question", "Réponse", "Standards"],
-            "en": ["Category", "Question", "Answer", "Standards"]
-        }
-
-        # Styling
-        header_fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
-        header_font = Font(name="Calibri", size=11, bold=True, color="FFFFFF")
-        category_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-        category_font = Font(name="Calibri", size=11, bold=True)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        styles = self.styles
 
         # Write headers
-        for col, header in enumerate(headers[lang], start=1):
-            cell = ws.cell(row=1, column=col)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            cell.border = border
-
-        row = 2
-        for category in self.questions_data["categories"]:
-            # Category header
-            ws.cell(row=row, column=1, value=category["name"][lang])
-            ws.cell(row=row, column=1).font = category_font
-            ws.cell(row=row, column=1).fill = category_fill
-            ws.merge_cells(f"A{row}:D{row}")
-            row += 1
-
-            # Questions
-            for question in category["questions"]:
-                ws.cell(row=row, column=1, value=category["name"][lang])
-                ws.cell(row=row, column=2, value=question["text"][lang])
-                ws.cell(row=row, column=2).alignment = Alignment(wrap_text=True, vertical="top")
-
-                # Create dropdown for answers
-                options_text = "\n".join([f"{opt['label'][lang]}" for opt in question["options"]])
-                ws.cell(row=row, column=3, value="")
-
-                # Standards
-                standards = ", ".join(question["standard"])
-                ws.cell(row=row, column=4, value=standards)
-
-                # Apply borders
-                for col in range(1, 5):
-                    ws.cell(row=row, column=col).border = border
-
-                ws.row_dimensions[row].height = max(30, len(question["text"][lang]) / 2)
-                row += 1
-
-            row += 1  # Empty row between categories
+        sheet.append(*((header, styles.HEADER) for header in QUESTIONNAIRE_HEADERS[lang]))
 
-        # Adjust column widths
-        ws.column_dimensions["A"].width = 30
-        ws.column_dimensions["B"].width = 60
-        ws.column_dimensions["C"].width = 30
-        ws.column_dimensions["D"].width = 25
+        for category in self.bank.categories:
+            category_name = category.name[lang]
 
-        # Freeze panes
-        ws.freeze_panes = "A2"
+            # Category header
+            row = sheet.append((category_name, styles.CATEGORY))
+            sheet.merge(f"A{row}:D{row}")
+
+            # Questions; the answer column is left blank for the respondent
+            for question in category.questions:
+                question_text = question.text[lang]
+                sheet.append(
+                    (category_name, styles.CELL),
+                    (question_text, styles.WRAPPED_CELL),
+                    ("", styles.CELL),
+                    (", ".join(question.standards), styles.CELL),
+                    height=max(30, len(question_text) / 2)
+                )
+
+            sheet.skip()  # Empty row between categories
 
     def _create_instructions_sheet(self, wb: Workbook, lang: str):
         """Create instructions sheet"""
-        ws = wb.create_sheet("Instructions")
+        sheet = self._new_sheet(wb, "Instructions", {"A": 80})
 
         instructions_content = {
             "fr": {
@@ -245,179 +456,219 @@ class ExcelExportService:
             }
         }
 
+        styles = self.styles
+
         # Title
-        ws["A1"] = instructions_content[lang]["title"]
-        ws["A1"].font = Font(name="Calibri", size=16, bold=True, color="1F4E78")
-        ws.merge_cells("A1:B1")
+        sheet.append((instructions_content[lang]["title"], styles.TITLE))
+        sheet.merge("A1:B1")
+        sheet.skip()
 
-        row = 3
         for section in instructions_content[lang]["sections"]:
-            ws[f"A{row}"] = section["header"]
-            ws[f"A{row}"].font = Font(name="Calibri", size=12, bold=True)
-            row += 1
-
-            ws[f"A{row}"] = section["content"]
-            ws[f"A{row}"].alignment = Alignment(wrap_text=True, vertical="top")
-            ws.merge_cells(f"A{row}:B{row + 3}")
-            ws.row_dimensions[row].height = 80
-            row += 5
+            sheet.append((section["header"], styles.SECTION))
 
-        ws.column_dimensions["A"].width = 80
+            row = sheet.append((section["content"], styles.WRAPPED_BODY), height=80)
+            sheet.merge(f"A{row}:B{row + 3}")
+            sheet.skip(4)
 
     def _create_summary_sheet(self, wb: Workbook, score_data: Dict, lang: str, app_info: Dict):
         """Create summary results sheet"""
-        ws = wb.create_sheet("Summary" if lang == "en" else "Résumé", 0)
+        sheet = self._new_sheet(wb, "Summary" if lang == "en" else "Résumé",
+                                {"A": 40, "B": 20, "C": 15, "D": 15}, index=0)
+
+        styles = self.styles
+
+        # The large score cell takes the color of the risk level, so it keeps its own font
+        risk_color = score_data['risk_level']['color'].replace('#', '')
 
         # Title
         title = "Security Assessment Summary" if lang == "en" else "Résumé de l'Évaluation de Sécurité"
-        ws["A1"] = title
-        ws["A1"].font = Font(name="Calibri", size=16, bold=True, color="1F4E78")
-        ws.merge_cells("A1:D1")
+        sheet.append((title, styles.TITLE))
+        sheet.merge("A1:D1")
+        sheet.skip()
 
         # Overall score
-        row = 3
-        ws[f"A{row}"] = "Overall Score" if lang == "en" else "Score Global"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-
-        ws[f"B{row}"] = f"{score_data['percentage']}%"
-        ws[f"B{row}"].font = Font(bold=True, size=20, color=score_data['risk_level']['color'].replace('#', ''))
+        sheet.append(
+            ("Overall Score" if lang == "en" else "Score Global", styles.SECTION),
+            (f"{score_data['percentage']}%", {"font": Font(bold=True, size=20, color=risk_color)})
+        )
 
         # Risk level
-        row += 1
-        ws[f"A{row}"] = "Risk Level" if lang == "en" else "Niveau de Risque"
-        ws[f"A{row}"].font = Font(bold=True)
-
-        ws[f"B{row}"] = score_data['risk_level'][lang]
-        ws[f"B{row}"].font = Font(bold=True, color=score_data['risk_level']['color'].replace('#', ''))
+        sheet.append(
+            ("Risk Level" if lang == "en" else "Niveau de Risque", styles.LABEL),
+            (score_data['risk_level'][lang], styles.risk_level(score_data['risk_level']))
+        )
 
         # Audit recommendation
-        row += 1
-        ws[f"A{row}"] = "Recommendation" if lang == "en" else "Recommandation"
-        ws[f"A{row}"].font = Font(bold=True)
-
-        ws[f"B{row}"] = score_data['audit_recommendation'][lang]
-        ws[f"B{row}"].font = Font(bold=True)
+        sheet.append(
+            ("Recommendation" if lang == "en" else "Recommandation", styles.LABEL),
+            (score_data['audit_recommendation'][lang], styles.LABEL)
+        )
 
         # Category breakdown
-        row += 3
-        ws[f"A{row}"] = "Category Breakdown" if lang == "en" else "Détail par Catégorie"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-        row += 1
+        sheet.skip(2)
+        sheet.append(("Category Breakdown" if lang == "en" else "Détail par Catégorie", styles.SECTION))
 
         # Headers for category table
         headers = ["Category" if lang == "en" else "Catégorie",
                    "Score",
                    "Percentage" if lang == "en" else "Pourcentage"]
-
-        for col, header in enumerate(headers, start=1):
-            ws.cell(row=row, column=col, value=header)
-            ws.cell(row=row, column=col).font = Font(bold=True)
-            ws.cell(row=row, column=col).fill = PatternFill(start_color="D9E1F2",
-                                                              end_color="D9E1F2",
-                                                              fill_type="solid")
-
-        row += 1
+        sheet.append(*((header, styles.CATEGORY) for header in headers))
 
         # Category data
+        category_names = {cat.id: cat.name[lang] for cat in self.bank.categories}
         for cat_id, cat_score in score_data['category_scores'].items():
-            # Find category name
-            cat_name = ""
-            for cat in self.questions_data["categories"]:
-                if cat["id"] == cat_id:
-                    cat_name = cat["name"][lang]
-                    break
-
-            ws.cell(row=row, column=1, value=cat_name)
-            ws.cell(row=row, column=2, value=f"{cat_score['score']}/{cat_score['max_score']}")
-            ws.cell(row=row, column=3, value=f"{cat_score['percentage']}%")
-            row += 1
-
-        # Adjust column widths
-        ws.column_dimensions["A"].width = 40
-        ws.column_dimensions["B"].width = 20
-        ws.column_dimensions["C"].width = 15
-        ws.column_dimensions["D"].width = 15
+            sheet.append(
+                category_names.get(cat_id, ""),
+                f"{cat_score['score']}/{cat_score['max_score']}",
+                f"{cat_score['percentage']}%"
+            )
 
     def _create_detailed_results_sheet(self, wb: Workbook, responses: Dict, lang: str):
         """Create detailed results sheet"""
-        ws = wb.create_sheet("Detailed Results" if lang == "en" else "Résultats Détaillés")
+        sheet = self._new_sheet(wb, "Detailed Results" if lang == "en" else "Résultats Détaillés",
+                                {"A": 30, "B": 60, "C": 30, "D": 10})
 
         # Headers
         headers = {
             "fr": ["Catégorie", "Question", "Réponse Sélectionnée", "Score"],
             "en": ["Category", "Question", "Selected Answer", "Score"]
         }
+        styles = self.styles
 
-        for col, header in enumerate(headers[lang], start=1):
-            ws.cell(row=1, column=col, value=header)
-            ws.cell(row=1, column=col).font = Font(bold=True)
-            ws.cell(row=1, column=col).fill = PatternFill(start_color="1F4E78",
-                                                           end_color="1F4E78",
-                                                           fill_type="solid")
-            ws.cell(row=1, column=col).font = Font(bold=True, color="FFFFFF")
+        sheet.append(*((header, styles.HEADER) for header in headers[lang]))
 
-        row = 2
-        for category in self.questions_data["categories"]:
-            for question in category["questions"]:
-                if question["id"] in responses:
-                    user_value = responses[question["id"]]
+        for category in self.bank.categories:
+            category_name = category.name[lang]
+            for question in category.questions:
+                if question.id in responses:
+                    user_value = responses[question.id]
 
                     # Find selected option
-                    selected_label = ""
-                    for opt in question["options"]:
-                        if opt["value"] == user_value:
-                            selected_label = opt["label"][lang]
-                            break
-
-                    ws.cell(row=row, column=1, value=category["name"][lang])
-                    ws.cell(row=row, column=2, value=question["text"][lang])
-                    ws.cell(row=row, column=2).alignment = Alignment(wrap_text=True)
-                    ws.cell(row=row, column=3, value=selected_label)
-                    ws.cell(row=row, column=4, value=user_value)
-
-                    row += 1
-
-        # Adjust columns
-        ws.column_dimensions["A"].width = 30
-        ws.column_dimensions["B"].width = 60
-        ws.column_dimensions["C"].width = 30
-        ws.column_dimensions["D"].width = 10
+                    selected_option = question.option_for_value(user_value)
+                    selected_label = selected_option.label[lang] if selected_option else ""
+
+                    sheet.append(category_name, (question.text[lang], styles.WRAPPED_BODY), selected_label, user_value)
 
     def _create_recommendations_sheet(self, wb: Workbook, recommendations: list, lang: str):
         """Create recommendations sheet"""
-        ws = wb.create_sheet("Recommendations" if lang == "en" else "Recommandations")
+        sheet = self._new_sheet(wb, "Recommendations" if lang == "en" else "Recommandations",
+                                {"A": 15, "B": 30, "C": 60, "D": 25})
+
+        styles = self.styles
 
         title = "Improvement Recommendations" if lang == "en" else "Recommandations d'Amélioration"
-        ws["A1"] = title
-        ws["A1"].font = Font(name="Calibri", size=14, bold=True, color="1F4E78")
-        ws.merge_cells("A1:D1")
+        sheet.append((title, styles.SUBTITLE))
+        sheet.merge("A1:D1")
+        sheet.skip()
 
-        row = 3
         headers = {
             "fr": ["Sévérité", "Catégorie", "Question", "Standards"],
             "en": ["Severity", "Category", "Question", "Standards"]
         }
-
-        for col, header in enumerate(headers[lang], start=1):
-            ws.cell(row=row, column=col, value=header)
-            ws.cell(row=row, column=col).font = Font(bold=True)
-
-        row += 1
+        sheet.append(*((header, styles.LABEL) for header in headers[lang]))
 
         for rec in recommendations:
-            severity_color = "ef4444" if rec["severity"] == "high" else "f59e0b"
+            sheet.append(
+                (rec["severity"].upper(), styles.severity(rec["severity"])),
+                rec["category"],
+                (rec["question"], styles.WRAPPED_BODY),
+                ", ".join(rec["standard"])
+            )
+
+    def _create_portfolio_summary_sheet(self, wb: Workbook, assessments: Iterable[Dict], lang: str,
+                                        pending_recommendations):
+        """Create portfolio summary sheet, one row per application"""
+        categories = self.bank.categories
+        widths = {"A": 30, "B": 15, "C": 25, "D": 12, "E": 15, "F": 40}
+        for column in range(len(widths) + 1, len(widths) + len(categories) + 1):
+            widths[get_column_letter(column)] = 18
+        sheet = self._new_sheet(wb, "Portfolio" if lang == "en" else "Portefeuille", widths, freeze="B2")
 
-            ws.cell(row=row, column=1, value=rec["severity"].upper())
-            ws.cell(row=row, column=1).font = Font(color=severity_color, bold=True)
+        headers = {
+            "fr": ["Application", "Environnement", "Propriétaire", "Score (%)", "Niveau de Risque",
+                   "Recommandation"],
+            "en": ["Application", "Environment", "Owner", "Score (%)", "Risk Level", "Recommendation"]
+        }
+        styles = self.styles
 
-            ws.cell(row=row, column=2, value=rec["category"])
-            ws.cell(row=row, column=3, value=rec["question"])
-            ws.cell(row=row, column=3).alignment = Alignment(wrap_text=True)
-            ws.cell(row=row, column=4, value=", ".join(rec["standard"]))
+        sheet.append(
+            *((header, styles.HEADER) for header in headers[lang]),
+            *((f"{category.name[lang]} (%)", styles.HEADER) for category in categories)
+        )
 
-            row += 1
+        for assessment in assessments:
+            app_info = assessment.get("app_info") or {}
+            app_name = app_info.get("name", "")
+            score_data = assessment["score"]
+            category_scores = score_data["category_scores"]
+
+            sheet.append(
+                (app_name, styles.CELL),
+                (app_info.get("environment", ""), styles.CELL),
+                (app_info.get("owner", ""), styles.CELL),
+                (score_data["percentage"], styles.CELL),
+                (score_data["risk_level"][lang], styles.risk_level(score_data["risk_level"])),
+                (score_data["audit_recommendation"][lang], styles.WRAPPED_CELL),
+                *((category_scores[category.id]["percentage"], styles.CELL) for category in categories)
+            )
+
+            for rec in assessment.get("recommendations", ()):
+                pending_recommendations.write(json.dumps(
+                    [app_name, rec["severity"], rec["category"], rec["question"], ", ".join(rec["standard"])],
+                    ensure_ascii=False
+                ) + "\n")
+
+    def _create_portfolio_recommendations_sheet(self, wb: Workbook, rows: Iterable[list], lang: str):
+        """Create portfolio recommendations sheet, all applications together"""
+        sheet = self._new_sheet(wb, "Recommendations" if lang == "en" else "Recommandations",
+                                {"A": 30, "B": 15, "C": 30, "D": 60, "E": 25}, freeze="A2")
 
-        ws.column_dimensions["A"].width = 15
-        ws.column_dimensions["B"].width = 30
-        ws.column_dimensions["C"].width = 60
-        ws.column_dimensions["D"].width = 25
+        headers = {
+            "fr": ["Application", "Sévérité", "Catégorie", "Question", "Standards"],
+            "en": ["Application", "Severity", "Category", "Question", "Standards"]
+        }
+        styles = self.styles
+
+        sheet.append(*((header, styles.HEADER) for header in headers[lang]))
+
+        for app_name, severity, category, question, standards in rows:
+            sheet.append(
+                (app_name, styles.CELL),
+                (severity.upper(), styles.severity(severity)),
+                (category, styles.CELL),
+                (question, styles.WRAPPED_CELL),
+                (standards, styles.CELL)
+            )
+
+
+def spool_workbook(wb: Workbook, max_memory: int = SPOOL_MAX_MEMORY) -> SpooledTemporaryFile:
+    """
+    Save a workbook into a spooled file rewound for reading
+
+    The zip is kept in memory up to max_memory bytes and rolls over to a
+    temporary file beyond that, so a large export never holds a second full
+    copy in memory while it is sent.
+
+    Args:
+        wb: Workbook to save
+        max_memory: Size in bytes above which the output goes to disk
+
+    Returns:
+        Spooled file positioned at 0; closing it discards the data
+    """
+    spool = SpooledTemporaryFile(max_size=max_memory)
+    wb.save(spool)
+    spool.seek(0)
+    return spool
+
+
+def workbook_bytes(wb: Workbook) -> bytes:
+    """
+    Serialize a workbook for APIs that only accept bytes
+
+    BytesIO.getvalue() hands over its internal buffer without copying when
+    nothing else references it, so the result is the only full copy.
+    """
+    output = io.BytesIO()
+    wb.save(output)
+    return output.getvalue()
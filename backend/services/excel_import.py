@@ -0,0 +1,168 @@
+import zipfile
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
+
+from .excel_export import INFO_LABELS, INFO_SHEET_TITLES, QUESTIONNAIRE_HEADERS, QUESTIONNAIRE_SHEET_TITLE
+
+# Template info keys that are named differently in app_info
+APP_INFO_KEYS = {"app_name": "name"}
+
+# Rows of the information sheet holding the application details
+INFO_ROWS = (3, 3 + len(INFO_LABELS["en"]) - 1)
+
+
+class QuestionnaireImportError(ValueError):
+    """Raised when a file is not a usable completed questionnaire"""
+
+
+def _normalize(text) -> str:
+    """Matching key of a cell: whitespace collapsed, case folded"""
+    return " ".join(str(text).split()).casefold()
+
+
+class ExcelImportService:
+    """
+    Read completed questionnaire templates back into responses
+
+    The questionnaire sheet is streamed with openpyxl's read-only mode, one
+    row at a time. Each row is matched to its question by text and the chosen
+    answer to an option value through a per-language index built once from
+    the bank, so a file is parsed without holding more than a row of cells.
+    """
+
+    def __init__(self, bank):
+        """
+        Args:
+            bank: QuestionBank the templates were generated from
+        """
+        self.bank = bank
+        self._indexes = {}
+
+    def answer_index(self, lang: str) -> Dict[str, Tuple[Tuple[str, Dict[str, int]], ...]]:
+        """
+        Question text to (question id, answer to option value) entries
+
+        Answers are matched on the option label or the option value itself.
+        Questions sharing a text get one entry each, in template order.
+        """
+        index = self._indexes.get(lang)
+        if index is None:
+            entries = {}
+            for _, question in self.bank.iter_questions():
+                answers = {}
+                for option in question.options:
+                    answers[_normalize(option.value)] = option.value
+                    answers[_normalize(option.label[lang])] = option.value
+                entries.setdefault(_normalize(question.text[lang]), []).append((question.id, answers))
+            index = self._indexes[lang] = {text: tuple(questions) for text, questions in entries.items()}
+        return index
+
+    def parse(self, source: Union[str, BinaryIO]) -> Dict:
+        """
+        Parse a completed questionnaire
+
+        Args:
+            source: Path or binary file object of the xlsx file
+
+        Returns:
+            Dictionary with lang, app_info, responses (question id to option
+            value) and issues (rows whose question or answer is not recognized)
+
+        Raises:
+            QuestionnaireImportError: Not an xlsx file or not a questionnaire template
+        """
+        try:
+            wb = load_workbook(source, read_only=True, data_only=True)
+        except (InvalidFileException, zipfile.BadZipFile, KeyError, OSError) as e:
+            raise QuestionnaireImportError(f"Not a readable xlsx file: {e}") from e
+
+        try:
+            if QUESTIONNAIRE_SHEET_TITLE not in wb.sheetnames:
+                raise QuestionnaireImportError(f"Missing '{QUESTIONNAIRE_SHEET_TITLE}' sheet")
+            rows = wb[QUESTIONNAIRE_SHEET_TITLE].iter_rows(max_col=4, values_only=True)
+
+            header = [cell for cell in next(rows, ())]
+            lang = next((code for code, headers in QUESTIONNAIRE_HEADERS.items() if header == headers), None)
+            if lang is None:
+                raise QuestionnaireImportError("Unrecognized questionnaire header row")
+
+            app_info = self._parse_info(wb, lang)
+            responses, issues = self._parse_answers(rows, lang)
+        finally:
+            # Read-only workbooks keep the file open until closed
+            wb.close()
+
+        return {"lang": lang, "app_info": app_info, "responses": responses, "issues": issues}
+
+    def _parse_info(self, wb, lang: str) -> Dict[str, str]:
+        title = INFO_SHEET_TITLES[lang]
+        if title not in wb.sheetnames:
+            return {}
+
+        keys = {label: key for key, label in INFO_LABELS[lang].items()}
+        app_info = {}
+        for label, value in wb[title].iter_rows(min_row=INFO_ROWS[0], max_row=INFO_ROWS[1],
+                                                max_col=2, values_only=True):
+            key = keys.get(label)
+            if key is not None and value not in (None, ""):
+                app_info[APP_INFO_KEYS.get(key, key)] = str(value).strip()
+        return app_info
+
+    def _parse_answers(self, rows, lang: str) -> Tuple[Dict[str, int], List[Dict]]:
+        index = self.answer_index(lang)
+        occurrences = {}
+        responses = {}
+        issues = []
+
+        for row_number, row in enumerate(rows, start=2):
+            if len(row) < 3 or row[1] in (None, ""):
+                continue  # Category headers and spacer rows
+
+            text = _normalize(row[1])
+            entries = index.get(text)
+            if entries is None:
+                issues.append({"row": row_number, "error": "Unknown question"})
+                continue
+
+            # Repeated question texts are matched in template order
+            occurrence = occurrences.get(text, 0)
+            occurrences[text] = occurrence + 1
+            question_id, answers = entries[min(occurrence, len(entries) - 1)]
+
+            answer = row[2]
+            if answer in (None, ""):
+                continue
+            value = answers.get(_normalize(answer))
+            if value is None:
+                issues.append({"row": row_number, "question_id": question_id,
+                               "answer": str(answer), "error": "Unrecognized answer"})
+                continue
+            responses[question_id] = value
+
+        return responses, issues
+
+
+def import_questionnaire(model, source: Union[str, BinaryIO], lang: Optional[str] = None,
+                         importer: Optional[ExcelImportService] = None) -> Dict:
+    """
+    Parse a completed questionnaire and score it
+
+    Args:
+        model: QuestionnaireModel to score with
+        source: Path or binary file object of the xlsx file
+        lang: Language of the recommendations, defaults to the file's
+        importer: Import service of model's bank, to reuse its answer indexes
+
+    Returns:
+        The parsed file (see ExcelImportService.parse) with score,
+        recommendations and contributions
+    """
+    importer = importer or ExcelImportService(model.bank)
+    parsed = importer.parse(source)
+    if not parsed["responses"]:
+        raise QuestionnaireImportError("No answered questions found")
+
+    evaluation = model.evaluate(parsed["responses"], lang or parsed["lang"])
+    return {**parsed, **evaluation}
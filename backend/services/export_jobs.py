@@ -0,0 +1,136 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional
+
+from services.excel_export import ENGINE_OPENPYXL, ExcelExportService, workbook_bytes
+
+
+class ExportQueueFull(Exception):
+    """Raised when too many export jobs are already waiting"""
+
+
+def render_template(bank, lang: str, app_name: Optional[str], engine: str = ENGINE_OPENPYXL) -> bytes:
+    """Build a blank questionnaire workbook; runs in a worker process"""
+    wb = ExcelExportService(bank).create_questionnaire_template(lang, app_name, engine=engine)
+    return workbook_bytes(wb)
+
+
+def render_results_report(bank, responses: Dict, score_data: Dict, recommendations: list,
+                          lang: str, app_info: Dict, engine: str = ENGINE_OPENPYXL) -> bytes:
+    """Build a results workbook; runs in a worker process"""
+    wb = ExcelExportService(bank).create_results_report(
+        responses, score_data, recommendations, lang, app_info, engine=engine
+    )
+    return workbook_bytes(wb)
+
+
+class ExportJob:
+    """One export request and, once finished, its file"""
+
+    def __init__(self, kind: str, filename: str, future):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.filename = filename
+        self.future = future
+        self.created_at = time.time()
+        self.finished_at = None
+
+    @property
+    def status(self) -> str:
+        if not self.future.done():
+            return "running" if self.future.running() else "queued"
+        # exception() raises CancelledError on a cancelled future
+        if self.future.cancelled():
+            return "cancelled"
+        return "failed" if self.future.exception() is not None else "done"
+
+    def to_dict(self) -> Dict:
+        data = {
+            "job_id": self.id,
+            "type": self.kind,
+            "status": self.status,
+            "filename": self.filename,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at
+        }
+        if data["status"] == "failed":
+            data["error"] = str(self.future.exception())
+        return data
+
+
+class ExportJobManager:
+    """
+    Runs Excel exports in a bounded process pool, off the request workers
+
+    At most max_pending jobs may be queued or running; submit() raises
+    ExportQueueFull beyond that so the API can answer 429. Finished jobs and
+    their files are kept for result_ttl seconds.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 16, result_ttl: float = 600):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Created on first use so importing the API does not fork workers
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def submit(self, kind: str, filename: str, render: Callable, *args) -> ExportJob:
+        """
+        Queue a render function (a module-level function returning bytes)
+
+        Raises:
+            ExportQueueFull: if max_pending jobs are already queued or running
+        """
+        with self._lock:
+            self._expire()
+            pending = sum(1 for job in self._jobs.values() if not job.future.done())
+            if pending >= self.max_pending:
+                raise ExportQueueFull(f"{pending} export jobs already pending")
+
+            try:
+                future = self._get_executor().submit(render, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM killed) and took the pool down with it;
+                # its jobs have failed already, later ones get a fresh pool
+                self._executor.shutdown(wait=False)
+                self._executor = None
+                future = self._get_executor().submit(render, *args)
+            job = ExportJob(kind, filename, future)
+            self._jobs[job.id] = job
+
+        future.add_done_callback(lambda _: self._mark_finished(job))
+        return job
+
+    def _mark_finished(self, job: ExportJob):
+        job.finished_at = time.time()
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        """Job by id, or None if unknown or expired"""
+        with self._lock:
+            self._expire()
+            return self._jobs.get(job_id)
+
+    def _expire(self):
+        """Drop finished jobs older than result_ttl; caller holds the lock"""
+        cutoff = time.time() - self.result_ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
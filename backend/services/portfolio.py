@@ -0,0 +1,63 @@
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Optional
+
+from services.excel_export import ENGINE_WRITE_ONLY, ExcelExportService
+
+# Assessments scored together by calculate_scores_batch
+SCORING_CHUNK = 256
+
+
+def score_assessments(model, assessments: Iterable[Dict], lang: str = "fr",
+                      chunk_size: int = SCORING_CHUNK) -> Iterator[Dict]:
+    """
+    Complete assessments with their score and recommendations
+
+    Assessments are read chunk_size at a time and the ones without a score
+    are scored together with calculate_scores_batch. Recommendations are
+    added, or rebuilt when the assessment carries a lang other than lang.
+
+    Args:
+        model: QuestionnaireModel to score with
+        assessments: Dicts with responses and app_info (score,
+            recommendations and lang are kept when present)
+        lang: Language of the recommendations
+
+    Yields:
+        The assessments, in input order, with score and recommendations
+    """
+    assessments = iter(assessments)
+    while True:
+        chunk = list(islice(assessments, chunk_size))
+        if not chunk:
+            return
+
+        unscored = [assessment for assessment in chunk if "score" not in assessment]
+        scores = model.calculate_scores_batch([assessment["responses"] for assessment in unscored])
+        for assessment, score_data in zip(unscored, scores):
+            assessment["score"] = score_data
+
+        for assessment in chunk:
+            if "recommendations" not in assessment or assessment.get("lang", lang) != lang:
+                assessment["recommendations"] = model.get_recommendations(assessment["responses"], lang)
+                assessment["lang"] = lang
+            yield assessment
+
+
+def render_portfolio_report(model, assessments: Iterable[Dict], lang: str = "fr",
+                            engine: str = ENGINE_WRITE_ONLY,
+                            excel_service: Optional[ExcelExportService] = None):
+    """
+    Portfolio workbook of many applications, scored on the fly
+
+    Args:
+        model: QuestionnaireModel to score with
+        assessments: Dicts with responses and app_info, consumed once
+        lang: Language code
+        engine: Rendering engine; write_only and native keep memory flat
+        excel_service: Export service of model's bank
+
+    Returns:
+        Workbook object
+    """
+    excel_service = excel_service or ExcelExportService(model.bank)
+    return excel_service.create_portfolio_report(score_assessments(model, assessments, lang), lang, engine=engine)
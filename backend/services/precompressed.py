@@ -0,0 +1,59 @@
+import gzip
+import hashlib
+import json
+from typing import Any
+
+from flask import Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+JSON_MIMETYPE = "application/json"
+
+
+class PrecompressedPayload:
+    """
+    A JSON response serialized and compressed once
+
+    Holds the body as identity, gzip and (when the brotli package is
+    installed) brotli bytes, each with its own strong ETag. Serving picks a
+    variant from Accept-Encoding and answers If-None-Match with 304, without
+    touching the original data again.
+    """
+
+    def __init__(self, data: Any):
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:32]
+
+        # Ordered by preference when the client accepts several
+        self.variants = {}
+        if brotli is not None:
+            self.variants["br"] = (brotli.compress(body, quality=11), f"{digest}-br")
+        self.variants["gzip"] = (gzip.compress(body, compresslevel=9, mtime=0), f"{digest}-gzip")
+        self.variants["identity"] = (body, digest)
+
+    def _select_encoding(self, request) -> str:
+        accept = request.accept_encodings
+        for encoding in self.variants:
+            if encoding != "identity" and accept[encoding] > 0:
+                return encoding
+        return "identity"
+
+    def make_response(self, request, max_age: int = 0) -> Response:
+        """Response for this request: the negotiated variant, or 304 if the client's copy is current"""
+        encoding = self._select_encoding(request)
+        body, etag = self.variants[encoding]
+
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype=JSON_MIMETYPE)
+            if encoding != "identity":
+                response.headers["Content-Encoding"] = encoding
+
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = f"public, max-age={max_age}, must-revalidate"
+        response.vary.add("Accept-Encoding")
+        return response
@@ -0,0 +1,213 @@
+import hashlib
+import io
+import os
+import re
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+from xml.sax.saxutils import escape
+
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+from . import excel_export
+
+# Templates rendered by another version of the export code must not be reused
+RENDERER_DIGEST = hashlib.sha256(Path(excel_export.__file__).read_bytes()).hexdigest()[:12]
+
+DEFAULT_CACHE_DIR = Path(tempfile.gettempdir()) / "assessment_templates"
+
+# The application name cell of the information sheet, left empty in a blank template
+INFO_SHEET_PART = "xl/worksheets/sheet1.xml"
+APP_NAME_CELL = re.compile(rb'<c r="B3"( s="\d+")?(?: t="n")? ?/>')
+
+
+def patch_app_name(template: bytes, app_name: str) -> Optional[bytes]:
+    """
+    Write the application name into a blank template
+
+    Only the information sheet is rewritten, with the inline string cell
+    openpyxl itself would produce; the other parts are copied over.
+
+    Returns:
+        Patched workbook bytes, or None if the template has to be rendered
+        instead (formulas, characters openpyxl rejects, unexpected layout)
+    """
+    if app_name.startswith("=") or ILLEGAL_CHARACTERS_RE.search(app_name):
+        return None
+
+    space = b' xml:space="preserve"' if app_name != app_name.strip() else b''
+    text = escape(app_name).encode('utf-8')
+    output = io.BytesIO()
+
+    with zipfile.ZipFile(io.BytesIO(template)) as source, \
+            zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            data = source.read(info)
+            if info.filename == INFO_SHEET_PART:
+                data, count = APP_NAME_CELL.subn(
+                    lambda match: (b'<c r="B3"' + (match.group(1) or b'') + b' t="inlineStr"><is><t'
+                                   + space + b'>' + text + b'</t></is></c>'),
+                    data,
+                    count=1
+                )
+                if not count:
+                    return None
+            target.writestr(info, data)
+
+    return output.getvalue()
+
+
+class TemplateCache:
+    """
+    Two-tier cache of rendered blank questionnaire templates
+
+    Templates are keyed by (bank version, language, date): the information
+    sheet embeds the current date, so entries roll over at midnight. Recent
+    templates are kept in an in-memory LRU; every rendered template is also
+    written to cache_dir under a name derived from the bank digest, the date
+    and the export code digest, so a restart does not have to render again.
+    Entries of other bank versions or days are dropped as soon as the key
+    moves on. An application name is patched into the cached template.
+    """
+
+    def __init__(self, max_entries: int = 8, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR):
+        """
+        Args:
+            max_entries: Templates kept in memory
+            cache_dir: Directory of the on-disk copies, None to keep them in memory only
+        """
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._entries = OrderedDict()
+        self._generation = None
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.renders = 0
+        self.patches = 0
+
+    def get(self, bank_version: str, lang: str, app_name: Optional[str],
+            render: Callable[[Optional[str]], bytes]) -> bytes:
+        """
+        Template bytes for a language and optional application name
+
+        Args:
+            bank_version: Version of the bank render() builds from
+            lang: Language code
+            app_name: Optional application name
+            render: Builds the workbook bytes for an application name (None for blank)
+
+        Returns:
+            xlsx file contents
+        """
+        template = self._blank(bank_version, lang, render)
+
+        if not app_name:
+            return template
+
+        patched = patch_app_name(template, app_name)
+        if patched is None:
+            return render(app_name)
+        self.patches += 1
+        return patched
+
+    def _blank(self, bank_version: str, lang: str, render: Callable[[Optional[str]], bytes]) -> bytes:
+        date = datetime.now().strftime("%Y%m%d")
+        key = (bank_version, lang, date)
+
+        with self._lock:
+            self._roll_over(bank_version, date)
+            template = self._entries.get(key)
+            if template is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return template
+
+        path = self._path(bank_version, lang, date)
+        template = self._read(path)
+        if template is not None:
+            self.disk_hits += 1
+        else:
+            template = render(None)
+            self.renders += 1
+            self._write(path, template)
+
+        with self._lock:
+            self._entries[key] = template
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return template
+
+    def _roll_over(self, bank_version: str, date: str):
+        """Forget other bank versions and days; caller holds the lock"""
+        generation = (bank_version, date)
+        if generation == self._generation:
+            return
+        self._generation = generation
+        self._entries.clear()
+
+        if self.cache_dir is None or not self.cache_dir.is_dir():
+            return
+        prefix = f"{date}-{bank_version}-"
+        for path in self.cache_dir.glob("*.xlsx"):
+            if not path.name.startswith(prefix):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _path(self, bank_version: str, lang: str, date: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{date}-{bank_version}-{lang}-{RENDERER_DIGEST}.xlsx"
+
+    @staticmethod
+    def _read(path: Optional[Path]) -> Optional[bytes]:
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _write(path: Optional[Path], template: bytes):
+        """Atomically publish a template; a read-only cache_dir just disables the disk tier"""
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(template)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    def clear(self):
+        """Drop the in-memory entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = len(self._entries)
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "renders": self.renders,
+            "patches": self.patches
+        }
@@ -0,0 +1,359 @@
+"""
+Minimal streaming XLSX writer
+
+Covers what the exports need (shared strings, numbers, named and cell
+styles, merges, column widths, row heights, freeze panes) and nothing else.
+Rows are turned into XML text and deflated straight into the zip as they are
+appended, so no cell objects are ever built. Styles are resolved through
+openpyxl once per distinct style, not per cell, and written as its styles.xml.
+"""
+import shutil
+import zipfile
+from tempfile import SpooledTemporaryFile
+from typing import Callable, Dict, List, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles.stylesheet import write_stylesheet
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+from openpyxl.writer.theme import theme_xml
+from openpyxl.xml.functions import tostring
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+SPOOL_MAX_MEMORY = 4 * 1024 * 1024
+FLUSH_SIZE = 64 * 1024
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/theme/theme1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.theme+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    '{sheets}'
+    '</Types>'
+)
+SHEET_CONTENT_TYPE = (
+    '<Override PartName="/xl/worksheets/sheet{0}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{PACKAGE_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+
+def _text(value: str) -> str:
+    """<t> element for a string, keeping significant whitespace"""
+    value = ILLEGAL_CHARACTERS_RE.sub("", value)
+    if value != value.strip():
+        return f'<t xml:space="preserve">{escape(value)}</t>'
+    return f'<t>{escape(value)}</t>'
+
+
+class SharedStrings:
+    """
+    Shared strings table, XML-escaped once per string
+
+    A table built from the question bank can be reused by every export in
+    that language: each workbook layers its own strings on top of it with
+    extend(), leaving the base untouched.
+    """
+
+    def __init__(self, strings=(), base: Optional["SharedStrings"] = None):
+        self._base = base
+        self._offset = len(base) if base is not None else 0
+        self._index: Dict[str, int] = {}
+        self._items: List[str] = []
+        for value in strings:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return self._offset + len(self._items)
+
+    def add(self, value: str) -> int:
+        """Index of a string, adding it if needed"""
+        if self._base is not None:
+            index = self._base._index.get(value)
+            if index is not None:
+                return index
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = self._offset + len(self._items)
+            self._items.append(f"<si>{_text(value)}</si>")
+        return index
+
+    def extend(self) -> "SharedStrings":
+        """Table for one workbook, on top of this one"""
+        return SharedStrings(base=self)
+
+    def _xml_items(self) -> List[str]:
+        items = self._base._xml_items() if self._base is not None else []
+        return items + self._items
+
+    def to_xml(self) -> str:
+        items = self._xml_items()
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<sst xmlns="{MAIN_NS}" uniqueCount="{len(items)}">{"".join(items)}</sst>'
+        )
+
+
+class _StyleTable:
+    """Maps export styles to cell format ids, through a scratch openpyxl workbook"""
+
+    def __init__(self, register_styles: Optional[Callable[[Workbook], None]] = None):
+        self._wb = Workbook(write_only=True)
+        if register_styles is not None:
+            register_styles(self._wb)
+        self._ws = self._wb.create_sheet()
+        self._ids = {}
+
+    def xf(self, style) -> int:
+        """Format id of a named style or a mapping of cell style attributes"""
+        key = style if isinstance(style, str) else tuple(style.items())
+        xf = self._ids.get(key)
+        if xf is None:
+            cell = WriteOnlyCell(self._ws)
+            if isinstance(style, str):
+                cell.style = style
+            else:
+                for attribute, value in style.items():
+                    setattr(cell, attribute, value)
+            xf = self._ids[key] = cell.style_id
+        return xf
+
+    def to_xml(self) -> bytes:
+        return tostring(write_stylesheet(self._wb))
+
+
+class XlsxWorksheet:
+    """
+    One sheet being streamed into the workbook
+
+    Same row interface as the exporters' openpyxl sheet writer: cells are
+    values or (value, style) pairs, widths and freeze panes are fixed when
+    the sheet is created, merges are written when it is closed.
+    """
+
+    def __init__(self, workbook: "XlsxWorkbook", part: str, widths: Dict[str, float],
+                 freeze: Optional[str]):
+        self._workbook = workbook
+        self._strings = workbook.shared_strings
+        self._styles = workbook._styles
+        self._stream = workbook._zip.open(part, "w", force_zip64=True)
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._merges: List[str] = []
+        self._columns: List[str] = []
+        self.row = 0
+
+        header = [f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                  f'<worksheet xmlns="{MAIN_NS}" xmlns:r="{REL_NS}">']
+        header.append(f'<sheetViews><sheetView workbookViewId="0">{self._pane(freeze)}</sheetView></sheetViews>')
+        header.append('<sheetFormatPr defaultRowHeight="15"/>')
+        if widths:
+            header.append("<cols>")
+            for column, width in widths.items():
+                index = column_index_from_string(column)
+                header.append(f'<col min="{index}" max="{index}" width="{width}" customWidth="1"/>')
+            header.append("</cols>")
+        header.append("<sheetData>")
+        self._write("".join(header))
+
+    @staticmethod
+    def _pane(freeze: Optional[str]) -> str:
+        if not freeze:
+            return ""
+        column, row = coordinate_from_string(freeze)
+        x_split = column_index_from_string(column) - 1
+        y_split = row - 1
+        if not x_split and not y_split:
+            return ""
+        if x_split and y_split:
+            active = "bottomRight"
+        elif y_split:
+            active = "bottomLeft"
+        else:
+            active = "topRight"
+        splits = (f' xSplit="{x_split}"' if x_split else "") + (f' ySplit="{y_split}"' if y_split else "")
+        return (f'<pane{splits} topLeftCell="{freeze}" activePane="{active}" state="frozen"/>'
+                f'<selection pane="{active}" activeCell="{freeze}" sqref="{freeze}"/>')
+
+    def _column(self, index: int) -> str:
+        while len(self._columns) <= index:
+            self._columns.append(get_column_letter(len(self._columns) + 1))
+        return self._columns[index]
+
+    def append(self, *cells, height: Optional[float] = None) -> int:
+        """Write the next row and return its index"""
+        self.row += 1
+        row = self.row
+        parts = [f'<row r="{row}" ht="{height}" customHeight="1">' if height is not None else f'<row r="{row}">']
+
+        for column, cell in enumerate(cells):
+            value, style = cell if isinstance(cell, tuple) else (cell, None)
+            ref = f"{self._column(column)}{row}"
+            xf = f' s="{self._styles.xf(style)}"' if style else ""
+
+            if value is None or value == "":
+                if xf:
+                    parts.append(f'<c r="{ref}"{xf}/>')
+            elif isinstance(value, str):
+                parts.append(f'<c r="{ref}"{xf} t="s"><v>{self._strings.add(value)}</v></c>')
+            elif isinstance(value, bool):
+                parts.append(f'<c r="{ref}"{xf} t="b"><v>{int(value)}</v></c>')
+            elif isinstance(value, (int, float)):
+                parts.append(f'<c r="{ref}"{xf}><v>{value!r}</v></c>')
+            else:
+                parts.append(f'<c r="{ref}"{xf} t="s"><v>{self._strings.add(str(value))}</v></c>')
+
+        parts.append("</row>")
+        self._write("".join(parts))
+        return row
+
+    def skip(self, count: int = 1):
+        """Leave blank rows"""
+        self.row += count
+
+    def merge(self, cell_range: str):
+        self._merges.append(cell_range)
+
+    def _write(self, text: str):
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= FLUSH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        self._stream.write("".join(self._buffer).encode("utf-8"))
+        self._buffer = []
+        self._buffered = 0
+
+    def close(self):
+        tail = ["</sheetData>"]
+        if self._merges:
+            tail.append(f'<mergeCells count="{len(self._merges)}">')
+            tail.extend(f'<mergeCell ref="{cell_range}"/>' for cell_range in self._merges)
+            tail.append("</mergeCells>")
+        tail.append('<pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5" footer="0.5"/>')
+        tail.append("</worksheet>")
+        self._write("".join(tail))
+        self._flush()
+        self._stream.close()
+
+
+class XlsxWorkbook:
+    """
+    Workbook written directly as XLSX parts
+
+    Sheets are streamed one at a time into a zip spooled in memory (and to
+    disk past spool_max_memory); creating a sheet closes the previous one.
+    Like openpyxl's write-only workbooks it can be saved once.
+    """
+
+    def __init__(self, shared_strings: Optional[SharedStrings] = None,
+                 register_styles: Optional[Callable[[Workbook], None]] = None,
+                 spool_max_memory: int = SPOOL_MAX_MEMORY):
+        """
+        Args:
+            shared_strings: Precomputed strings table to build on
+            register_styles: Adds the named styles cells refer to
+            spool_max_memory: Size above which the zip is spooled to disk
+        """
+        self.shared_strings = shared_strings.extend() if shared_strings is not None else SharedStrings()
+        self._styles = _StyleTable(register_styles)
+        self._spool = SpooledTemporaryFile(max_size=spool_max_memory)
+        self._zip = zipfile.ZipFile(self._spool, "w", zipfile.ZIP_DEFLATED)
+        self._sheets: List[tuple] = []
+        self._current: Optional[XlsxWorksheet] = None
+        self._saved = False
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return [title for title, _ in self._sheets]
+
+    def create_sheet(self, title: str, widths: Dict[str, float], freeze: Optional[str] = None,
+                     index: Optional[int] = None) -> XlsxWorksheet:
+        """Start a new sheet at the end, or at index in the sheet order"""
+        if self._saved:
+            raise RuntimeError("Workbook has already been saved")
+        if self._current is not None:
+            self._current.close()
+
+        number = len(self._sheets) + 1
+        entry = (title, number)
+        if index is None:
+            self._sheets.append(entry)
+        else:
+            self._sheets.insert(index, entry)
+
+        self._current = XlsxWorksheet(self, f"xl/worksheets/sheet{number}.xml", widths, freeze)
+        return self._current
+
+    def save(self, target):
+        """Finish the package and copy it to a path or binary file object"""
+        if self._saved:
+            raise RuntimeError("Workbook has already been saved")
+        self._saved = True
+
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+
+        sheets = "".join(
+            f'<sheet name={quoteattr(title)} sheetId="{number}" r:id="rId{number}"/>'
+            for title, number in self._sheets
+        )
+        sheet_rels = "".join(
+            f'<Relationship Id="rId{number}" Type="{REL_NS}/worksheet" Target="worksheets/sheet{number}.xml"/>'
+            for _, number in self._sheets
+        )
+        extra = len(self._sheets)
+
+        parts = (
+            ("[Content_Types].xml", CONTENT_TYPES.format(
+                sheets="".join(SHEET_CONTENT_TYPE.format(number) for _, number in self._sheets))),
+            ("_rels/.rels", ROOT_RELS),
+            ("xl/workbook.xml",
+             '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+             f'<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}">'
+             f'<bookViews><workbookView activeTab="0"/></bookViews><sheets>{sheets}</sheets></workbook>'),
+            ("xl/_rels/workbook.xml.rels",
+             '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+             f'<Relationships xmlns="{PACKAGE_REL_NS}">{sheet_rels}'
+             f'<Relationship Id="rId{extra + 1}" Type="{REL_NS}/styles" Target="styles.xml"/>'
+             f'<Relationship Id="rId{extra + 2}" Type="{REL_NS}/theme" Target="theme/theme1.xml"/>'
+             f'<Relationship Id="rId{extra + 3}" Type="{REL_NS}/sharedStrings" Target="sharedStrings.xml"/>'
+             '</Relationships>'),
+            ("xl/styles.xml", self._styles.to_xml()),
+            ("xl/theme/theme1.xml", theme_xml),
+            ("xl/sharedStrings.xml", self.shared_strings.to_xml()),
+        )
+        for name, data in parts:
+            self._zip.writestr(name, data)
+        self._zip.close()
+
+        self._spool.seek(0)
+        try:
+            if hasattr(target, "write"):
+                shutil.copyfileobj(self._spool, target)
+            else:
+                with open(target, "wb") as f:
+                    shutil.copyfileobj(self._spool, f)
+        finally:
+            self._spool.close()
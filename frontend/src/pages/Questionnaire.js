@@ -1,6 +1,19 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useTranslation } from 'react-i18next';
-import { getQuestions, submitQuestionnaire } from '../utils/api';
+import {
+  getQuestions,
+  submitQuestionnaire,
+  createDraft,
+  getDraft,
+  updateDraft,
+  deleteDraft
+} from '../utils/api';
+import { IncrementalScorer } from '../utils/scoring';
+
+// Draft token of the questionnaire in progress, kept across reloads
+const DRAFT_STORAGE_KEY = 'securityQuestionnaireDraft';
+// Changes made within this delay are sent in one request
+const DRAFT_SAVE_DELAY = 1000;
 
 function Questionnaire({ onSubmit, onBack }) {
   const { t, i18n } = useTranslation();
@@ -16,15 +29,93 @@ function Questionnaire({ onSubmit, onBack }) {
   });
   const [currentCategoryIndex, setCurrentCategoryIndex] = useState(0);
   const [error, setError] = useState(null);
+  const scorerRef = useRef(null);
+  const draftRef = useRef({
+    id: null,
+    resumed: false,
+    changes: { responses: {}, app_info: {} },
+    timer: null,
+    saving: Promise.resolve()
+  });
 
   useEffect(() => {
     loadQuestions();
   }, [i18n.language]);
 
+  // Send pending changes when leaving the page
+  useEffect(() => () => {
+    clearTimeout(draftRef.current.timer);
+    flushDraft();
+  }, []);
+
+  const resumeDraft = async () => {
+    draftRef.current.resumed = true;
+    const draftId = localStorage.getItem(DRAFT_STORAGE_KEY);
+    if (!draftId) return null;
+
+    try {
+      const draft = await getDraft(draftId);
+      draftRef.current.id = draftId;
+      setResponses(draft.responses);
+      setAppInfo(prev => ({ ...prev, ...draft.app_info }));
+      return draft;
+    } catch (err) {
+      // Purged or unknown draft: the next change starts a new one
+      localStorage.removeItem(DRAFT_STORAGE_KEY);
+      return null;
+    }
+  };
+
+  const queueDraftChange = (section, key, value) => {
+    const draft = draftRef.current;
+    draft.changes[section][key] = value;
+    clearTimeout(draft.timer);
+    draft.timer = setTimeout(flushDraft, DRAFT_SAVE_DELAY);
+  };
+
+  const flushDraft = () => {
+    const draft = draftRef.current;
+    const changes = draft.changes;
+    if (!Object.keys(changes.responses).length && !Object.keys(changes.app_info).length) {
+      return draft.saving;
+    }
+    draft.changes = { responses: {}, app_info: {} };
+
+    // Saves run one after the other, so the draft is created only once
+    draft.saving = draft.saving.then(async () => {
+      try {
+        if (draft.id) {
+          await updateDraft(draft.id, { ...changes, lang: i18n.language });
+        } else {
+          const created = await createDraft({ ...changes, lang: i18n.language });
+          draft.id = created.draft_id;
+          localStorage.setItem(DRAFT_STORAGE_KEY, created.draft_id);
+        }
+      } catch (err) {
+        console.error('Error saving draft:', err);
+      }
+    });
+    return draft.saving;
+  };
+
+  const discardDraft = async () => {
+    const draft = draftRef.current;
+    clearTimeout(draft.timer);
+    draft.changes = { responses: {}, app_info: {} };
+    await draft.saving;
+    localStorage.removeItem(DRAFT_STORAGE_KEY);
+    if (draft.id) {
+      deleteDraft(draft.id).catch(err => console.error('Error deleting draft:', err));
+      draft.id = null;
+    }
+  };
+
   const loadQuestions = async () => {
     try {
       setLoading(true);
+      const draft = draftRef.current.resumed ? null : await resumeDraft();
       const data = await getQuestions(i18n.language);
+      scorerRef.current = new IncrementalScorer(data, draft ? draft.responses : responses);
       setQuestionsData(data);
       setLoading(false);
     } catch (err) {
@@ -35,10 +126,14 @@ function Questionnaire({ onSubmit, onBack }) {
   };
 
   const handleResponseChange = (questionId, value) => {
+    if (scorerRef.current) {
+      scorerRef.current.setAnswer(questionId, value);
+    }
     setResponses(prev => ({
       ...prev,
       [questionId]: value
     }));
+    queueDraftChange('responses', questionId, value);
   };
 
   const handleAppInfoChange = (field, value) => {
@@ -46,24 +141,14 @@ function Questionnaire({ onSubmit, onBack }) {
       ...prev,
       [field]: value
     }));
+    queueDraftChange('app_info', field, value);
   };
 
   const calculateProgress = () => {
-    if (!questionsData) return 0;
-
-    let totalQuestions = 0;
-    let answeredQuestions = 0;
+    const scorer = scorerRef.current;
+    if (!scorer) return 0;
 
-    questionsData.categories.forEach(category => {
-      category.questions.forEach(question => {
-        totalQuestions++;
-        if (responses[question.id] !== undefined) {
-          answeredQuestions++;
-        }
-      });
-    });
-
-    return totalQuestions > 0 ? (answeredQuestions / totalQuestions) * 100 : 0;
+    return scorer.totalQuestions > 0 ? (scorer.answeredCount / scorer.totalQuestions) * 100 : 0;
   };
 
   const isCurrentCategoryComplete = () => {
@@ -100,6 +185,7 @@ function Questionnaire({ onSubmit, onBack }) {
         lang: i18n.language
       });
       setLoading(false);
+      await discardDraft();
       onSubmit(result);
     } catch (err) {
       console.error('Error submitting questionnaire:', err);
@@ -132,6 +218,7 @@ function Questionnaire({ onSubmit, onBack }) {
 
   const currentCategory = questionsData.categories[currentCategoryIndex];
   const progress = calculateProgress();
+  const scorer = scorerRef.current;
   const isLastCategory = currentCategoryIndex === questionsData.categories.length - 1;
 
   return (
@@ -151,6 +238,15 @@ function Questionnaire({ onSubmit, onBack }) {
           </div>
           <span className="progress-text">{Math.round(progress)}%</span>
         </div>
+
+        {scorer && scorer.answeredCount > 0 && (
+          <div className="live-score">
+            {t('questionnaire.liveScore')}: <strong>{Math.round(scorer.percentage)}%</strong>
+            <span className="live-score-badge" style={{ background: scorer.riskLevel.color }}>
+              {scorer.riskLevel[i18n.language]}
+            </span>
+          </div>
+        )}
       </div>
 
       <div className="app-info-section">
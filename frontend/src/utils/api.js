@@ -51,6 +51,25 @@ export const downloadResults = async (data, lang = 'fr') => {
   link.remove();
 };
 
+export const createDraft = async (data) => {
+  const response = await api.post('/drafts', data);
+  return response.data;
+};
+
+export const getDraft = async (draftId) => {
+  const response = await api.get(`/drafts/${draftId}`);
+  return response.data;
+};
+
+export const updateDraft = async (draftId, changes) => {
+  const response = await api.patch(`/drafts/${draftId}`, changes);
+  return response.data;
+};
+
+export const deleteDraft = async (draftId) => {
+  await api.delete(`/drafts/${draftId}`);
+};
+
 export const getStats = async () => {
   const response = await api.get('/stats');
   return response.data;
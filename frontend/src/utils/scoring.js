@@ -0,0 +1,71 @@
+// Client-side running score, mirroring IncrementalScorer in backend/models/questionnaire.py.
+// Used for live feedback only: the authoritative score comes from /api/submit.
+
+const RISK_LEVELS = [
+  { level: 'LOW', fr: 'Risque Faible', en: 'Low Risk', color: '#10b981' },
+  { level: 'MEDIUM', fr: 'Risque Modéré', en: 'Medium Risk', color: '#f59e0b' },
+  { level: 'HIGH', fr: 'Risque Élevé', en: 'High Risk', color: '#ef4444' },
+  { level: 'CRITICAL', fr: 'Risque Critique', en: 'Critical Risk', color: '#dc2626' }
+];
+
+const riskLevelIndex = (percentage) => {
+  if (percentage >= 80) return 0;
+  if (percentage >= 60) return 1;
+  if (percentage >= 40) return 2;
+  return 3;
+};
+
+export class IncrementalScorer {
+  constructor(questionsData, responses = {}) {
+    this.slots = {};
+    this.weights = [];
+    this.values = [];
+    this.totalMaxScore = 0;
+
+    questionsData.categories.forEach(category => {
+      category.questions.forEach(question => {
+        const maxValue = Math.max(...question.options.map(opt => opt.value));
+        this.slots[question.id] = this.weights.length;
+        this.weights.push(question.weight);
+        this.values.push(undefined);
+        this.totalMaxScore += maxValue * question.weight;
+      });
+    });
+
+    this.totalScore = 0;
+    this.answeredCount = 0;
+
+    Object.entries(responses).forEach(([questionId, value]) => this.setAnswer(questionId, value));
+  }
+
+  setAnswer(questionId, value) {
+    const slot = this.slots[questionId];
+    if (slot === undefined) return;
+
+    const previous = this.values[slot];
+    if (previous === undefined) this.answeredCount++;
+    this.values[slot] = value;
+    this.totalScore += (value - (previous || 0)) * this.weights[slot];
+  }
+
+  clearAnswer(questionId) {
+    const slot = this.slots[questionId];
+    if (slot === undefined || this.values[slot] === undefined) return;
+
+    this.totalScore -= this.values[slot] * this.weights[slot];
+    this.values[slot] = undefined;
+    this.answeredCount--;
+  }
+
+  get totalQuestions() {
+    return this.weights.length;
+  }
+
+  get percentage() {
+    return this.totalMaxScore > 0 ? (this.totalScore / this.totalMaxScore) * 100 : 0;
+  }
+
+  get riskLevel() {
+    return RISK_LEVELS[riskLevelIndex(this.percentage)];
+  }
+}
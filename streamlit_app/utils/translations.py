@@ -34,10 +34,12 @@ translations = {
         "quest_description": "Description",
         "quest_description_placeholder": "Brève description de l'application",
         "quest_progress": "Progression",
+        "quest_live_score": "Score provisoire",
         "quest_category": "Catégorie",
         "quest_question": "Question",
         "quest_select": "Sélectionnez une réponse",
         "quest_submit": "Soumettre l'évaluation",
+        "quest_save_category": "Enregistrer les réponses",
         "quest_required": "Veuillez répondre à toutes les questions avant de soumettre",
         "quest_standards": "Standards",
 
@@ -98,10 +100,12 @@ translations = {
         "quest_description": "Description",
         "quest_description_placeholder": "Brief application description",
         "quest_progress": "Progress",
+        "quest_live_score": "Running score",
         "quest_category": "Category",
         "quest_question": "Question",
         "quest_select": "Select an answer",
         "quest_submit": "Submit Assessment",
+        "quest_save_category": "Save answers",
         "quest_required": "Please answer all questions before submitting",
         "quest_standards": "Standards",
 
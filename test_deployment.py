@@ -96,6 +96,46 @@ def test_questionnaire():
         traceback.print_exc()
         return False
 
+def test_batch_scoring():
+    """Test batch scoring matches single scoring, fractional weights included"""
+    print("\nTesting batch scoring...")
+
+    try:
+        import json
+        import tempfile
+        from streamlit_app.utils.questionnaire import QuestionnaireModel
+
+        with open('streamlit_app/data/questions.json', 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['categories'][0]['questions'][0]['weight'] = 2.5
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_path = Path(tmp_dir) / 'questions.json'
+            data_path.write_text(json.dumps(data), encoding='utf-8')
+            model = QuestionnaireModel(data_path=data_path)
+
+        questions = [question for _, question in model.bank.iter_questions()]
+        responses_list = [
+            {question.id: question.options[-1].value for question in questions},
+            {question.id: question.options[0].value for question in questions[::2]},
+            {questions[0].id: float(questions[0].options[1].value), questions[1].id: questions[1].options[1].value},
+            {},
+        ]
+
+        batch_scores = model.calculate_scores_batch(responses_list)
+        for responses, batch_score in zip(responses_list, batch_scores):
+            # json.dumps tells 50 from 50.0 apart
+            if json.dumps(batch_score) != json.dumps(model.calculate_score(responses)):
+                print(f"  ✗ Batch score differs: {batch_score['total_score']!r}")
+                return False
+
+        print(f"  ✓ Batch scores match single scores ({len(responses_list)} assessments)")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        return False
+
 def test_translations():
     """Test translation system"""
     print("\nTesting translations...")
@@ -171,6 +211,7 @@ def main():
         ("File Structure", test_file_structure),
         ("Imports", test_imports),
         ("Questionnaire", test_questionnaire),
+        ("Batch Scoring", test_batch_scoring),
         ("Translations", test_translations),
         ("Requirements", test_requirements),
         ("App Syntax", test_app_syntax),